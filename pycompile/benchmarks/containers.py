@@ -0,0 +1,93 @@
+"""
+Micro-benchmarks of the Stack and Queue used by the parser and the code generator:
+filling and draining them at growing depths, and parsing expressions nested deeper and deeper.
+The time per operation (and per level of nesting) should stay flat as the depth grows
+"""
+import argparse
+from time import perf_counter
+from typing import Callable
+
+from pycompile.utils.queue import Queue
+from pycompile.utils.stack import Stack
+from pycompile.parser.parser import Parser
+from pycompile.parser.strategy.helper import Table
+from pycompile.parser.strategy.table import TableParser
+
+
+def best_of(repeat: int, run: Callable[[], None]) -> float:
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def fill_and_drain_stack(depth: int):
+    stack = Stack()
+    for i in range(depth):
+        stack.push(i)
+    while not stack.is_empty():
+        stack.pop()
+
+
+def fill_and_drain_queue(depth: int):
+    queue = Queue()
+    for i in range(depth):
+        queue.add(i)
+    while not queue.is_empty():
+        queue.remove()
+
+
+def nested_expression(depth: int) -> str:
+    return 'main {\n  var {\n    integer x;\n  }\n  x = ' + '(' * depth + '1' + ')' * depth + ';\n}\n'
+
+
+def parse_nested(code: str, table: Table) -> bool:
+    # a parser keeps its stacks and tokens, every parse needs a new one
+    parser = TableParser(code, table)
+    parser.parse()
+    return parser.success
+
+
+def run_containers(repeat: int = 5, min_depth: int = 1000, max_depth: int = 256000):
+    print(f'Timing a push and a pop per item (best of {repeat})...')
+    depth = min_depth
+    while depth <= max_depth:
+        stack = best_of(repeat, lambda: fill_and_drain_stack(depth))
+        queue = best_of(repeat, lambda: fill_and_drain_queue(depth))
+        print(
+            f'   {depth:8} items   Stack: {stack * 1000000000 / depth:7.1f} ns/item   '
+            f'Queue: {queue * 1000000000 / depth:7.1f} ns/item'
+        )
+        depth *= 4
+
+
+def run_nesting(repeat: int = 3, min_depth: int = 100, max_depth: int = 6400) -> bool:
+    print(f'Timing the parse of nested expressions (best of {repeat})...')
+    table = Parser('Table').parser.table
+    success = True
+    depth = min_depth
+    while depth <= max_depth:
+        code = nested_expression(depth)
+        success = success and parse_nested(code, table)
+        elapsed = best_of(repeat, lambda: parse_nested(code, table))
+        print(f'   {depth:8} levels   {elapsed * 1000000 / depth:7.2f} us/level')
+        depth *= 4
+    return success
+
+
+def main(repeat: int = 5, max_depth: int = 256000, max_nesting: int = 6400):
+    run_containers(repeat, max_depth=max_depth)
+    if not run_nesting(repeat, max_depth=max_nesting):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=5)
+    ap.add_argument('--max_depth', '-md', type=int, default=256000, help='Largest number of items in the containers')
+    ap.add_argument('--max_nesting', '-mn', type=int, default=6400, help='Deepest nesting of the parsed expressions')
+    args = ap.parse_args()
+    main(args.repeat, args.max_depth, args.max_nesting)
@@ -0,0 +1,22 @@
+from pathlib import Path
+from typing import Dict, Union
+from os.path import dirname, join as path_join, realpath
+
+
+def default_corpus_dir() -> str:
+    return path_join(dirname(dirname(realpath(__file__))), 'compiler_tests')
+
+
+def load_corpus(corpus_dir: Union[str, Path] = None) -> Dict[str, str]:
+    corpus_dir = corpus_dir if corpus_dir is not None else default_corpus_dir()
+    corpus = {}
+    for src_file in sorted(Path(corpus_dir).iterdir()):
+        if src_file.suffix == '.src':
+            with open(str(src_file), 'r') as f:
+                corpus[src_file.stem] = f.read()
+    return corpus
+
+
+def concatenate(corpus: Dict[str, str], copies: int = 1) -> str:
+    # not a valid program, but every token in it is realistic
+    return '\n'.join(list(corpus.values()) * copies)
@@ -0,0 +1,89 @@
+"""
+Times the table parser on heavily corrupted copies of the corpus, where most of the time goes to
+panic-mode recovery: tokens are dropped, repeated or swapped for random ones at growing rates
+"""
+import random
+import argparse
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from pycompile.lex.analyzer import LexicalAnalyzer
+from pycompile.parser.parser import Parser
+from pycompile.parser.strategy.helper import Table
+from pycompile.parser.strategy.table import TableParser
+from pycompile.benchmarks.corpus import load_corpus
+
+RATES = [0.01, 0.05, 0.2, 0.5]
+
+
+def corrupt(code: str, rate: float, rng: random.Random) -> str:
+    analyzer = LexicalAnalyzer()
+    analyzer.tokenize(code)
+    analyzer.remove_comments()
+    lexemes = [token.lexeme for token in analyzer.tokens]
+    corrupted = []
+    for lexeme in lexemes:
+        if rng.random() >= rate:
+            corrupted.append(lexeme)
+            continue
+        mutation = rng.randrange(3)
+        if mutation == 1:
+            corrupted += [lexeme, lexeme]
+        elif mutation == 2:
+            corrupted.append(rng.choice(lexemes))
+        # otherwise the lexeme is dropped
+    return ' '.join(corrupted)
+
+
+def corrupt_corpus(corpus: Dict[str, str], rate: float, seed: int) -> Dict[str, str]:
+    rng = random.Random(seed)
+    return {name: corrupt(code, rate, rng) for name, code in corpus.items()}
+
+
+def parse_all(corpus: Dict[str, str], table: Table) -> Tuple[int, int, int]:
+    num_tokens, num_errors, num_aborted = 0, 0, 0
+    for code in corpus.values():
+        # a parser keeps its stacks and tokens, every parse needs a new one
+        parser = TableParser(code, table)
+        try:
+            parser.parse()
+        except Exception:
+            # the ast can not always be built from what is left after recovery, the compiler stops there too
+            num_aborted += 1
+        num_tokens += len(parser.analyzer)
+        num_errors += len(parser.errors)
+    return num_tokens, num_errors, num_aborted
+
+
+def time_parse(corpus: Dict[str, str], table: Table, repeat: int) -> Tuple[float, int, int, int]:
+    best, counts = None, (0, 0, 0)
+    for _ in range(repeat):
+        start = perf_counter()
+        counts = parse_all(corpus, table)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return (best,) + counts
+
+
+def main(corpus_dir: str = None, repeat: int = 5, seed: int = 0, rates: List[float] = None):
+    rates = rates if rates is not None else RATES
+    corpus = load_corpus(corpus_dir)
+    table = Parser('Table').parser.table
+    print(f'Timing the parse of corrupted sources (best of {repeat})...')
+    for rate in [0.0] + rates:
+        corrupted = corpus if rate == 0.0 else corrupt_corpus(corpus, rate, seed)
+        elapsed, num_tokens, num_errors, num_aborted = time_parse(corrupted, table, repeat)
+        print(
+            f'   {rate * 100:5.1f}% corrupted   {num_errors:6} errors   {num_aborted:3}/{len(corrupted)} aborted   '
+            f'{elapsed * 1000:8.2f} ms   {elapsed * 1000000 / num_tokens:6.2f} us/token'
+        )
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--corpus_dir', '-cd', help='Directory to look for .src files in', default=None)
+    ap.add_argument('--repeat', '-r', type=int, default=5)
+    ap.add_argument('--seed', '-s', type=int, default=0, help='Seed of the random corruption')
+    ap.add_argument('--rates', '-ra', type=float, nargs='+', default=None, help='Fractions of the tokens corrupted')
+    args = ap.parse_args()
+    main(args.corpus_dir, args.repeat, args.seed, args.rates)
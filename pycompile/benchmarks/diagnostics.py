@@ -0,0 +1,84 @@
+"""
+Times whole compiles of programs with more and more semantic errors and warnings, found out of the order of their lines,
+so the time per diagnostic shows what reporting them costs on top of finding them
+"""
+import io
+import os
+import gc
+import argparse
+import contextlib
+from time import perf_counter
+from typing import List
+from tempfile import TemporaryDirectory
+
+from pycompile.compiler import PyCompiler
+from pycompile.symbol.record import SemanticRecord
+
+
+def function_lines(idx: int) -> List[str]:
+    # the local shadows the next function, which is warned about once the tables are built
+    return [
+        f'func f{idx}(integer a) : integer {{',
+        '    var {',
+        f'        integer f{idx + 1};',
+        '    }',
+        '    return (a);',
+        '}',
+    ]
+
+
+def erroneous_program(num_errors: int) -> str:
+    lines = []
+    for idx in range(num_errors):
+        lines += function_lines(idx)
+    lines += ['func f{}(integer a) : integer {{ return (a); }}'.format(num_errors)]
+    lines += ['main {', '    var {', '        integer x;', '    }']
+    for idx in range(num_errors):
+        # every undeclared variable also fails the typing of the assignment
+        lines.append(f'    x = u{idx} + 1;')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def time_compile(source: str, output_dir: str, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        compiler = PyCompiler(output_location=output_dir)
+        # every record ever created is kept in the list, the ones of earlier runs would slow down the gc
+        SemanticRecord.RECORD_LIST.clear()
+        gc.collect()
+        output = io.StringIO()
+        start = perf_counter()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            compiler.compile(source)
+        elapsed = perf_counter() - start
+        if 'Undeclared variable' not in output.getvalue():
+            raise RuntimeError('The generated program does not report its errors')
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(repeat: int = 3, max_errors: int = 3200):
+    print(f'Timing the compile of programs with semantic errors (best of {repeat})...')
+    num_errors = 200
+    while num_errors <= max_errors:
+        with TemporaryDirectory() as output_dir:
+            source = os.path.join(output_dir, 'errors.src')
+            with open(source, 'w') as f:
+                f.write(erroneous_program(num_errors))
+            elapsed = time_compile(source, output_dir, repeat)
+        # a shadowed name, an undeclared variable and the two operators of the assignment left untyped for each
+        num_diagnostics = num_errors * 4
+        print(
+            f'   {num_diagnostics:6} diagnostics   compile {elapsed * 1000:9.1f} ms, '
+            f'{elapsed / num_diagnostics * 1e6:7.1f} us per diagnostic'
+        )
+        num_errors *= 2
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=3)
+    ap.add_argument('--max_errors', '-me', type=int, default=3200, help='Undeclared variables in the largest program')
+    args = ap.parse_args()
+    main(args.repeat, args.max_errors)
@@ -0,0 +1,117 @@
+"""
+Times the end of the symbol table pass, where the classes get the members of their parents, on generated hierarchies:
+a deep chain, a wide one under a single root and stacked diamonds, where the ways up to the root double at every level
+"""
+import gc
+import argparse
+from typing import Callable, Dict, List
+
+from pycompile.parser.parser import Parser
+from pycompile.parser.strategy.helper import Table
+from pycompile.symbol.error import SemanticError
+from pycompile.symbol.passes import PassManager
+from pycompile.symbol.record import SemanticRecord
+from pycompile.symbol.visitor import SemanticTableBuilder
+from pycompile.benchmarks.trees import build
+
+
+def class_lines(idx: int, parents: List[int]) -> List[str]:
+    # every class shadows the member of its parents and overrides their function
+    inherits = f' inherits {", ".join([f"C{parent}" for parent in parents])}' if len(parents) > 0 else ''
+    return [
+        f'class C{idx}{inherits} {{',
+        f'    public integer v{idx};',
+        '    public integer shared;',
+        '    public func run() : integer;',
+        '};',
+    ]
+
+
+def function_lines(idx: int) -> List[str]:
+    return [
+        f'func C{idx}::run() : integer {{',
+        '    var {',
+        '        integer t;',
+        '    }',
+        '    return (1);',
+        '}',
+    ]
+
+
+def hierarchy_program(parents: List[List[int]]) -> str:
+    lines = []
+    for idx, class_parents in enumerate(parents):
+        lines += class_lines(idx, class_parents)
+    for idx in range(len(parents)):
+        lines += function_lines(idx)
+    lines += ['main {', '    var {', f'        C{len(parents) - 1} last;', '    }', '}']
+    return '\n'.join(lines) + '\n'
+
+
+def chain(num_classes: int) -> List[List[int]]:
+    return [[]] + [[idx - 1] for idx in range(1, num_classes)]
+
+
+def wide(num_classes: int) -> List[List[int]]:
+    return [[]] + [[0] for _ in range(1, num_classes)]
+
+
+def diamonds(num_classes: int) -> List[List[int]]:
+    # two sides over one base, then a class joining them that is the base of the next diamond
+    parents = [[]]
+    while len(parents) + 3 <= num_classes:
+        base = len(parents) - 1
+        parents += [[base], [base], [base + 1, base + 2]]
+    return parents
+
+
+SHAPES: Dict[str, Callable[[int], List[List[int]]]] = {
+    'chain': chain,
+    'wide': wide,
+    'diamonds': diamonds,
+}
+
+
+def time_finish(code: str, table: Table, repeat: int) -> float:
+    """
+    Best time of the finish of the symbol table builder, where the inheritance is resolved
+    """
+    best = None
+    for _ in range(repeat):
+        ast = build(code, table)
+        # every record ever created is kept in the list, the ones of earlier runs would slow down the gc
+        SemanticRecord.RECORD_LIST.clear()
+        gc.collect()
+        passes = PassManager(ast)
+        builder = SemanticTableBuilder()
+        passes.run(builder)
+        errors = [str(error) for error in builder.errors if isinstance(error, SemanticError)]
+        if len(errors) > 0:
+            raise RuntimeError(f'The generated hierarchy has errors: {errors[:3]}')
+        elapsed = passes.timings['SemanticTableBuilder.finish']
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(repeat: int = 3, max_classes: int = 400, shapes: List[str] = None):
+    table = Parser('Table').parser.table
+    print(f'Timing the inheritance of generated class hierarchies (best of {repeat})...')
+    for shape in (shapes if shapes is not None else list(SHAPES.keys())):
+        num_classes = 25
+        while num_classes <= max_classes:
+            parents = SHAPES[shape](num_classes)
+            elapsed = time_finish(hierarchy_program(parents), table, repeat)
+            print(
+                f'   {shape:<9} {len(parents):6} classes   symbol table finish {elapsed * 1000:9.1f} ms, '
+                f'{elapsed / len(parents) * 1e6:8.1f} us per class'
+            )
+            num_classes *= 2
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=3)
+    ap.add_argument('--max_classes', '-mc', type=int, default=400, help='Classes in the largest hierarchy')
+    ap.add_argument('--shapes', '-s', nargs='+', choices=list(SHAPES.keys()), help='Hierarchies to time, all by default')
+    args = ap.parse_args()
+    main(args.repeat, args.max_classes, args.shapes)
@@ -0,0 +1,85 @@
+"""
+Measures the memory taken by the tokens of growing copies of the corpus:
+bytes per token allocated by tokenize, and the peak RSS of a fresh process
+that either tokenizes the whole file or streams its tokens
+"""
+import os
+import sys
+import argparse
+import resource
+import subprocess
+import tracemalloc
+from tempfile import NamedTemporaryFile
+
+from pycompile.lex.analyzer import LexicalAnalyzer
+from pycompile.benchmarks.corpus import load_corpus, concatenate
+
+MODES = ['tokenize', 'stream']
+
+
+def bytes_per_token(code: str, scanner: str = 'Precedence') -> float:
+    analyzer = LexicalAnalyzer(scanner)
+    tracemalloc.start()
+    analyzer.tokenize(code)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained / len(analyzer)
+
+
+def peak_rss(src_file: str, mode: str) -> int:
+    # run in a new process so the peak is not the one of an earlier, bigger run
+    output = subprocess.run(
+        [sys.executable, '-m', 'pycompile.benchmarks.memory', '--child', mode, src_file],
+        capture_output=True, text=True, check=True
+    ).stdout
+    return int(output.split()[-1])
+
+
+def child(mode: str, src_file: str):
+    analyzer = LexicalAnalyzer()
+    with open(src_file, 'r') as f:
+        if mode == 'tokenize':
+            analyzer.tokenize(f.read())
+        else:
+            for _ in analyzer.iter_tokens(f):
+                pass
+    print(high_water_mark())
+
+
+def high_water_mark() -> int:
+    # ru_maxrss carries over the peak of the parent through exec on linux, VmHWM does not
+    if os.path.exists('/proc/self/status'):
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1])
+    # in kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(corpus_dir: str = None, max_copies: int = 64):
+    corpus = load_corpus(corpus_dir)
+    print('Measuring memory used by tokens...')
+    copies = 1
+    while copies <= max_copies:
+        code = concatenate(corpus, copies)
+        with NamedTemporaryFile('w', suffix='.src', delete=False) as f:
+            f.write(code)
+        try:
+            rss = '   '.join([f'{mode}: {peak_rss(f.name, mode) / 1024:8.1f} MB' for mode in MODES])
+        finally:
+            os.remove(f.name)
+        print(f'   {len(code.splitlines()):8} lines   {bytes_per_token(code):7.1f} bytes/token   peak RSS {rss}')
+        copies *= 4
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--corpus_dir', '-cd', help='Directory to look for .src files in', default=None)
+    ap.add_argument('--max_copies', '-mc', type=int, default=64, help='Largest number of copies measured')
+    ap.add_argument('--child', nargs=2, metavar=('MODE', 'SRC_FILE'), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child is not None:
+        child(*args.child)
+    else:
+        main(args.corpus_dir, args.max_copies)
@@ -0,0 +1,77 @@
+"""
+Times the passes after the parse on programs with more and more overloaded functions, every one of them called.
+The walk of the type checker is also timed on its own, the calls are resolved in it,
+so the time per call shows how the cost of resolving a call grows with the number of functions in the table
+"""
+import gc
+import argparse
+from time import perf_counter
+from typing import Tuple
+
+from pycompile.parser.parser import Parser
+from pycompile.parser.strategy.helper import Table
+from pycompile.symbol.record import SemanticRecord
+from pycompile.benchmarks.trees import build
+from pycompile.benchmarks.passes import run_passes
+
+OVERLOADS = [
+    ('integer a', 'x'),
+    ('float a, integer b', 'y, x'),
+    ('integer a[3]', 'arr'),
+]
+
+
+def overloaded_program(num_functions: int) -> str:
+    lines = []
+    for i in range(num_functions):
+        for params, _ in OVERLOADS:
+            lines.append(f'func f{i}({params}) : integer {{ return (1); }}')
+    lines += ['main {', '    var {', '        integer x;', '        float y;', '        integer arr[3];', '    }']
+    for i in range(num_functions):
+        for _, args in OVERLOADS:
+            lines.append(f'    x = f{i}({args});')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def time_program(code: str, table: Table, repeat: int) -> Tuple[float, float]:
+    """
+    Best time of all the passes, and best time of the walk of the type checker, where the calls are resolved
+    """
+    best, best_checking = None, None
+    for _ in range(repeat):
+        ast = build(code, table)
+        # every record ever created is kept in the list, the ones of earlier runs would slow down the gc
+        SemanticRecord.RECORD_LIST.clear()
+        gc.collect()
+        start = perf_counter()
+        passes, result = run_passes(ast)
+        elapsed = perf_counter() - start
+        if result[0] != 'Code':
+            raise RuntimeError(f'The generated program does not compile: {result}')
+        checking = passes.timings['TypeChecker']
+        best = elapsed if best is None else min(best, elapsed)
+        best_checking = checking if best_checking is None else min(best_checking, checking)
+    return best, best_checking
+
+
+def main(repeat: int = 3, max_functions: int = 800):
+    table = Parser('Table').parser.table
+    print(f'Timing the passes of programs with overloaded functions (best of {repeat})...')
+    num_functions = 50
+    while num_functions <= max_functions:
+        elapsed, checking = time_program(overloaded_program(num_functions), table, repeat)
+        num_calls = num_functions * len(OVERLOADS)
+        print(
+            f'   {num_calls:6} functions and calls   all passes {elapsed * 1000:9.1f} ms   '
+            f'type checking {checking * 1000:8.1f} ms, {checking / num_calls * 1e6:6.1f} us per call'
+        )
+        num_functions *= 2
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=3)
+    ap.add_argument('--max_functions', '-mf', type=int, default=800, help='Overloaded names in the largest program')
+    args = ap.parse_args()
+    main(args.repeat, args.max_functions)
@@ -0,0 +1,84 @@
+"""
+Runs the passes of the compiler after the parse on growing programs and times the walk and the finish of each,
+so the time per statement shows which pass grows the most with the program
+"""
+import gc
+import argparse
+from time import perf_counter
+from typing import Tuple
+
+from pycompile.parser.parser import Parser
+from pycompile.parser.strategy.helper import Table
+from pycompile.parser.syntax.ast import AbstractSyntaxNode
+from pycompile.symbol.error import SemanticError
+from pycompile.symbol.passes import PassManager
+from pycompile.symbol.record import SemanticRecord
+from pycompile.symbol.visitor import SemanticTableBuilder, TypeChecker
+from pycompile.codegenr.allocator import MemoryAllocator
+from pycompile.codegenr.generator import CodeGenerator
+from pycompile.benchmarks.trees import build, large_program
+
+
+def run_passes(ast: AbstractSyntaxNode) -> Tuple[PassManager, Tuple]:
+    """
+    Same steps as PyCompiler.compile, stopping at the first one that fails
+    """
+    passes = PassManager(ast)
+    builder = SemanticTableBuilder()
+    try:
+        passes.run(builder)
+        if any([isinstance(error, SemanticError) for error in builder.errors]):
+            return passes, ('SymbolTableCreator', [str(error) for error in builder.errors])
+        type_checker = TypeChecker(builder.global_table, builder.errors)
+        passes.run(type_checker)
+        if any([isinstance(error, SemanticError) for error in type_checker.errors]):
+            return passes, ('TypeChecker', [str(error) for error in type_checker.errors])
+        mem_allocator = MemoryAllocator(type_checker.global_table)
+        passes.run(mem_allocator)
+        code_generator = CodeGenerator(mem_allocator.global_table)
+        passes.run(code_generator)
+    except Exception as e:
+        return passes, ('Exception', repr(e))
+    return passes, ('Code', code_generator.code_stream + code_generator.data_stream, [str(e) for e in builder.errors])
+
+
+def time_passes(code: str, table: Table, repeat: int) -> Tuple[float, PassManager]:
+    best = None
+    for _ in range(repeat):
+        ast = build(code, table)
+        # every record ever created is kept in the list, the ones of earlier runs would slow down the gc
+        SemanticRecord.RECORD_LIST.clear()
+        gc.collect()
+        start = perf_counter()
+        passes, result = run_passes(ast)
+        elapsed = perf_counter() - start
+        if result[0] != 'Code':
+            raise RuntimeError(f'The generated program does not compile: {result[:2]}')
+        if best is None or elapsed < best[0]:
+            best = elapsed, passes
+    return best
+
+
+def main(repeat: int = 5, max_statements: int = 4000, verbose: bool = False):
+    table = Parser('Table').parser.table
+    print(f'Timing the passes of growing programs (best of {repeat})...')
+    num_statements = 250
+    while num_statements <= max_statements:
+        elapsed, passes = time_passes(large_program(num_statements), table, repeat)
+        print(
+            f'   {num_statements:6} statements   {passes.num_walks} walks   total {elapsed * 1000:8.1f} ms, '
+            f'{elapsed / num_statements * 1e6:7.1f} us per statement'
+        )
+        if verbose:
+            for name, t in passes.timings.items():
+                print(f'      {name:<36} {t * 1000:8.2f} ms')
+        num_statements *= 4
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=5)
+    ap.add_argument('--max_statements', '-ms', type=int, default=4000, help='Statements in the largest program')
+    ap.add_argument('--verbose', '-v', action='store_true', help='Print the time of every walk and finish')
+    args = ap.parse_args()
+    main(args.repeat, args.max_statements, args.verbose)
@@ -0,0 +1,71 @@
+"""
+Stress test for the recovery from invalid lexemes: tokenizes adversarial inputs of growing size
+with every scanner and reports the time per character, which should stay flat as the input grows
+"""
+import argparse
+from os.path import dirname, join as path_join, realpath
+from typing import Callable, Dict
+
+from pycompile.benchmarks.scanning import SCANNERS, token_stream, time_scanner
+
+
+def ghibberish(size: int) -> str:
+    lex_tests = path_join(dirname(dirname(realpath(__file__))), 'lex', 'tests')
+    with open(path_join(lex_tests, 'ghibberish.src'), 'r') as f:
+        code = f.read()
+    return (code * (size // len(code) + 1))[:size]
+
+
+ADVERSARIAL: Dict[str, Callable[[int], str]] = {
+    # one invalid lexeme as long as the input
+    'symbols': lambda size: '@' * size,
+    # invalid lexemes with nothing valid after them, used to scan to the end of the code for each one
+    'spaced': lambda size: '@ ' * (size // 2),
+    'lines': lambda size: '@\n' * (size // 2),
+    # invalid lexemes cut short by a valid token
+    'alternating': lambda size: '@a' * (size // 2),
+    'quotes': lambda size: '"@ ' * (size // 3),
+    'ghibberish': ghibberish,
+}
+
+
+def check_equivalence(name: str, code: str) -> bool:
+    expected = token_stream(code, SCANNERS[0])
+    for scanner in SCANNERS[1:]:
+        if token_stream(code, scanner) != expected:
+            print(f'   {name}: {scanner} scanner differs from {SCANNERS[0]} scanner')
+            return False
+    return True
+
+
+def run_stress(repeat: int = 3, min_size: int = 1000, max_size: int = 64000) -> bool:
+    print('Checking token stream equivalence...')
+    equivalent = all([check_equivalence(name, generate(min_size)) for name, generate in ADVERSARIAL.items()])
+    print(f'   {len(ADVERSARIAL)} inputs, equivalent: {equivalent}')
+    print(f'Timing tokenization of adversarial inputs (best of {repeat})...')
+    for name, generate in ADVERSARIAL.items():
+        print(f'   {name}')
+        size = min_size
+        while size <= max_size:
+            code = generate(size)
+            timings = [
+                f'{scanner}: {time_scanner(code, scanner, repeat) * 1000000 / len(code):7.2f} us/char'
+                for scanner in SCANNERS
+            ]
+            print(f'      {len(code):8} chars   ' + '   '.join(timings))
+            size *= 4
+    return equivalent
+
+
+def main(repeat: int = 3, min_size: int = 1000, max_size: int = 64000):
+    if not run_stress(repeat, min_size, max_size):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=3)
+    ap.add_argument('--min_size', '-mi', type=int, default=1000, help='Number of characters of the smallest input')
+    ap.add_argument('--max_size', '-ma', type=int, default=64000, help='Number of characters of the largest input')
+    args = ap.parse_args()
+    main(args.repeat, args.min_size, args.max_size)
@@ -0,0 +1,90 @@
+"""
+Compares the precedence scanner with the single pass scanner:
+both have to produce the same tokens, names, positions and tokenized output for every file of the corpus.
+Also times tokenization of growing copies of the corpus, the time per line should stay flat
+"""
+import argparse
+from time import perf_counter
+from typing import List, Tuple
+
+from pycompile.lex.analyzer import LexicalAnalyzer
+from pycompile.benchmarks.corpus import load_corpus, concatenate
+
+SCANNERS = ['Precedence', 'SinglePass']
+
+
+def token_stream(code: str, scanner: str) -> Tuple[List[tuple], str]:
+    analyzer = LexicalAnalyzer(scanner)
+    tokenized = []
+    analyzer.tokenize(code, tokenized)
+    return [
+        (tok.__class__.__name__, tok.name, tok.lexeme, tok.position, tok.column, tok.start, tok.end)
+        for tok in analyzer.tokens
+    ], ''.join(tokenized)
+
+
+def check_equivalence(name: str, code: str) -> bool:
+    expected = token_stream(code, SCANNERS[0])
+    for scanner in SCANNERS[1:]:
+        if token_stream(code, scanner) != expected:
+            print(f'   {name}: {scanner} scanner differs from {SCANNERS[0]} scanner')
+            return False
+    return True
+
+
+def time_scanner(code: str, scanner: str, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        analyzer = LexicalAnalyzer(scanner)
+        start = perf_counter()
+        analyzer.tokenize(code)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_benchmark(corpus_dir: str = None, repeat: int = 5, copies: int = 1) -> bool:
+    corpus = load_corpus(corpus_dir)
+    print('Checking token stream equivalence...')
+    equivalent = all([check_equivalence(name, code) for name, code in corpus.items()])
+    print(f'   {len(corpus)} files, equivalent: {equivalent}')
+
+    code = concatenate(corpus, copies)
+    print(f'Timing tokenization of {len(code.splitlines())} lines (best of {repeat})...')
+    timings = {scanner: time_scanner(code, scanner, repeat) for scanner in SCANNERS}
+    for scanner, elapsed in timings.items():
+        print(f'   {scanner:<12} {elapsed * 1000:10.2f} ms')
+    print(f'   speedup: {timings[SCANNERS[0]] / timings[SCANNERS[-1]]:.2f}x')
+    return equivalent
+
+
+def run_scaling(corpus_dir: str = None, repeat: int = 3, max_copies: int = 16):
+    corpus = load_corpus(corpus_dir)
+    print(f'Timing tokenization of growing sources (best of {repeat})...')
+    copies = 1
+    while copies <= max_copies:
+        code = concatenate(corpus, copies)
+        num_lines = len(code.splitlines())
+        timings = [
+            f'{scanner}: {time_scanner(code, scanner, repeat) * 1000000 / num_lines:7.2f} us/line'
+            for scanner in SCANNERS
+        ]
+        print(f'   {num_lines:8} lines   ' + '   '.join(timings))
+        copies *= 2
+
+
+def main(corpus_dir: str = None, repeat: int = 5, copies: int = 1, max_copies: int = 0):
+    if not run_benchmark(corpus_dir, repeat, copies):
+        raise SystemExit(1)
+    if max_copies > 0:
+        run_scaling(corpus_dir, repeat, max_copies)
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--corpus_dir', '-cd', help='Directory to look for .src files in', default=None)
+    ap.add_argument('--repeat', '-r', type=int, default=5)
+    ap.add_argument('--copies', '-c', type=int, default=1, help='Number of times the corpus is repeated when timing')
+    ap.add_argument('--max_copies', '-mc', type=int, default=0, help='Largest number of copies timed for scaling')
+    args = ap.parse_args()
+    main(args.corpus_dir, args.repeat, args.copies, args.max_copies)
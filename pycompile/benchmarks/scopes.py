@@ -0,0 +1,84 @@
+"""
+Times the type checker on programs with more and more statements in member functions, every statement reading the data
+members of the class and calling a free function, so the time per statement shows how resolving a name grows with
+the statements and functions checked before it
+"""
+import gc
+import argparse
+from typing import List
+
+from pycompile.parser.parser import Parser
+from pycompile.parser.strategy.helper import Table
+from pycompile.symbol.record import SemanticRecord
+from pycompile.benchmarks.trees import build
+from pycompile.benchmarks.passes import run_passes
+
+
+def class_lines(idx: int) -> List[str]:
+    return [
+        f'class C{idx} {{',
+        '    public integer a;',
+        '    public integer b;',
+        '    public func run() : integer;',
+        '};',
+    ]
+
+
+def member_function_lines(idx: int, num_statements: int) -> List[str]:
+    lines = [f'func C{idx}::run() : integer {{']
+    for _ in range(num_statements):
+        lines.append('    a = step(a + b);')
+    lines += ['    return (a);', '}']
+    return lines
+
+
+def scoped_program(num_classes: int, num_statements: int) -> str:
+    lines = []
+    for idx in range(num_classes):
+        lines += class_lines(idx)
+    lines += ['func step(integer x) : integer {', '    return (x + 1);', '}']
+    for idx in range(num_classes):
+        lines += member_function_lines(idx, num_statements)
+    lines += ['main {', '    var {', '        C0 c;', '        integer x;', '    }', '    x = c.run();', '}']
+    return '\n'.join(lines) + '\n'
+
+
+def time_checking(code: str, table: Table, repeat: int) -> float:
+    """
+    Best time of the walk of the type checker, where the names are resolved
+    """
+    best = None
+    for _ in range(repeat):
+        ast = build(code, table)
+        # every record ever created is kept in the list, the ones of earlier runs would slow down the gc
+        SemanticRecord.RECORD_LIST.clear()
+        gc.collect()
+        passes, result = run_passes(ast)
+        if result[0] != 'Code':
+            raise RuntimeError(f'The generated program does not compile: {result[:2]}')
+        checking = passes.timings['TypeChecker']
+        best = checking if best is None else min(best, checking)
+    return best
+
+
+def main(repeat: int = 3, num_classes: int = 10, max_statements: int = 800):
+    table = Parser('Table').parser.table
+    print(f'Timing the type checker on member functions of {num_classes} classes (best of {repeat})...')
+    num_statements = 50
+    while num_statements <= max_statements:
+        checking = time_checking(scoped_program(num_classes, num_statements), table, repeat)
+        total = num_classes * num_statements
+        print(
+            f'   {total:6} statements in member functions   type checking {checking * 1000:9.1f} ms, '
+            f'{checking / total * 1e6:7.1f} us per statement'
+        )
+        num_statements *= 2
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=3)
+    ap.add_argument('--num_classes', '-nc', type=int, default=10, help='Classes with a member function')
+    ap.add_argument('--max_statements', '-ms', type=int, default=800, help='Statements in the largest member functions')
+    args = ap.parse_args()
+    main(args.repeat, args.num_classes, args.max_statements)
@@ -0,0 +1,75 @@
+"""
+Measures the cold start of the compiler with python -X importtime:
+the cumulative import time of the entry modules, the heaviest imports under them,
+and whether any of the optional heavy dependencies got imported without being needed
+"""
+import sys
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+ENTRY_MODULES = ['pycompile.lex.analyzer', 'pycompile.parser.parser', 'pycompile.compiler']
+# only needed to render the ast or to load the ucalgary html tables
+HEAVY_MODULES = ['graphviz', 'pandas', 'lxml']
+
+
+def import_times(statement: str) -> List[Tuple[str, int, int, bool]]:
+    """
+    Runs the statement in a fresh interpreter, gives (module, self us, cumulative us, top level) for every import
+    """
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True, text=True, check=True
+    ).stderr
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        # nested imports are indented by two more spaces than their parent
+        top_level = not module.startswith('   ')
+        times.append((module.strip(), int(self_us), int(cumulative_us), top_level))
+    return times
+
+
+def measure(statement: str, repeat: int) -> Tuple[int, Dict[str, int], List[str]]:
+    best_total, best_times = None, None
+    for _ in range(repeat):
+        times = import_times(statement)
+        total = sum([cumulative for _, _, cumulative, top_level in times if top_level])
+        if best_total is None or total < best_total:
+            best_total, best_times = total, times
+    self_times = {module: self_us for module, self_us, _, _ in best_times}
+    heavy = sorted(set(
+        module.split('.')[0] for module in self_times.keys() if module.split('.')[0] in HEAVY_MODULES
+    ))
+    return best_total, self_times, heavy
+
+
+def main(repeat: int = 5, top: int = 10, construct: bool = True) -> bool:
+    lean = True
+    statements = {module: f'import {module}' for module in ENTRY_MODULES}
+    if construct:
+        statements['PyCompiler()'] = 'from pycompile.compiler import PyCompiler; PyCompiler()'
+    print(f'Measuring cold start imports (best of {repeat})...')
+    # what the interpreter imports on its own is not part of the compiler startup
+    baseline, _, _ = measure('pass', repeat)
+    for name, statement in statements.items():
+        total, self_times, heavy = measure(statement, repeat)
+        total -= baseline
+        lean = lean and len(heavy) == 0
+        print(f'   {name:<26} {total / 1000:8.1f} ms   heavy imports: {", ".join(heavy) if heavy else "none"}')
+    print(f'Heaviest imports of {list(statements.keys())[-1]} (self time)...')
+    for module, self_us in sorted(self_times.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f'   {module:<40} {self_us / 1000:8.1f} ms')
+    return lean
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=5)
+    ap.add_argument('--top', '-t', type=int, default=10, help='Number of heaviest imports listed')
+    ap.add_argument('--no_construct', '-nc', action='store_true', help='Only import, do not build a PyCompiler')
+    args = ap.parse_args()
+    if not main(args.repeat, args.top, not args.no_construct):
+        raise SystemExit(1)
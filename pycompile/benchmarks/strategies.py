@@ -0,0 +1,99 @@
+"""
+Compares the table driven parser with the recursive descent parser generated from the same table:
+both have to build the same ast and report the same errors for every source file in the package.
+Also times the parse of the corpus with each of them
+"""
+import argparse
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from pycompile.parser.parser import Parser
+from pycompile.parser.strategy.helper import Table
+from pycompile.parser.strategy.table import TableParser
+from pycompile.parser.strategy.generated import GeneratedParser
+from pycompile.parser.strategy.strategy import ParsingStrategy
+from pycompile.parser.syntax.collector import Collector
+from pycompile.benchmarks.corpus import load_corpus
+
+STRATEGIES = ['Table', 'Generated']
+
+
+def create(strategy: str, table: Table) -> ParsingStrategy:
+    # a parser keeps its stacks and tokens, every parse needs a new one
+    if strategy == 'Generated':
+        return GeneratedParser.create(None, table)
+    return TableParser(None, table)
+
+
+def parse_result(code: str, strategy: str, table: Table) -> Tuple:
+    parser = create(strategy, table)
+    try:
+        parser.parse(code)
+    except Exception as e:
+        return repr(e), [error.message for error in parser.errors]
+    tree = None
+    if parser.ast is not None:
+        collector = Collector()
+        collector.collect(parser.ast)
+        tree = collector.create_array_repr()
+    return parser.success, tree, [error.message for error in parser.errors]
+
+
+def check_equivalence(name: str, code: str, table: Table) -> bool:
+    expected = parse_result(code, STRATEGIES[0], table)
+    for strategy in STRATEGIES[1:]:
+        if parse_result(code, strategy, table) != expected:
+            print(f'   {name}: {strategy} parser differs from {STRATEGIES[0]} parser')
+            return False
+    return True
+
+
+def time_strategy(corpus: List[str], strategy: str, table: Table, repeat: int) -> Tuple[float, int]:
+    best, num_tokens = None, 0
+    for _ in range(repeat):
+        num_tokens = 0
+        start = perf_counter()
+        for code in corpus:
+            parser = create(strategy, table)
+            parser.parse(code)
+            num_tokens += len(parser.analyzer)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, num_tokens
+
+
+def all_sources() -> Dict[str, str]:
+    sources = {}
+    for src_file in sorted(Path(__file__).parent.parent.glob('**/*.src')):
+        with open(str(src_file), 'r') as f:
+            sources[src_file.as_posix()] = f.read()
+    return sources
+
+
+def main(corpus_dir: str = None, repeat: int = 5, copies: int = 5):
+    table = Parser('Table').parser.table
+    sources = all_sources()
+    print('Checking ast and error equivalence...')
+    equivalent = all([check_equivalence(name, code, table) for name, code in sources.items()])
+    print(f'   {len(sources)} files, equivalent: {equivalent}')
+
+    corpus = list(load_corpus(corpus_dir).values()) * copies
+    print(f'Timing the parse of {len(corpus)} files (best of {repeat})...')
+    timings = {}
+    for strategy in STRATEGIES:
+        elapsed, num_tokens = time_strategy(corpus, strategy, table, repeat)
+        timings[strategy] = elapsed
+        print(f'   {strategy:<10} {elapsed * 1000:10.2f} ms   {num_tokens / elapsed / 1000:8.1f} k tokens/s')
+    print(f'   speedup: {timings[STRATEGIES[0]] / timings[STRATEGIES[-1]]:.2f}x')
+    if not equivalent:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--corpus_dir', '-cd', help='Directory to look for .src files in', default=None)
+    ap.add_argument('--repeat', '-r', type=int, default=5)
+    ap.add_argument('--copies', '-c', type=int, default=5, help='Number of times every file of the corpus is parsed')
+    args = ap.parse_args()
+    main(args.corpus_dir, args.repeat, args.copies)
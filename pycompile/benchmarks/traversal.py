@@ -0,0 +1,125 @@
+"""
+Compares the recursive AbstractSyntaxNode.accept with the walk Parser.traverse uses:
+both have to make the same visits in the same order on every ast of the package,
+then both are timed on wide trees and on expressions nested deeper and deeper
+"""
+import argparse
+import sys
+from time import perf_counter
+from typing import Callable, List, Tuple, Union
+
+from pycompile.parser.parser import Parser
+from pycompile.parser.strategy.helper import Table
+from pycompile.parser.syntax.ast import AbstractSyntaxNode
+from pycompile.symbol.visitor import Visitor
+from pycompile.stats import NodeCounter
+from pycompile.benchmarks.trees import PASSES, build, large_program
+from pycompile.benchmarks.containers import nested_expression
+from pycompile.benchmarks.strategies import all_sources
+from pycompile.parser.strategy.table import TableParser
+
+
+class VisitRecorder(Visitor):
+
+    def __init__(self):
+        super().__init__()
+        self.visits: List[Tuple] = []
+
+    def pre_visit(self, node: AbstractSyntaxNode):
+        self.visits.append(('pre', node.unique_id))
+
+    def mid_visit(self, child_idx: int, node: AbstractSyntaxNode):
+        self.visits.append(('mid', child_idx, node.unique_id))
+
+    def visit(self, node: AbstractSyntaxNode):
+        self.visits.append(('post', node.unique_id))
+
+
+def accept(ast: AbstractSyntaxNode, visitor: Visitor):
+    ast.accept(visitor)
+
+
+def walk(ast: AbstractSyntaxNode, visitor: Visitor):
+    ast.walk(visitor)
+
+
+TRAVERSALS = {'accept': accept, 'walk': walk}
+
+
+def check_order(table: Table) -> bool:
+    same = True
+    for name, code in all_sources().items():
+        parser = TableParser(code, table)
+        try:
+            parser.parse()
+        except Exception:
+            # sources the table parser can not handle have no tree to walk
+            continue
+        if parser.ast is None:
+            continue
+        visits = []
+        for traverse in TRAVERSALS.values():
+            recorder = VisitRecorder()
+            traverse(parser.ast, recorder)
+            visits.append(recorder.visits)
+        if visits[0] != visits[1]:
+            print(f'   {name}: the visits of walk differ from the ones of accept')
+            same = False
+    return same
+
+
+def time_traversal(ast: AbstractSyntaxNode, traverse: Callable, repeat: int) -> Union[float, None]:
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        try:
+            for _ in range(PASSES):
+                traverse(ast, NodeCounter())
+        except RecursionError:
+            return None
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def report(label: str, ast: AbstractSyntaxNode, repeat: int):
+    counter = NodeCounter()
+    ast.walk(counter)
+    timings = []
+    for name, traverse in TRAVERSALS.items():
+        elapsed = time_traversal(ast, traverse, repeat)
+        if elapsed is None:
+            timings.append(f'{name}: {"RecursionError":>18}')
+        else:
+            timings.append(f'{name}: {counter.num_nodes * PASSES / elapsed / 1000:7.1f} k nodes/s')
+    print(f'   {label}   {counter.num_nodes:8} nodes   ' + '   '.join(timings))
+
+
+def main(repeat: int = 5, max_statements: int = 16000, max_nesting: int = 6400):
+    table = Parser('Table').parser.table
+    print('Checking the order of the visits...')
+    same = check_order(table)
+    print(f'   same order: {same}')
+
+    print(f'Timing wide trees (best of {repeat}, {PASSES} passes per traversal, recursion limit {sys.getrecursionlimit()})...')
+    num_statements = 1000
+    while num_statements <= max_statements:
+        report(f'{num_statements:8} statements', build(large_program(num_statements), table), repeat)
+        num_statements *= 4
+
+    print('Timing deep trees...')
+    depth = 25
+    while depth <= max_nesting:
+        report(f'{depth:8} levels    ', build(nested_expression(depth), table), repeat)
+        depth *= 4
+    if not same:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=5)
+    ap.add_argument('--max_statements', '-ms', type=int, default=16000, help='Statements in the widest tree')
+    ap.add_argument('--max_nesting', '-mn', type=int, default=6400, help='Deepest nesting of the expressions')
+    args = ap.parse_args()
+    main(args.repeat, args.max_statements, args.max_nesting)
@@ -0,0 +1,97 @@
+"""
+Measures the ast of growing programs: bytes retained per node once the parse is over,
+and how fast the nodes are built by the parser and walked by a visitor
+"""
+import argparse
+import tracemalloc
+from time import perf_counter
+from typing import Tuple
+
+from pycompile.parser.parser import Parser
+from pycompile.parser.strategy.helper import Table
+from pycompile.parser.strategy.table import TableParser
+from pycompile.parser.syntax.ast import AbstractSyntaxNode
+from pycompile.stats import NodeCounter
+
+# the passes of the compiler each walk the whole tree
+PASSES = 5
+
+STATEMENTS = [
+    'x = (x + 2) * y - z / 3;',
+    'if (x > y + 10) then {{ write(x + {i}); }} else {{ y = y - 1; }};',
+    'while (x < {i}) {{ x = x + 1; z = z * 2; }};',
+    'write(x * (y + z) - {i});',
+]
+
+
+def large_program(num_statements: int) -> str:
+    lines = ['main {', '    var {', '        integer x;', '        integer y;', '        integer z;', '    }']
+    for i in range(num_statements):
+        lines.append('    ' + STATEMENTS[i % len(STATEMENTS)].format(i=i))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def build(code: str, table: Table) -> AbstractSyntaxNode:
+    # a parser keeps its stacks and tokens, every parse needs a new one
+    parser = TableParser(code, table)
+    parser.parse()
+    if not parser.success:
+        raise RuntimeError('The generated program does not parse')
+    return parser.ast
+
+
+def bytes_per_node(code: str, table: Table) -> Tuple[float, int]:
+    tracemalloc.start()
+    ast = build(code, table)
+    # the parser and its tokens are gone, what is left is the tree and the tokens of its leaves
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    counter = NodeCounter()
+    ast.accept(counter)
+    return retained / counter.num_nodes, counter.num_nodes
+
+
+def time_build(code: str, table: Table, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        build(code, table)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def time_walk(ast: AbstractSyntaxNode, repeat: int) -> float:
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(PASSES):
+            ast.accept(NodeCounter())
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(repeat: int = 5, max_statements: int = 16000):
+    table = Parser('Table').parser.table
+    print(f'Measuring the ast of growing programs (best of {repeat}, {PASSES} passes per walk)...')
+    num_statements = 250
+    while num_statements <= max_statements:
+        code = large_program(num_statements)
+        per_node, num_nodes = bytes_per_node(code, table)
+        built = time_build(code, table, repeat)
+        walked = time_walk(build(code, table), repeat)
+        print(
+            f'   {num_nodes:8} nodes   {per_node:7.1f} bytes/node   '
+            f'parse {num_nodes / built / 1000:7.1f} k nodes/s   walk {num_nodes * PASSES / walked / 1000:7.1f} k nodes/s'
+        )
+        num_statements *= 4
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=5)
+    ap.add_argument('--max_statements', '-ms', type=int, default=16000, help='Statements in the largest program')
+    args = ap.parse_args()
+    main(args.repeat, args.max_statements)
@@ -0,0 +1,73 @@
+"""
+Measures what typing the expressions of growing programs allocates: the type objects alive once the type checker is done,
+the memory its walk leaves behind and how long the walk takes
+"""
+import gc
+import argparse
+import tracemalloc
+from typing import Tuple
+
+from pycompile.parser.parser import Parser
+from pycompile.parser.strategy.helper import Table
+from pycompile.symbol.passes import PassManager
+from pycompile.symbol.record import SemanticRecord, Type, TypeRecord
+from pycompile.symbol.visitor import SemanticTableBuilder, TypeChecker
+from pycompile.benchmarks.trees import build, large_program
+
+
+def check_types(code: str, table: Table, trace: bool) -> Tuple[PassManager, int]:
+    """
+    Runs the type checker on the tree of the code, gives the bytes its walk left allocated when tracing
+    """
+    ast = build(code, table)
+    # every record ever created is kept in the list, the ones of earlier runs would slow down the gc
+    SemanticRecord.RECORD_LIST.clear()
+    gc.collect()
+    passes = PassManager(ast)
+    builder = SemanticTableBuilder()
+    passes.run(builder)
+    if trace:
+        tracemalloc.start()
+    passes.run(TypeChecker(builder.global_table, builder.errors))
+    retained = 0
+    if trace:
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return passes, retained
+
+
+def measure(code: str, table: Table, repeat: int) -> Tuple[int, int, float]:
+    """
+    Type objects alive and bytes retained after the type checker, and the best time of its walk
+    """
+    passes, retained = check_types(code, table, True)
+    # the tree is still alive, the types of its nodes with it
+    num_types = sum([1 for obj in gc.get_objects() if isinstance(obj, (Type, TypeRecord))])
+    del passes
+    best = None
+    for _ in range(repeat):
+        passes, _ = check_types(code, table, False)
+        elapsed = passes.timings['TypeChecker']
+        best = elapsed if best is None else min(best, elapsed)
+    return num_types, retained, best
+
+
+def main(repeat: int = 3, max_statements: int = 16000):
+    table = Parser('Table').parser.table
+    print(f'Measuring the types allocated by the type checker on growing programs (best of {repeat})...')
+    num_statements = 1000
+    while num_statements <= max_statements:
+        num_types, retained, elapsed = measure(large_program(num_statements), table, repeat)
+        print(
+            f'   {num_statements:6} statements   {num_types:7} type objects   '
+            f'{retained / 1024:8.1f} KB left by the walk   type checking {elapsed * 1000:8.1f} ms'
+        )
+        num_statements *= 2
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--repeat', '-r', type=int, default=3)
+    ap.add_argument('--max_statements', '-ms', type=int, default=16000, help='Statements in the largest program')
+    args = ap.parse_args()
+    main(args.repeat, args.max_statements)
@@ -62,44 +62,39 @@ class MemoryAllocator(Visitor):
             node.sym_table.compute_size(self, self.first_pass, is_function, ret_size=ret_size, is_member_function=is_member_function)
 
         if not self.final_pass and not self.first_pass:
-            if isinstance(node, Factor):
-                # can be Leaf or Var or Signed or Not
-                # if its a leaf, get a register and put the value
-                if isinstance(node.child, Leaf):
-                    self.__load_literal(node)
-                else:
-                    use_temp = node.child.temp_var is not None
-                    if use_temp:
-                        node.temp_var = node.child.temp_var
-                    else:
-                        node.sem_rec = node.child.sem_rec
-            elif isinstance(node, (ArithExpr, Expr, Term)):
-                # migrate the register
-                if isinstance(node, (ArithExpr, Expr)):
-                    use_temp = node.arith_expr.temp_var is not None
-                    res_reg = node.arith_expr.temp_var if use_temp else node.arith_expr.sem_rec
-                else:
-                    use_temp = node.factor.temp_var is not None
-                    res_reg = node.factor.temp_var if use_temp else node.factor.sem_rec
-                node.temp_var = res_reg
-            elif isinstance(node, Signed):
-                # PERFORM OPERATION
-                self.__signed(node)
-            elif isinstance(node, Negation):
-                self.__negation(node)
-            elif isinstance(node, Var):
-                self.__process_var(node)
-            elif isinstance(node, Operator):
-                # PERFORM OPERATION
-                self.__binary_op(node)
-            # pop
+            super().visit(node)
+        # pop
         if node.sym_table is not None:
             self.current_scope = None
 
+    def visit_Factor(self, node: Factor):
+        # can be Leaf or Var or Signed or Not
+        # if its a leaf, get a register and put the value
+        if isinstance(node.child, Leaf):
+            self.__load_literal(node)
+        else:
+            use_temp = node.child.temp_var is not None
+            if use_temp:
+                node.temp_var = node.child.temp_var
+            else:
+                node.sem_rec = node.child.sem_rec
+
+    def visit_ArithExpr(self, node: Union[ArithExpr, Expr]):
+        # migrate the register
+        use_temp = node.arith_expr.temp_var is not None
+        node.temp_var = node.arith_expr.temp_var if use_temp else node.arith_expr.sem_rec
+
+    visit_Expr = visit_ArithExpr
+
+    def visit_Term(self, node: Term):
+        # migrate the register
+        use_temp = node.factor.temp_var is not None
+        node.temp_var = node.factor.temp_var if use_temp else node.factor.sem_rec
+
     def __next_temp_name(self):
         return f'temp_{self.current_scope.var}'
 
-    def __process_var(self, node: Var):
+    def visit_Var(self, node: Var):
         comps = node.get_children()
         for idx, base in enumerate(comps[::2]):
             list_idx = (idx * 2) + 1
@@ -127,11 +122,11 @@ class MemoryAllocator(Visitor):
 
     def __process_func_call(self, base: AbstractSyntaxNode, b_list: AbstractSyntaxNode, prev: AbstractSyntaxNode = None, p_list: AbstractSyntaxNode = None):
         temp_name = f'$temp_{self.current_scope.next_temp_var_id()}'
-        temp_rec = SemanticRecord(temp_name, Kind.Variable, record_type=Type(TypeEnum.Integer, 'integer'))
+        temp_rec = SemanticRecord(temp_name, Kind.Variable, record_type=self.global_table.types.type_of(TypeEnum.Integer, 'integer'))
         self.current_scope.add_record(temp_rec)
         b_list.temp_var = temp_rec
 
-    def __signed(self, node: Signed):
+    def visit_Signed(self, node: Signed):
         if node.op == '+':
             return
         temp_name = f'$temp_{self.current_scope.next_temp_var_id()}'
@@ -139,7 +134,7 @@ class MemoryAllocator(Visitor):
         self.current_scope.add_record(temp_rec)
         node.temp_var = temp_rec
 
-    def __negation(self, node: Negation):
+    def visit_Negation(self, node: Negation):
         temp_name = f'$temp_{self.current_scope.next_temp_var_id()}'
         temp_rec = SemanticRecord(temp_name, Kind.Variable, record_type=node.type_rec.type)
         self.current_scope.add_record(temp_rec)
@@ -148,11 +143,11 @@ class MemoryAllocator(Visitor):
     def __load_literal(self, node: Factor):
         temp_name = f'$temp_{self.current_scope.next_temp_var_id()}'
         # the type should come from the type of the expr???
-        temp_rec = SemanticRecord(temp_name, Kind.Variable, record_type=Type.get_type_from_token(node))
+        temp_rec = SemanticRecord(temp_name, Kind.Variable, record_type=Type.get_type_from_token(node, self.global_table.types))
         self.current_scope.add_record(temp_rec)
         node.temp_var = temp_rec
 
-    def __binary_op(self, node: Operator):
+    def visit_Operator(self, node: Operator):
         if node.operator == '=':
             # ASSIGN DOES NOT REQUIRE TEMP
             return
@@ -216,10 +211,10 @@ class MemoryAllocator(Visitor):
 
     def finish(self):
         self.first_pass = False
-        self.first_node.accept(self)
+        self.first_node.walk(self)
         # TODO determine if necessary
         # TODO what happens if class is declared that has reference to class defined after it?
         #       in second pass might compute the size of the class erroneously...
         #       maybe implement a while loop that computes in each iteration the classes it can until none are left...
+        # a walk in the final pass only keeps track of the scope, there is no need to make it
         self.final_pass = True
-        self.first_node.accept(self)
@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from pycompile.utils.queue import Queue
 from pycompile.utils.stack import Stack
@@ -56,6 +56,9 @@ class CodeGenerator(Visitor):
         self.stream_stack_key: Stack() = Stack()
         self.control_flow_node_stack: Stack = Stack()
         self.control_flow_stream_stack: Stack = Stack()
+        # the parameters and the definition of every function called, by id of its record (records are not hashable)
+        self.func_params: Dict[int, List[SemanticRecord]] = {}
+        self.func_definitions: Dict[int, SemanticRecord] = {}
 
     def __generate_control_flow_label(self) -> str:
         key = 'if' if isinstance(self.control_flow_node_stack.peek(), If) else 'while'
@@ -183,70 +186,55 @@ class CodeGenerator(Visitor):
             self.stream_stack_key.push('then' if child_idx == 1 else 'UHOH')
 
     def visit(self, node: AbstractSyntaxNode):
-        if isinstance(node, ProgramNode):
-            self.__add_to_code_stream('hlt', comment_text=self.__format_visual_break('END PROGRAM'), comment_position='below')
-            # merge func stream into code stream
-            self.code_stream.extend(self.func_stream)
-
-        elif self.accept:
-            # mostly just moving the reserved register up the chain
-            if isinstance(node, Factor):
-                # can be Leaf or Var or Signed or Not
-                # if its a leaf, get a register and put the value
-                if isinstance(node.child, Leaf):
-                    self.__load_literal(node)
-                else:
-                    use_temp = node.child.temp_var is not None
-                    if use_temp:
-                        node.temp_var = node.child.temp_var
-                        node.temp_var.from_var = isinstance(node.child, Var) and self.from_var
-                        self.from_var = None
-                    else:
-                        node.sem_rec = node.child.sem_rec
-            elif isinstance(node, (ArithExpr, Expr, Term)):
-                # migrate the register
-                if isinstance(node, (ArithExpr, Expr)):
-                    use_temp = node.arith_expr.temp_var is not None
-                    res_reg = node.arith_expr.temp_var if use_temp else node.arith_expr.sem_rec
-                else:
-                    use_temp = node.factor.temp_var is not None
-                    res_reg = node.factor.temp_var if use_temp else node.factor.sem_rec
-                if use_temp:
-                    node.temp_var = res_reg
-                else:
-                    node.sem_rec = res_reg
-            elif isinstance(node, Signed):
-                # PERFORM OPERATION
-                self.__signed(node)
-            elif isinstance(node, Negation):
-                self.__negation(node)
-            elif isinstance(node, Var):
-                self.__process_var(node)
-            elif isinstance(node, Operator):
-                # PERFORM OPERATION
-                self.__binary_op(node)
-            elif isinstance(node, Write):
-                self.__write(node)
-            elif isinstance(node, Read):
-                self.__read(node)
-            elif isinstance(node, If):
-                self.__if(node)
-            elif isinstance(node, While):
-                self.__while(node)
-            elif isinstance(node, Return):
-                self.__return(node)
+        # outside of function bodies only the program itself generates code
+        if self.accept or isinstance(node, ProgramNode):
+            super().visit(node)
         # pop
         if node.sym_table is not None:
             self.current_scope = None
-        if isinstance(node, FuncBody):
-            self.accept = False
 
-        if isinstance(node, FuncBody) and isinstance(node.parent, ProgramNode):
-            pass
-        elif isinstance(node, FuncBody):
+    def visit_ProgramNode(self, node: ProgramNode):
+        self.__add_to_code_stream('hlt', comment_text=self.__format_visual_break('END PROGRAM'), comment_position='below')
+        # merge func stream into code stream
+        self.code_stream.extend(self.func_stream)
+
+    def visit_FuncBody(self, node: FuncBody):
+        self.accept = False
+        if not isinstance(node.parent, ProgramNode):
             self.__end_func(node)
 
-    def __return(self, node: Return):
+    # mostly just moving the reserved register up the chain
+    def visit_Factor(self, node: Factor):
+        # can be Leaf or Var or Signed or Not
+        # if its a leaf, get a register and put the value
+        if isinstance(node.child, Leaf):
+            self.__load_literal(node)
+        else:
+            use_temp = node.child.temp_var is not None
+            if use_temp:
+                node.temp_var = node.child.temp_var
+                node.temp_var.from_var = isinstance(node.child, Var) and self.from_var
+                self.from_var = None
+            else:
+                node.sem_rec = node.child.sem_rec
+
+    def visit_ArithExpr(self, node: Union[ArithExpr, Expr]):
+        # migrate the register
+        self.__migrate(node, node.arith_expr)
+
+    visit_Expr = visit_ArithExpr
+
+    def visit_Term(self, node: Term):
+        self.__migrate(node, node.factor)
+
+    @staticmethod
+    def __migrate(node: AbstractSyntaxNode, child: AbstractSyntaxNode):
+        if child.temp_var is not None:
+            node.temp_var = child.temp_var
+        else:
+            node.sem_rec = child.sem_rec
+
+    def visit_Return(self, node: Return):
         temp_reg = self.registers.pop()
         self.__load_word(node.expr, temp_reg)
         self.__store_word('0(r14)', temp_reg, comment='% put return value on stack')
@@ -258,7 +246,7 @@ class CodeGenerator(Visitor):
         self.__add_to_code_stream(f'lw r15,{offset}(r14)',comment_text='% retrieve r15', comment_position='inline')
         self.__add_to_code_stream('jr r15', comment_text=self.__format_visual_break(f'END - definition for: {func_name}'), comment_position='below')
 
-    def __process_var(self, node: Var):
+    def visit_Var(self, node: Var):
         comps = node.get_children()
         temp_reg = self.registers.pop()
         acc_reg = self.registers.pop()
@@ -342,7 +330,10 @@ class CodeGenerator(Visitor):
             return trans[type_.type_name]
 
     def __process_func_call(self, base: AbstractSyntaxNode, b_list: AbstractSyntaxNode, acc_reg: str = None):
-        params = [param for param in base.sem_rec.table_link.records.values() if param.kind == Kind.Parameter]
+        params = self.func_params.get(id(base.sem_rec))
+        if params is None:
+            params = [param for param in base.sem_rec.table_link.records.values() if param.kind == Kind.Parameter]
+            self.func_params[id(base.sem_rec)] = params
         for np, sp in zip(b_list.get_children(), params):
             reg = self.registers.pop()
             if (
@@ -387,10 +378,13 @@ class CodeGenerator(Visitor):
             instr = f'sw {left_op},{acc_reg}'
             comment = '% pass the reference to the instance the member function is being called on'
             self.__add_to_code_stream(instr, comment_text=comment, comment_position='inline')
-        if base.sem_rec.get_name() in self.global_table.records.keys():
-            master_rec = self.global_table.records[base.sem_rec.get_name()]
-        else:
-            master_rec = self.global_table.records[base.sem_rec.get_func_decl()]
+        master_rec = self.func_definitions.get(id(base.sem_rec))
+        if master_rec is None:
+            if base.sem_rec.get_name() in self.global_table.records.keys():
+                master_rec = self.global_table.records[base.sem_rec.get_name()]
+            else:
+                master_rec = self.global_table.records[base.sem_rec.get_func_decl()]
+            self.func_definitions[id(base.sem_rec)] = master_rec
         # save register before jumping
         self.__store_word(b_list, acc_reg)
         # stack ops and jump
@@ -413,7 +407,7 @@ class CodeGenerator(Visitor):
                 break
         return validated
 
-    def __signed(self, node: Signed):
+    def visit_Signed(self, node: Signed):
         if node.op == '+':
             # who cares
             if node.factor.temp_var is not None:
@@ -434,7 +428,7 @@ class CodeGenerator(Visitor):
         self.registers.push(res_reg)
         self.registers.push(sign_reg)
 
-    def __negation(self, node: Negation):
+    def visit_Negation(self, node: Negation):
         val_reg = self.registers.pop()
         temp_reg = self.registers.pop()
         use_temp = node.factor.temp_var is not None
@@ -444,7 +438,7 @@ class CodeGenerator(Visitor):
         self.registers.push(val_reg)
         self.registers.push(temp_reg)
 
-    def __if(self, node: If):
+    def visit_If(self, node: If):
         self.stream_stack_key.pop()
         next_label = None
         if self.next_label is not None:
@@ -479,7 +473,7 @@ class CodeGenerator(Visitor):
         self.registers.push(reg)
         self.next_label = end_label
 
-    def __while(self, node: While):
+    def visit_While(self, node: While):
         reg = self.registers.pop()
         next_label = None
         if self.next_label is not None:
@@ -509,7 +503,7 @@ class CodeGenerator(Visitor):
         self.registers.push(reg)
         self.next_label = end_label
 
-    def __read(self, node: Read):
+    def visit_Read(self, node: Read):
         val_reg = self.registers.pop()
         buf_reg = self.registers.pop()
         stack_instr = f'addi r14,r14,-{self.current_scope.req_mem}'
@@ -532,7 +526,7 @@ class CodeGenerator(Visitor):
         self.registers.push(val_reg)
         self.registers.push(buf_reg)
 
-    def __write(self, node: Write):
+    def visit_Write(self, node: Write):
 
         val_reg = self.registers.pop()
         buf_reg = self.registers.pop()
@@ -599,7 +593,7 @@ class CodeGenerator(Visitor):
         if node.temp_var is not None and node.temp_var.from_var:
             self.registers.push(inter_reg)
 
-    def __binary_op(self, node: Operator):
+    def visit_Operator(self, node: Operator):
         right_reg = self.registers.pop()
         # LOAD RIGHT
         self.__load_word(node.right_operand, right_reg, use_temp=node.right_operand.temp_var is not None)
@@ -4,19 +4,37 @@ from pathlib import Path
 from pycompile.compiler import PyCompiler
 
 
-def compile_file(input_file, enable_output, output_location, test_location):
-
-    compiler = PyCompiler(enable_output, output_location, test_location)
-    compiler.compile(input_file)
-
-
-def main(enable_output, output_location, test_output, to_compile, is_dir):
+def compile_file(input_file, enable_output, output_location, test_location, scanner, strategy='Table',
+                 pass_timings=False, profile=False, trace_memory=False, profile_output=None):
+
+    compiler = PyCompiler(enable_output, output_location, test_location, scanner=scanner, strategy=strategy,
+                          profile=profile, trace_memory=trace_memory, profile_output=profile_output)
+    result = compiler.compile(input_file)
+    if profile or trace_memory:
+        print_profile(result)
+    if pass_timings and compiler.passes is not None:
+        print(f'Pass timings ({compiler.passes.num_walks} walks):')
+        for name, elapsed in compiler.passes.timings.items():
+            print(f'    {name:<40} {elapsed * 1000:10.3f} ms')
+
+
+def print_profile(result):
+    print(f'Profile of {result.output_name}:')
+    for name, stats in [(stage.name, stage) for stage in result.stages] + [('total', result)]:
+        memory = f'{stats.peak_memory / 1024:10.1f} KiB peak' if stats.peak_memory is not None else ''
+        print(f'    {name:<20} {stats.wall_time * 1000:10.3f} ms wall {stats.cpu_time * 1000:10.3f} ms cpu {memory}')
+    print(f'    {result.num_tokens} tokens, {result.num_nodes} ast nodes, {result.num_instructions} instructions')
+
+
+def main(enable_output, output_location, test_output, to_compile, is_dir, scanner='Precedence', strategy='Table',
+         pass_timings=False, profile=False, trace_memory=False, profile_output=None):
+    options = (scanner, strategy, pass_timings, profile, trace_memory, profile_output)
     if is_dir:
         for test_file in Path(to_compile).iterdir():
             if test_file.suffix == '.src':
-                compile_file(test_file.as_posix(), enable_output, output_location, test_output)
+                compile_file(test_file.as_posix(), enable_output, output_location, test_output, *options)
     else:
-        compile_file(to_compile, enable_output, output_location, test_output)
+        compile_file(to_compile, enable_output, output_location, test_output, *options)
 
 
 if __name__ == '__main__':
@@ -26,6 +44,16 @@ if __name__ == '__main__':
     ap.add_argument('--test_output', default=None)
     ap.add_argument('--to-compile')
     ap.add_argument('--is-dir', action='store_true')
+    ap.add_argument('--scanner', choices=['Precedence', 'SinglePass'], default='Precedence')
+    ap.add_argument('--strategy', choices=['Table', 'Generated'], default='Table')
+    ap.add_argument('--pass_timings', action='store_true', help='Print the time spent in each walk and finish')
+    ap.add_argument('--profile', action='store_true', help='Print the time of each stage and the size of the program')
+    ap.add_argument('--trace_memory', action='store_true', help='Also trace the peak memory of each stage, slower')
+    ap.add_argument('--profile_output', default=None, help='File to append the profile of every compile to, as json lines')
     args = ap.parse_args()
 
-    main(args.enable_output, args.output_location, args.test_output, args.to_compile, args.is_dir)
\ No newline at end of file
+    main(
+        args.enable_output, args.output_location, args.test_output, args.to_compile, args.is_dir,
+        args.scanner, args.strategy, args.pass_timings,
+        args.profile, args.trace_memory, args.profile_output
+    )
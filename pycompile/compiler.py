@@ -1,10 +1,13 @@
 import os
 import sys
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
-from typing import Optional, Union, List
+from typing import ContextManager, Iterator, Optional, Union, List
 
 from pycompile.parser.parser import Parser
-from pycompile.symbol.error import SemanticError
+from pycompile.stats import CompileResult, StageProfiler, count_instructions, count_nodes
+from pycompile.symbol.error import Diagnostic, SemanticError
+from pycompile.symbol.passes import PassManager
 from pycompile.codegenr.generator import CodeGenerator
 from pycompile.parser.syntax.collector import Collector
 from pycompile.codegenr.allocator import MemoryAllocator
@@ -13,18 +16,32 @@ from pycompile.symbol.visitor import SemanticTableBuilder, TypeChecker
 
 class PyCompiler:
 
-    def __init__(self, enable_output: bool = False, output_location: Union[str, Path] = '.', test_output: str = None):
+    def __init__(self,
+                 enable_output: bool = False,
+                 output_location: Union[str, Path] = '.',
+                 test_output: str = None,
+                 scanner: str = 'Precedence',
+                 strategy: str = 'Table',
+                 profile: bool = False,
+                 trace_memory: bool = False,
+                 profile_output: Union[str, Path] = None):
         self.enable_output: bool = enable_output
         self.output_location: Path = output_location if isinstance(output_location, Path) else Path(output_location)
         self.output_name: Optional[str] = None
         self.output_dir: Optional[Path] = None
         self.test_output: Optional[str] = None
+        # tracing memory implies profiling, the stats of every compile are appended to profile_output as json lines
+        self.profile: bool = profile or trace_memory or profile_output is not None
+        self.trace_memory: bool = trace_memory
+        self.profile_output: Optional[Path] = Path(profile_output) if profile_output is not None else None
+        self.profiler: Optional[StageProfiler] = None
 
-        self.parser: Parser = Parser("Table")
+        self.parser: Parser = Parser(strategy, scanner=scanner)
         self.sym_table_builder: SemanticTableBuilder = SemanticTableBuilder()
         self.type_checker: TypeChecker = None
         self.mem_allocator: MemoryAllocator = None
         self.code_generator: CodeGenerator = None
+        self.passes: Optional[PassManager] = None
         self.code: Optional[str] = None
 
     def __error_print(self, exception: Exception, step_name: str):
@@ -36,12 +53,18 @@ class PyCompiler:
     def __eprint(self, msg: str):
         print(msg, file=sys.stderr)
 
-    def compile(self, to_compile: Union[Path, str]):
+    def __stage(self, name: str) -> ContextManager:
+        return self.profiler.stage(name) if self.profiler is not None else nullcontext()
+
+    def compile(self, to_compile: Union[Path, str]) -> CompileResult:
+        """
+        Compiles the file or the code, the stats of its stages are only in the result when profiling
+        """
+        source_file: Optional[Path] = None
         if isinstance(to_compile, Path) or (Path(to_compile).exists() and Path(to_compile).is_file()):
-            with open(str(to_compile), 'r') as src_file:
-                self.code = src_file.read()
             if not isinstance(to_compile, Path):
                 to_compile = Path(to_compile)
+            source_file = to_compile
             self.output_name = str(to_compile.stem)
         else:
             self.code = to_compile
@@ -50,13 +73,18 @@ class PyCompiler:
         # set up for output
         self.output_dir = self.output_location if not self.enable_output else Path(os.path.join(str(self.output_location), self.output_name))
 
+        result = CompileResult(self.output_name)
+        if self.profile:
+            self.profiler = StageProfiler(result, self.trace_memory)
+            self.profiler.start()
         last_step_success = True
 
         print('===============================================')
         print(f'\n Compiling file: {to_compile}')
         # parse the program
         try:
-            self.parser.parse(self.code)
+            with self.__stage('Parsing'):
+                self.__parse(source_file)
             print('    Parsing complete')
         except Exception as e:
             last_step_success = False
@@ -64,9 +92,11 @@ class PyCompiler:
 
         # check for errors
         if last_step_success:
+            self.passes = PassManager(self.parser.ast)
             # do the symbol table generation
             try:
-                self.parser.traverse(self.sym_table_builder)
+                with self.__stage('SymbolTableCreator'):
+                    self.passes.run(self.sym_table_builder)
                 last_step_success = not any([
                     isinstance(sem_err, SemanticError)
                     for sem_err in self.sym_table_builder.errors
@@ -79,8 +109,9 @@ class PyCompiler:
         if last_step_success:
             # do the typeChecking table generation
             try:
-                self.type_checker = TypeChecker(self.sym_table_builder.global_table, self.sym_table_builder.errors)
-                self.parser.traverse(self.type_checker)
+                with self.__stage('TypeChecker'):
+                    self.type_checker = TypeChecker(self.sym_table_builder.global_table, self.sym_table_builder.errors)
+                    self.passes.run(self.type_checker)
                 last_step_success = not any([
                     isinstance(sem_err, SemanticError)
                     for sem_err in self.sym_table_builder.errors
@@ -95,8 +126,9 @@ class PyCompiler:
         if last_step_success:
             # do the memory allocation
             try:
-                self.mem_allocator = MemoryAllocator(self.type_checker.global_table)
-                self.parser.traverse(self.mem_allocator)
+                with self.__stage('MemoryAllocation'):
+                    self.mem_allocator = MemoryAllocator(self.type_checker.global_table)
+                    self.passes.run(self.mem_allocator)
                 print('    Memory allocation complete')
             except Exception as e:
                 last_step_success = False
@@ -105,45 +137,78 @@ class PyCompiler:
         if last_step_success:
             # do the code generation
             try:
-                self.code_generator = CodeGenerator(self.mem_allocator.global_table)
-                self.parser.traverse(self.code_generator)
+                with self.__stage('CodeGeneration'):
+                    self.code_generator = CodeGenerator(self.mem_allocator.global_table)
+                    self.passes.run(self.code_generator)
                 print('    Code generation complete')
             except Exception as e:
                 last_step_success = False
                 self.__error_print(e, "CodeGeneration")
 
-        if self.enable_output:
-            self.__output()
-        # always need to output the generated code or else what good is it...
-        if self.code_generator is not None:
-            code_name = f'{os.path.join(str(self.output_dir), self.output_name)}.moon'
-            # output generated code
-            with open(code_name, 'w') as f:
-                for code in self.code_generator.code_stream + self.code_generator.data_stream:
-                    f.write(code + '\n')
-            # output to another dir if specified
-            if self.test_output is not None:
-                test_name = f'{os.path.join(self.test_output, self.output_name)}.moon'
-                with open(test_name, 'w') as f:
+        with self.__stage('Output'):
+            if self.enable_output:
+                self.__output()
+            # always need to output the generated code or else what good is it...
+            if self.code_generator is not None:
+                code_name = f'{os.path.join(str(self.output_dir), self.output_name)}.moon'
+                # output generated code
+                with open(code_name, 'w') as f:
                     for code in self.code_generator.code_stream + self.code_generator.data_stream:
                         f.write(code + '\n')
-            print(f'    Generated code output to: {code_name}')
+                # output to another dir if specified
+                if self.test_output is not None:
+                    test_name = f'{os.path.join(self.test_output, self.output_name)}.moon'
+                    with open(test_name, 'w') as f:
+                        for code in self.code_generator.code_stream + self.code_generator.data_stream:
+                            f.write(code + '\n')
+                print(f'    Generated code output to: {code_name}')
         if last_step_success:
             print(' COMPILE SUCCESS')
         print('===============================================\n')
-    def __output(self):
+        result.success = last_step_success
+        if self.profiler is not None:
+            self.profiler.stop()
+            self.profiler = None
+            self.__finish_profile(result)
+        return result
+
+    def __finish_profile(self, result: CompileResult):
+        result.num_tokens = self.parser.parser.analyzer.num_tokens
+        if self.parser.ast is not None:
+            result.num_nodes = count_nodes(self.parser.ast)
+        if self.code_generator is not None:
+            result.num_instructions = count_instructions(self.code_generator.code_stream + self.code_generator.data_stream)
+        if self.passes is not None:
+            result.pass_timings = dict(self.passes.timings)
+        if self.profile_output is not None:
+            with open(str(self.profile_output), 'a') as f:
+                result.write_json_lines(f)
+
+    def __parse(self, source_file: Optional[Path]):
+        with ExitStack() as stack:
+            # tokens are scanned from the file as the parser needs them
+            source = stack.enter_context(open(str(source_file), 'r')) if source_file is not None else self.code
+            # the tokenized code is written while scanning, only when there is output
+            tokenized = None
+            if self.enable_output:
+                tokenized = stack.enter_context(open(f'{self.__output_base_name()}.outlextokens', 'w'))
+            # the stack contents and derivation are only written out with the rest of the output
+            self.parser.parse(source, streaming=True, tokenized=tokenized, trace=self.enable_output)
+
+    def __output_base_name(self) -> str:
         if not self.output_dir.exists():
             self.output_dir.mkdir()
-        base_name = os.path.join(str(self.output_dir), self.output_name)
+        return os.path.join(str(self.output_dir), self.output_name)
+
+    def __output(self):
+        base_name = self.__output_base_name()
         if self.parser is not None:
-            token_name = f'{base_name}.outlextokens'
             error_name = f'{base_name}.outlexerrors'
             deriv_name = f'{base_name}.outderivation'
             stack_name = f'{base_name}.outstack'
             ast_name = f'{base_name}.outast'
             parse_err = f'{base_name}.outerrors'
-            # output stuff from A1
-            self.parser.parser.analyzer.write_tokenized(token_name)
+            # output stuff from A1, the tokens were written during parsing
             self.parser.parser.analyzer.write_errors(error_name)
             # output stuff from A2
             collector = Collector()
@@ -164,7 +229,7 @@ class PyCompiler:
             sem_err_name = f'{base_name}.outsemanticerrors'
             with open(sem_err_name, 'w') as f:
                 for error in self.__get_semantic_errors():
-                    f.write(f'{error[1]}\n')
+                    f.write(f'{error.__class__.__name__}: {error}\n')
 
         if self.mem_allocator is not None:
             sym_tab_name = f'{base_name}.outsymboltables'
@@ -176,15 +241,7 @@ class PyCompiler:
         if not last_step_success:
             self.__eprint('Could not compile because of semantic errors!\n')
         for error in self.__get_semantic_errors():
-            self.__eprint(error[1])
-
-    def __get_semantic_errors(self) -> List[tuple]:
-        all_errors = []
-        for error in (self.sym_table_builder.errors if self.type_checker is None else self.type_checker.errors):
-            if 'line: ' not in error.args[0]:
-                pos = 1000000
-            else:
-                pos = int(error.args[0].split('line: ')[1].split(')')[0])
-            msg = f'{error.__class__.__name__}: {error.args[0]}'
-            all_errors.append((pos, msg))
-        return sorted(all_errors, key=lambda x: x[0])
+            self.__eprint(f'{error.__class__.__name__}: {error}')
+
+    def __get_semantic_errors(self) -> Iterator[Diagnostic]:
+        return Diagnostic.by_line(self.sym_table_builder.errors if self.type_checker is None else self.type_checker.errors)
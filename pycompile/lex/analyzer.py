@@ -2,107 +2,166 @@
 
 """
 import re
-from typing import List, Union, Tuple, Pattern
+from typing import Any, Callable, Iterable, Iterator, List, Pattern, TextIO, Tuple, Union
 from pycompile.lex.token import *
+from pycompile.lex.scanner import Scanner, PrecedenceScanner
 
 
 class LexicalAnalyzer:
 
-    precedence: List[Token] = [Comment, Operator, Punctuation, Reserved, Id, Float, Integer, String]
     whitespace: Pattern = re.compile('\s')
+    whitespace_run: Pattern = re.compile('\s*')
+    chunk_size: int = 1 << 16
 
-    def __init__(self):
+    def __init__(self, scanner: str = 'Precedence'):
+        self.scanner: Scanner = Scanner.create(scanner)
         self.tokens: List[Token] = []
+        self.errors: List[Invalid] = []
         self.code: Union[None, str] = None
-        self.tokenized: Union[None, str] = None
         self.num_lines: int = 0
+        # every token scanned, comments and invalid ones included, also counted when they are not stored
+        self.num_tokens: int = 0
 
-    def tokenize(self, raw_code: str):
+    def tokenize(self, raw_code: str, tokenized: Union[TextIO, List[str]] = None):
+        """
+        The tokenized code is only produced when given a file or a list to write it to
+        """
         # set the info for the tokenization
         self.code = raw_code
-        self.num_lines = len(self.code.split('\n'))
-        self.tokenized = ''
-        # start the tokenization
-        line, start_idx = 1, 0
-        # tokenize until there are no tokens left
-        while len(raw_code) > 0:
-            # extract one token
-            raw_code, tok_start, tok_end = self.extract_token(raw_code)
+        self.num_lines = raw_code.count('\n') + 1
+        write = LexicalAnalyzer.__writer(tokenized)
+        for whitespace, token in self.__scan(iter([raw_code])):
+            if token is not None:
+                self.tokens.append(token)
+            if write is not None:
+                LexicalAnalyzer.__write_tokenized(write, whitespace, token)
+
+    def iter_tokens(self,
+                    source: Union[str, TextIO, Iterable[str]],
+                    skip_comments: bool = True,
+                    tokenized: Union[TextIO, List[str]] = None) -> Iterator[Token]:
+        """
+        Lazily yields the tokens of the source, which can be the code, a file object or any iterable of chunks of code.
+        Only the part of the source that has not been scanned yet is kept in memory,
+        the tokenized code (comments included) is written as the tokens are yielded
+        """
+        write = LexicalAnalyzer.__writer(tokenized)
+        for whitespace, token in self.__scan(LexicalAnalyzer.__chunks(source)):
+            if write is not None:
+                LexicalAnalyzer.__write_tokenized(write, whitespace, token)
+            if token is None or (skip_comments and isinstance(token, Comment)):
+                continue
+            yield token
+
+    def __scan(self, chunks: Iterator[str]) -> Iterator[Tuple[str, Union[Token, None]]]:
+        """
+        Yields every token along with the whitespace in front of it, the trailing whitespace comes with None.
+        The buffer only ever holds complete lines, no token other than a comment or an invalid string can span
+        a line break, so those are rescanned with more lines whenever they reach the end of the buffer
+        """
+        buffer, pending, exhausted = '', [], False
+        # offset is the position of the start of the buffer in the source, line_start is also relative to the source
+        line, line_start, pos, offset = 1, 0, 0, 0
+        while True:
+            # skip the whitespace before the token
+            tok_start = LexicalAnalyzer.whitespace_run.match(buffer, pos).end()
+            token = LexicalAnalyzer.next_token(buffer, self.scanner, tok_start) if tok_start < len(buffer) else None
+            tok_end = tok_start + (len(token) if token is not None else 0)
+            if not exhausted and (token is None or tok_end == len(buffer)):
+                # the token (or the whitespace) could go on in the lines that have not been read yet
+                buffer, exhausted = LexicalAnalyzer.__refill(buffer[pos:], pending, chunks)
+                offset += pos
+                pos = 0
+                continue
             # count the number of lines between this token and the last token and use it to set the position
-            line += self.code[start_idx: start_idx + tok_start].count('\n')
-            self.tokens[-1].set_position(line)
-            # if this was a comment and it was multiline, add the numbers of lines now
-            # so the next token has the right position
-            line += 0 if not isinstance(self.tokens[-1], Comment) else self.tokens[-1].get_num_lines()
-            # add the string representation of the token to the tokenized codegenr
-            self.tokenized += (
-                self.code[start_idx: start_idx + tok_start] +
-                (self.tokens[-1].tok_str() if not self.tokens[-1].was_inserted() else '')
-            )
+            newlines = buffer.count('\n', pos, tok_start)
+            if newlines > 0:
+                line += newlines
+                line_start = offset + buffer.rfind('\n', pos, tok_start) + 1
+            if token is None:
+                # only whitespace was left
+                yield buffer[pos:], None
+                return
+            token.set_span(offset + tok_start, offset + tok_end)
+            token.set_position(line, offset + tok_start - line_start + 1)
+            if isinstance(token, Invalid):
+                self.errors.append(token)
+            self.num_tokens += 1
+            yield buffer[pos:tok_start], token
+            # multiline comments (and invalid strings) move the line for the next token
+            newlines = buffer.count('\n', tok_start, tok_end)
+            if newlines > 0:
+                line += newlines
+                line_start = offset + buffer.rfind('\n', tok_start, tok_end) + 1
             # set the end as the new start
-            start_idx += tok_end
+            pos = tok_end
 
-    def extract_token(self, current_code: str) -> Tuple[str, int, int]:
-        token = LexicalAnalyzer.next_token(current_code)
-        if token is not None:
-            self.tokens.append(token)
-        stripped_code = current_code.lstrip()
-        start_idx = len(current_code) - len(stripped_code)
-        end_idx = start_idx + (len(token) if token is not None else len(current_code))
+    @staticmethod
+    def __refill(rest: str, pending: List[str], chunks: Iterator[str]) -> Tuple[str, bool]:
+        # read until there is at least one more complete line, what follows the last line break stays pending
+        for chunk in chunks:
+            last_break = chunk.rfind('\n')
+            if last_break == -1:
+                pending.append(chunk)
+                continue
+            lines = ''.join([rest] + pending + [chunk[:last_break + 1]])
+            pending[:] = [chunk[last_break + 1:]]
+            return lines, False
+        lines = ''.join([rest] + pending)
+        pending.clear()
+        return lines, True
 
-        return token.replace_self(stripped_code) if token is not None else '', start_idx, end_idx
+    @staticmethod
+    def __chunks(source: Union[str, TextIO, Iterable[str]]) -> Iterator[str]:
+        if isinstance(source, str):
+            return iter([source])
+        elif hasattr(source, 'read'):
+            return iter(lambda: source.read(LexicalAnalyzer.chunk_size), '')
+        return iter(source)
 
-    def write_tokenized(self, token_file: str):
-        with open(token_file, 'w') as f:
-            f.write(self.tokenized)
+    @staticmethod
+    def __writer(tokenized: Union[TextIO, List[str], None]) -> Union[Callable[[str], Any], None]:
+        if tokenized is None:
+            return None
+        return tokenized.write if hasattr(tokenized, 'write') else tokenized.append
+
+    @staticmethod
+    def __write_tokenized(write: Callable[[str], Any], whitespace: str, token: Union[Token, None]):
+        # the whitespace is kept so the tokens stay on the line they were found on
+        write(whitespace)
+        if token is not None:
+            write(token.tok_str())
 
     def write_errors(self, error_file: str):
         with open(error_file, 'w') as f:
-            lines = [
-                token.formatted_str()
-                for token in self.tokens
-                if isinstance(token, Invalid)
-            ]
+            lines = [token.formatted_str() for token in self.errors]
             f.write('\n'.join(lines))
 
     @staticmethod
-    def next_token(code: str) -> Union[Token, None]:
-        code = code.lstrip()
-        token = LexicalAnalyzer.find_match(code)
+    def next_token(code: str, scanner: Scanner = None, pos: int = 0) -> Union[Token, None]:
+        scanner = scanner if scanner is not None else PrecedenceScanner()
+        pos = LexicalAnalyzer.whitespace_run.match(code, pos).end()
+        token = LexicalAnalyzer.find_match(code, scanner, pos)
         if token is not None:
             # valid token, return
             return token
         # no match found, have to create an invalid token
-        if len(code) == 0:
+        if pos == len(code):
             return None
-        elif code[0] == '"' and len(code) > 1:
+        elif code[pos] == '"' and pos + 1 < len(code):
             # there is an invalid string
-            idx = code[1:].find('"')
-            idx = idx + 2 if idx != -1 else len(code)
+            idx = code.find('"', pos + 1)
+            idx = idx + 1 if idx != -1 else len(code)
         else:
-            # there is something else invalid
-            whitespace_match = LexicalAnalyzer.whitespace.search(code)
-            # =====
-            # breaking invalid lexemes only on whitespace
-            # idx = len(codegenr) if not whitespace_match else whitespace_match.start()
-
-            # =====
-            # breaking invalid lexemes on the next valid
-            whitespace_idx = len(code) if not whitespace_match else whitespace_match.start()
-            next_tok_idx = whitespace_idx
-            for i in range(1, len(code)):
-                if LexicalAnalyzer.find_match(code[i:].lstrip()) is not None:
-                    next_tok_idx = i
-                    break
-            idx = next_tok_idx if next_tok_idx < whitespace_idx else whitespace_idx
-        return Invalid(code[:idx])
+            # there is something else invalid,
+            # breaking invalid lexemes on the next valid token or whitespace, whichever comes first
+            idx = scanner.find_recovery(code, pos + 1)
+        return Invalid(code[pos:idx])
 
     @staticmethod
-    def find_match(code: str) -> Union[Token, None]:
-        for token_class in LexicalAnalyzer.precedence:
-            if token_class.match(code):
-                return token_class(code)
-        return None
+    def find_match(code: str, scanner: Scanner = None, pos: int = 0) -> Union[Token, None]:
+        scanner = scanner if scanner is not None else PrecedenceScanner()
+        return scanner.find_match(code, pos)
 
     def add_final_token(self):
         self.tokens.append(Final())
@@ -115,4 +174,4 @@ class LexicalAnalyzer:
                 self.tokens.append(token)
 
     def __len__(self):
-        return len(self.tokens)
\ No newline at end of file
+        return len(self.tokens)
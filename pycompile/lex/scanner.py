@@ -0,0 +1,74 @@
+"""
+Scanners find the token at the start of the code handed to them by the LexicalAnalyzer
+"""
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, List, Pattern, Type, Union
+
+from pycompile.lex.token import *
+
+
+class Scanner(ABC):
+
+    precedence: List[Type[Token]] = [Comment, Operator, Punctuation, Reserved, Id, Float, Integer, String]
+    whitespace: Pattern = re.compile('\s')
+
+    @abstractmethod
+    def find_match(self, code: str, pos: int = 0) -> Union[Token, None]:
+        ...
+
+    def find_recovery(self, code: str, pos: int = 0) -> int:
+        """
+        Gives the first position from pos where a token could start or where there is whitespace,
+        the length of the code if there is neither. Used to find where an invalid lexeme ends
+        """
+        for i in range(pos, len(code)):
+            if Scanner.whitespace.match(code, i) or any(token_class.match(code, i) for token_class in self.precedence):
+                return i
+        return len(code)
+
+    @staticmethod
+    def create(scanner: str = 'Precedence'):
+        if scanner == 'SinglePass':
+            return SinglePassScanner()
+        elif scanner == 'Precedence':
+            return PrecedenceScanner()
+        raise ValueError(f'Unknown scanner: {scanner}')
+
+
+class PrecedenceScanner(Scanner):
+    """
+    Tries every token class in order of precedence, one anchored regex at a time
+    """
+
+    def find_match(self, code: str, pos: int = 0) -> Union[Token, None]:
+        for token_class in self.precedence:
+            if token_class.match(code, pos):
+                return token_class(code, pos)
+        return None
+
+
+class SinglePassScanner(Scanner):
+    """
+    Combines the pattern of every token class into a single alternation with one named group per class.
+    Alternatives are tried left to right, so the first class that matches still wins, exactly as with precedence
+    """
+
+    token_classes: Dict[str, Type[Token]] = {token_class.__name__: token_class for token_class in Scanner.precedence}
+    pattern: Pattern = re.compile('|'.join(
+        f'(?P<{token_class.__name__}>{token_class.pattern.pattern})'
+        for token_class in Scanner.precedence
+    ))
+    # stops at the first position any class matches, or at whitespace, in a single search
+    recovery: Pattern = re.compile(f'(?=(?:{pattern.pattern}))|\s')
+
+    def find_match(self, code: str, pos: int = 0) -> Union[Token, None]:
+        match = SinglePassScanner.pattern.match(code, pos)
+        if match is None:
+            return None
+        # comments are not regular (they nest), so every class extracts its lexeme from the code itself
+        return SinglePassScanner.token_classes[match.lastgroup](code, pos)
+
+    def find_recovery(self, code: str, pos: int = 0) -> int:
+        match = SinglePassScanner.recovery.search(code, pos)
+        return match.start() if match is not None else len(code)
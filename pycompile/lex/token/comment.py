@@ -8,49 +8,53 @@ class Comment(Token):
     """
     This pattern matches the start of the comment
     """
-    pattern: Pattern = re.compile('^(//|/\*)')
+    __slots__ = ()
+    pattern: Pattern = re.compile('(//|/\*)')
+    # finds every opening and closing of a block comment, even when they overlap like in /*/
+    delimiter: Pattern = re.compile('(?=/\*|\*/)')
 
     _NAME_MAP = {
         '//': 'inlinecmt',
         '/*': 'blockcmt'
     }
 
-    def __init__(self, code: str):
-        lexm = Comment.pattern.match(code).group()
-        super().__init__(Comment.extract_comment(code), Comment._NAME_MAP[lexm])
+    def __init__(self, code: str, pos: int = 0):
+        lexm = Comment.pattern.match(code, pos).group()
+        super().__init__(Comment.extract_comment(code, pos), Comment._NAME_MAP[lexm])
 
     def get_num_lines(self):
         return self.lexeme.count('\n')
 
     @staticmethod
-    def extract_comment(code: str) -> str:
+    def extract_comment(code: str, pos: int = 0) -> str:
         # extract the start of the comment
-        opening = Comment.pattern.match(code).group()
+        opening = Comment.pattern.match(code, pos).group()
         if opening == '//':
-            # single line comment, return the first line
-            return code.split('\n')[0]
+            # single line comment, return the rest of the line
+            end = code.find('\n', pos)
+            return code[pos:end if end != -1 else len(code)]
         else:
-            return Comment.extract_multiline(code)
+            return Comment.extract_multiline(code, pos)
 
     @staticmethod
-    def extract_multiline(code: str) -> str:
-        stack = []
-        for i, c in enumerate(code):
+    def extract_multiline(code: str, pos: int = 0) -> str:
+        depth = 0
+        for delimiter in Comment.delimiter.finditer(code, pos):
+            i = delimiter.start()
             # look for new opening for nested comments
-            if c == '/' and i < len(code) - 1 and code[i + 1] == '*':
-                stack.append('/*')
-            elif c == '*' and i < len(code) - 1 and code[i + 1] == '/':
-                if len(stack) == 1:
-                    # end of comment
-                    # the comment goes up to i + 1
-                    return code[:i + 2]
-                else:
-                    # end of nested comment
-                    stack = stack[1::]
+            if code[i] == '/':
+                depth += 1
+            elif depth == 1:
+                # end of comment
+                # the comment goes up to i + 1
+                return code[pos:i + 2]
+            else:
+                # end of nested comment
+                depth -= 1
         # shouldn't get here....
         # if it gets here it returns all of the codegenr, unterminated comment
-        return code
+        return code[pos:]
 
     @staticmethod
-    def match(code: str) -> bool:
-        return Comment.pattern.match(code) is not None
+    def match(code: str, pos: int = 0) -> bool:
+        return Comment.pattern.match(code, pos) is not None
@@ -2,6 +2,7 @@ from pycompile.lex.token.token import Token
 
 
 class Final(Token):
+    __slots__ = ()
 
     def __init__(self):
         super().__init__("$", "END")
@@ -1,15 +1,18 @@
 import re
+import sys
 from typing import Pattern
 
 from pycompile.lex.token.token import Token
 
 
 class Id(Token):
-    pattern: Pattern = re.compile('^[a-zA-Z][a-zA-Z0-9_]*')
+    __slots__ = ()
+    pattern: Pattern = re.compile('[a-zA-Z][a-zA-Z0-9_]*')
 
-    def __init__(self, code: str):
-        super().__init__(Id.pattern.match(code).group(), 'id')
+    def __init__(self, code: str, pos: int = 0):
+        # identifiers repeat all over the code, every occurrence shares the same string
+        super().__init__(sys.intern(Id.pattern.match(code, pos).group()), 'id')
 
     @staticmethod
-    def match(code: str) -> bool:
-        return Id.pattern.match(code) is not None
+    def match(code: str, pos: int = 0) -> bool:
+        return Id.pattern.match(code, pos) is not None
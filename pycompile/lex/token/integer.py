@@ -5,13 +5,14 @@ from pycompile.lex.token.token import Token
 
 
 class Integer(Token):
+    __slots__ = ()
     # pattern to match an integer
     # do not include negative lookaheads because those are encoding special cases
-    pattern: Pattern = re.compile('^([1-9][0-9]*|0)')
+    pattern: Pattern = re.compile('([1-9][0-9]*|0)')
 
-    def __init__(self, code: str):
-        super().__init__(Integer.pattern.match(code).group(), 'intnum')
+    def __init__(self, code: str, pos: int = 0):
+        super().__init__(Integer.pattern.match(code, pos).group(), 'intnum')
 
     @staticmethod
-    def match(code: str) -> bool:
-        return Integer.pattern.match(code) is not None
+    def match(code: str, pos: int = 0) -> bool:
+        return Integer.pattern.match(code, pos) is not None
@@ -5,6 +5,7 @@ from pycompile.lex.token.token import Token
 
 
 class Invalid(Token):
+    __slots__ = ('proper_name',)
 
     num_pattern: Pattern = re.compile('[0-9]')
 
@@ -1,11 +1,13 @@
 import re
+import sys
 from typing import Pattern
 
 from pycompile.lex.token.token import Token
 
 
 class Operator(Token):
-    pattern: Pattern = re.compile('^(==|<>|<=|>=|<|>|\+|-|\*|/|=|\||&|!|\?)')
+    __slots__ = ()
+    pattern: Pattern = re.compile('(==|<>|<=|>=|<|>|\+|-|\*|/|=|\||&|!|\?)')
 
     _NAME_MAP = {
         '==': 'eq',
@@ -25,10 +27,10 @@ class Operator(Token):
         '?': 'qmark'
     }
 
-    def __init__(self, code: str):
-        lexm = Operator.pattern.match(code).group()
+    def __init__(self, code: str, pos: int = 0):
+        lexm = sys.intern(Operator.pattern.match(code, pos).group())
         super().__init__(lexm, Operator._NAME_MAP[lexm])
 
     @staticmethod
-    def match(code: str) -> bool:
-        return Operator.pattern.match(code) is not None
+    def match(code: str, pos: int = 0) -> bool:
+        return Operator.pattern.match(code, pos) is not None
@@ -2,5 +2,7 @@ from pycompile.lex.token.token import Token
 
 
 class Placeholder(Token):
+    __slots__ = ()
+
     def __init__(self, code: str):
         super().__init__('Placeholder', 'Placeholder')
\ No newline at end of file
@@ -1,11 +1,13 @@
 import re
+import sys
 from typing import Pattern
 
 from pycompile.lex.token.token import Token
 
 
 class Punctuation(Token):
-    pattern: Pattern = re.compile('^(\{|\}|\(|\)|\[|\]|;|,|\.|::|:)')
+    __slots__ = ()
+    pattern: Pattern = re.compile('(\{|\}|\(|\)|\[|\]|;|,|\.|::|:)')
 
     _NAME_MAP = {
         '{': 'opencubr',
@@ -21,10 +23,10 @@ class Punctuation(Token):
         ':': 'colon'
     }
 
-    def __init__(self, code: str):
-        lexm = Punctuation.pattern.match(code).group()
+    def __init__(self, code: str, pos: int = 0):
+        lexm = sys.intern(Punctuation.pattern.match(code, pos).group())
         super().__init__(lexm, Punctuation._NAME_MAP[lexm])
 
     @staticmethod
-    def match(code: str) -> bool:
-        return Punctuation.pattern.match(code) is not None
+    def match(code: str, pos: int = 0) -> bool:
+        return Punctuation.pattern.match(code, pos) is not None
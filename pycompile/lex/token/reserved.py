@@ -1,19 +1,21 @@
 import re
+import sys
 from typing import Pattern
 
 from pycompile.lex.token.token import Token
 
 
 class Reserved(Token):
+    __slots__ = ()
     # negative lookahead is necessary here because any reserved keyword that is followed by another valid character
     # becomes an identifier
-    pattern: Pattern = re.compile('^(?!(if|then|else|integer|float|string|void|public|private|func|var|class|while|read|write|return|main|inherits|break|continue)[a-zA-Z_])(if|then|else|integer|float|string|void|public|private|func|var|class|while|read|write|return|main|inherits|break|continue)')
+    pattern: Pattern = re.compile('(?!(if|then|else|integer|float|string|void|public|private|func|var|class|while|read|write|return|main|inherits|break|continue)[a-zA-Z_])(if|then|else|integer|float|string|void|public|private|func|var|class|while|read|write|return|main|inherits|break|continue)')
 
-    def __init__(self, code: str):
+    def __init__(self, code: str, pos: int = 0):
         # reserved keyword is both lexeme and name
-        lexm = Reserved.pattern.match(code).group()
+        lexm = sys.intern(Reserved.pattern.match(code, pos).group())
         super().__init__(lexm, lexm)
 
     @staticmethod
-    def match(code: str) -> bool:
-        return Reserved.pattern.match(code) is not None
+    def match(code: str, pos: int = 0) -> bool:
+        return Reserved.pattern.match(code, pos) is not None
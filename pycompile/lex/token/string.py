@@ -5,11 +5,12 @@ from pycompile.lex.token.token import Token
 
 
 class String(Token):
-    pattern: Pattern = re.compile('^"[a-zA-Z0-9_ ]*"')
+    __slots__ = ()
+    pattern: Pattern = re.compile('"[a-zA-Z0-9_ ]*"')
 
-    def __init__(self, code: str):
-        super().__init__(String.pattern.match(code).group(), 'stringlit')
+    def __init__(self, code: str, pos: int = 0):
+        super().__init__(String.pattern.match(code, pos).group(), 'stringlit')
 
     @staticmethod
-    def match(code: str) -> bool:
-        return String.pattern.match(code) is not None
+    def match(code: str, pos: int = 0) -> bool:
+        return String.pattern.match(code, pos) is not None
@@ -6,31 +6,32 @@ from typing import Union
 
 
 class Token(abc.ABC):
+    # there is one token per lexeme of the code, slots keep them small
+    __slots__ = ('lexeme', 'name', 'position', 'column', 'start', 'end')
 
     def __init__(self, lexeme: str, name: str):
         self.lexeme: str = lexeme
         self.name: str = name
         self.position: Union[int, None] = None
-        self.inserted = False
+        self.column: Union[int, None] = None
+        # offsets of the lexeme in the scanned code, end is exclusive
+        self.start: Union[int, None] = None
+        self.end: Union[int, None] = None
 
-    def replace_self(self, code: str) -> str:
-        # lexm = self.lexeme
-        # try1 = codegenr.replace(lexm, '')
-        return code.replace(self.lexeme, '', 1)
-
-    def set_position(self, line_num: int):
+    def set_position(self, line_num: int, column: int = None):
         self.position = line_num
+        self.column = column
+
+    def set_span(self, start: int, end: int):
+        self.start = start
+        self.end = end
 
     def tok_str(self) -> str:
-        self.inserted = True
         return f'[{self.name}, {self.lexeme}, {self.position if self.position is not None else "Position unassigned"}]'
 
-    def was_inserted(self) -> bool:
-        return self.inserted
-
     def __len__(self):
         return len(self.lexeme)
 
     @staticmethod
-    def match(code: str) -> bool:
+    def match(code: str, pos: int = 0) -> bool:
         ...
@@ -15,8 +15,8 @@ def analyze_test_file(input_file: Path, output_dir: str):
     with open(str(input_file), 'r') as f:
         data = f.read()
 
-    analyzer.tokenize(data)
-    analyzer.write_tokenized(token_name)
+    with open(token_name, 'w') as token_file:
+        analyzer.tokenize(data, token_file)
     analyzer.write_errors(error_name)
 
 
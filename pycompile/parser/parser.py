@@ -1,14 +1,18 @@
-import graphviz
+from __future__ import annotations
+
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import TYPE_CHECKING, Iterable, List, TextIO, Tuple, Union
 
 from pycompile.parser.strategy.helper import Table
 from pycompile.parser.strategy.table import TableParser
+from pycompile.parser.strategy.generated import GeneratedParser
 from pycompile.parser.strategy.strategy import ParsingStrategy
-from pycompile.parser.strategy.recursive import RecursiveDescentParser
 from pycompile.parser.syntax.ast import AbstractSyntaxNode
 from pycompile.parser.syntax.collector import Collector
 
+if TYPE_CHECKING:
+    import graphviz
+
 
 class Parser:
 
@@ -17,50 +21,79 @@ class Parser:
                  code: str = None,
                  grammar: str = None,
                  grammar_file: Union[Path, str] = None,
-                 optional: dict = None):
+                 optional: dict = None,
+                 scanner: str = 'Precedence',
+                 use_table_cache: bool = True):
         self.success: bool = False
         self.strategy: str = strategy
         self.ast: Union[AbstractSyntaxNode, None] = None
-        self.derivation: List[str] = None
-        self.stack_contents: List[str] = None
-        self.gv_ast: graphviz.Digraph = None
+        self.derivation: Iterable[str] = None
+        self.stack_contents: Iterable[str] = None
+        self.collector: Union[Collector, None] = None
 
         parent = Path(__file__).parent
         self.default_config = {
-            'calgaryTableFile': f'{parent}/grammar_files/ucalgary_parse_table.html',
-            'calgaryFirstAndFollow': f'{parent}/grammar_files/ucalgary_first_follow.html',
             'grammar_file': f"{parent}/grammar_files/LL1.paquet.grm"
         }
+        # tables from the ucalgary tool, pass them as optional to use them instead of the generated ones
+        self.calgary_config = {
+            'calgaryTableFile': f'{parent}/grammar_files/ucalgary_parse_table.html',
+            'calgaryFirstAndFollow': f'{parent}/grammar_files/ucalgary_first_follow.html'
+        }
 
         if self.strategy == 'Recursive':
-            self.parser: ParsingStrategy = RecursiveDescentParser(code)
+            # the hand written parser is a large module only this strategy needs
+            from pycompile.parser.strategy.recursive import RecursiveDescentParser
+            self.parser: ParsingStrategy = RecursiveDescentParser(code, scanner)
         else:
             grammar_file = grammar_file if grammar_file is not None else self.default_config['grammar_file']
             optional = optional if optional is not None else self.default_config
-            table = Table.create(grammar=grammar, grammar_file=grammar_file, optional=optional)
-            table.fill_errors()
+            cache_dir = None
+            if use_table_cache:
+                cache_dir = Path(grammar_file).parent / '__pycache__'
+                table = Table.create_cached(grammar=grammar, grammar_file=grammar_file, optional=optional)
+            else:
+                table = Table.create(grammar=grammar, grammar_file=grammar_file, optional=optional)
+                table.fill_errors()
+                table.compile()
             table.validate_semantic_actions()
-            self.parser: ParsingStrategy = TableParser(code, table)
+            table.report_conflicts()
+            if self.strategy == 'Generated':
+                # recursive descent parser generated from the table, its compiled code is cached along with the table
+                self.parser: ParsingStrategy = GeneratedParser.create(code, table, scanner, cache_dir)
+            else:
+                self.parser: ParsingStrategy = TableParser(code, table, scanner)
 
-    def parse(self, code: str = None):
-        self.success, self.ast, self.stack_contents, self.derivation = self.parser.parse(code)
+    def parse(self,
+              code: Union[str, TextIO, Iterable[str]] = None,
+              streaming: bool = False,
+              tokenized: Union[TextIO, List[str]] = None,
+              trace: bool = False):
+        self.success, self.ast, self.stack_contents, self.derivation = self.parser.parse(
+            code, streaming, tokenized, trace
+        )
 
-    def run(self, code: str) -> Tuple[List[str], List[str], List[str], List[str]]:
-        self.parse(code)
+    def run(self, code: str) -> Tuple[List[str], Iterable[str], List[str], Iterable[str]]:
+        self.parse(code, trace=True)
         # collect printable ast
-        collector = Collector()
-        collector.collect(self.ast)
-        self.gv_ast = collector.grph
+        self.collector = Collector()
+        self.collector.collect(self.ast)
         errors = [e.message for e in self.parser.errors]
-        return collector.create_array_repr(), self.stack_contents, errors, self.derivation
+        return self.collector.create_array_repr(), self.stack_contents, errors, self.derivation
+
+    @property
+    def gv_ast(self) -> Union[graphviz.Digraph, None]:
+        # graphviz is only imported when the graph of the last run is asked for
+        return self.collector.grph if self.collector is not None else None
 
     def traverse(self, visitor):
         """
+        Visits the whole ast without recursion, see AbstractSyntaxNode.walk
 
         :param visitor :
         :return:
         """
-        self.ast.accept(visitor)
+        self.ast.walk(visitor)
         visitor.finish()
 
 
@@ -0,0 +1,198 @@
+"""
+Recursive descent parsers generated from the LL(1) table of a grammar, semantic actions included.
+The generated parser builds the same ast and reports the same errors as the TableParser,
+but every non-terminal is a method and every terminal an inline comparison instead of a lookup on a stack
+"""
+import os
+import re
+import sys
+import marshal
+import hashlib
+from abc import abstractmethod
+from pathlib import Path
+from types import CodeType
+from typing import Dict, List, Tuple, Type, Union
+from weakref import WeakKeyDictionary
+
+from pycompile.lex.token import *
+from pycompile.parser.strategy.helper import Table
+from pycompile.parser.strategy.table import TableParser
+from pycompile.parser.syntax.ast import NodeStack
+from pycompile.parser.syntax.factory import AbstractSyntaxNodeFactory
+
+
+class GeneratedParser(TableParser):
+    """
+    What the generated parsers have in common. Recovery is the one of the TableParser, for the symbol
+    the generated code could not match, so neither the stack contents nor the derivation are recorded
+    """
+
+    # the generated parser classes, by source and by the tables they were generated for
+    generated: Dict[str, Type['GeneratedParser']] = {}
+    generated_for: 'WeakKeyDictionary[Table, Type[GeneratedParser]]' = WeakKeyDictionary()
+
+    def _parse(self):
+        self.semantic_stack = NodeStack()
+        self.next_token()
+        self.start()
+        if len(self.semantic_stack) > 0:
+            self.ast = self.semantic_stack.pop()
+        self.success = isinstance(self.current_token, Final) and not self.encountered_error
+
+    @abstractmethod
+    def start(self):
+        # the method of the start symbol, generated method names all begin with parse_ so they never hide it
+        ...
+
+    def predict(self, row: Tuple[int, ...]) -> int:
+        """
+        Id of the production to expand with given the row of the table for the non-terminal, -1 if there is none
+        """
+        token = self.current_token
+        if isinstance(token, Final):
+            return -1
+        term = self.table.class_ids.get(token.__class__)
+        if term is None:
+            term = self.table.terminal_ids[token.lexeme]
+        return row[term]
+
+    def expect(self, symbol: Union[str, Type[Token]]):
+        # the terminal did not match, recover until it does or until it has to be skipped
+        while not self.resync(symbol):
+            if self.table.terminal_match(symbol, self.current_token):
+                self.next_token()
+                return
+
+    def resync(self, symbol: Union[str, Type[Token]]) -> bool:
+        self.encountered_error = True
+        _, skipped = self.recover(symbol, self.current_token)
+        return skipped
+
+    @staticmethod
+    def create(code: str = None,
+               table: Table = None,
+               scanner: str = 'Precedence',
+               cache_dir: Union[str, Path] = None) -> 'GeneratedParser':
+        """
+        Generates the parser for the table and gives an instance of it. The parser classes are kept for
+        as long as the process runs, and their compiled code in cache_dir when there is one
+        """
+        parser_class = GeneratedParser.generated_for.get(table)
+        if parser_class is None:
+            source = ParserGenerator(table).generate()
+            parser_class = GeneratedParser.generated.get(source)
+            if parser_class is None:
+                namespace = {}
+                exec(GeneratedParser.__compile(source, cache_dir), namespace)
+                parser_class = namespace['LL1Parser']
+                GeneratedParser.generated[source] = parser_class
+            GeneratedParser.generated_for[table] = parser_class
+        return parser_class(code, table, scanner)
+
+    @staticmethod
+    def __compile(source: str, cache_dir: Union[str, Path, None]) -> CodeType:
+        if cache_dir is None:
+            return compile(source, '<generated parser>', 'exec')
+        digest = hashlib.sha256(source.encode()).hexdigest()
+        # marshalled code is only readable by the same version of python
+        cache_file = Path(cache_dir) / f'parser-{digest}.{sys.implementation.cache_tag}.marshal'
+        try:
+            with open(cache_file, 'rb') as f:
+                return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        code = compile(source, '<generated parser>', 'exec')
+        try:
+            # same as the table, never let another process read half of the code
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(temp_file, 'wb') as f:
+                marshal.dump(code, f)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            pass
+        return code
+
+
+class ParserGenerator:
+    """
+    Writes the source of a recursive descent parser for a compiled table: one method per non-terminal that predicts
+    the production from the row of the table for the non-terminal, then matches its symbols in order
+    """
+
+    indent: str = '    '
+
+    def __init__(self, table: Table):
+        self.table: Table = table
+        self.method_names: Dict[str, str] = {}
+        for non_term in table.non_terminal_ids.keys():
+            name = 'parse_' + re.sub(r'\W', '_', non_term).lower()
+            while name in self.method_names.values():
+                name += '_'
+            self.method_names[non_term] = name
+
+    def generate(self) -> str:
+        lines = [
+            '# generated by pycompile.parser.strategy.generated.ParserGenerator, do not edit',
+            'from pycompile.lex.token import *',
+            'from pycompile.parser.strategy.generated import GeneratedParser',
+            'from pycompile.parser.syntax.factory import AbstractSyntaxNodeFactory',
+            '',
+        ]
+        for non_term, non_term_id in self.table.non_terminal_ids.items():
+            lines.append(f'{self.__row_name(non_term)} = {tuple(self.table.predictions[non_term_id])}')
+        lines += ['', '', 'class LL1Parser(GeneratedParser):', '']
+        lines += self.__method('start', [f'self.{self.method_names["START"]}()'])
+        for non_term in self.table.non_terminal_ids.keys():
+            lines += self.__non_terminal(non_term)
+        return '\n'.join(lines) + '\n'
+
+    def __method(self, name: str, body: List[str]) -> List[str]:
+        return [f'{self.indent}def {name}(self):'] + [self.indent * 2 + line for line in body] + ['']
+
+    def __row_name(self, non_term: str) -> str:
+        return self.method_names[non_term][len('parse_'):].upper()
+
+    def __non_terminal(self, non_term: str) -> List[str]:
+        row = self.table.predictions[self.table.non_terminal_ids[non_term]]
+        body = ['while True:', f'{self.indent}production = self.predict({self.__row_name(non_term)})']
+        for production_id in sorted(set(row) - {-1}):
+            production = self.table.productions[production_id]
+            body.append(f'{self.indent}if production == {production_id}:')
+            body.append(f'{self.indent * 2}# {non_term} ::= {" ".join(map(self.__symbol_repr, production))}')
+            for symbol in production:
+                body += [self.indent * 2 + line for line in self.__symbol(symbol)]
+            body.append(f'{self.indent * 2}return')
+        # nothing to predict, recover and try again unless the non-terminal has to be skipped
+        body.append(f'{self.indent}if self.resync({non_term!r}):')
+        body.append(f'{self.indent * 2}return')
+        return self.__method(self.method_names[non_term], body)
+
+    def __symbol(self, symbol: Union[str, Type[Token]]) -> List[str]:
+        if self.table.is_semantic_action(symbol):
+            build = AbstractSyntaxNodeFactory.ACTION_MAP.get(symbol)
+            if build is None:
+                # no factory method, the name itself goes on the semantic stack
+                return [f'self.semantic_stack.push({str(symbol)!r})']
+            args = 'self.current_token, self.previous_token, self.semantic_stack'
+            return [f'self.semantic_stack.push(AbstractSyntaxNodeFactory.{build.__name__}({args}))']
+        if symbol in self.table.rules:
+            return [f'self.{self.method_names[symbol]}()']
+        # terminal, same test as Table.terminal_match
+        mapped = self.table.mappings.get(symbol, symbol)
+        if mapped in self.table.type_lookup.values():
+            test = f'isinstance(self.current_token, {mapped.__name__})'
+        else:
+            test = f'self.current_token.lexeme == {symbol!r}'
+        return [
+            f'if {test}:',
+            f'{self.indent}self.next_token()',
+            'else:',
+            f'{self.indent}self.expect({self.__symbol_repr(symbol, code=True)})',
+        ]
+
+    @staticmethod
+    def __symbol_repr(symbol: Union[str, Type[Token]], code: bool = False) -> str:
+        if isinstance(symbol, str):
+            return repr(symbol) if code else symbol
+        return symbol.__name__
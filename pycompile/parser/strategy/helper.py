@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-import pandas as pd
+import os
+import pickle
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Tuple, Type, Union
 
 from pycompile.lex.token import *
-from pycompile.parser.syntax.factory import AbstractSyntaxNodeFactory
+from pycompile.parser.syntax.factory import AbstractSyntaxNodeFactory, SemanticAction
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Table:
@@ -18,6 +23,19 @@ class Table:
         self.first_sets: Dict[str, List[str]] = {}
         self.follow_sets: Dict[str, List[str]] = {}
         self.parse_table: Dict[str, Dict[Union[str, Token]]] = {}
+        # dense version of the parse table, built by compile
+        self.non_terminal_ids: Dict[str, int] = {}
+        self.terminal_ids: Dict[Union[str, Type[Token]], int] = {}
+        self.class_ids: Dict[Type[Token], int] = {}
+        self.productions: List[List[str]] = []
+        self.predictions: List[List[int]] = []
+        self.semantic_action_set: FrozenSet[str] = frozenset()
+        # first and follow sets of the non-terminals as bitsets over set_ids, also built by compile
+        self.set_ids: Dict[Union[str, Type[Token]], int] = {}
+        self.first_bits: Dict[str, int] = {}
+        self.follow_bits: Dict[str, int] = {}
+        self.epsilon_bit: int = 0
+        self.conflicts: List[str] = []
         self.mappings: Dict = {
             "id": Id,
             "intNum": Integer,
@@ -82,7 +100,8 @@ class Table:
                grammar_file: Union[str, Path] = None) -> Table:
         """
         :param grammar: the grammar
-        :param optional: first and follow sets
+        :param optional: first and follow sets and parse table generated by the ucalgary tool,
+                         they are generated from the grammar when not given
         :param grammar_file: file to load from instead
         :return:
         """
@@ -93,11 +112,67 @@ class Table:
         elif grammar_file is not None:
             table.__load(grammar_file)
 
+        if len(table.rules) > 0 and (optional is None or 'calgaryTableFile' not in optional.keys()):
+            table.generate()
+
         if optional is not None:
             table.__ingest_optional(optional)
 
         return table
 
+    @staticmethod
+    def create_cached(grammar: str = None,
+                      optional: dict = None,
+                      grammar_file: Union[str, Path] = None,
+                      cache_dir: Union[str, Path] = None) -> Table:
+        """
+        Same as create followed by fill_errors and compile, the table is pickled in cache_dir
+        and only built again when the grammar files (or this module) change
+
+        :param cache_dir: defaults to the __pycache__ directory next to the grammar file
+        """
+        if cache_dir is None:
+            cache_dir = Path(grammar_file).parent if grammar_file is not None else Path(__file__).parent
+            cache_dir = cache_dir / '__pycache__'
+        cache_file = Path(cache_dir) / f'table-{Table.cache_key(grammar, optional, grammar_file)}.pickle'
+        try:
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            # a table pickled before the classes it refers to were renamed or moved is built again
+            pass
+        table = Table.create(grammar=grammar, optional=optional, grammar_file=grammar_file)
+        table.fill_errors()
+        table.compile()
+        try:
+            # write to a temporary file first so another process never reads half a table
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+            temp_file = cache_file.with_suffix(f'.{os.getpid()}.tmp')
+            with open(temp_file, 'wb') as f:
+                pickle.dump(table, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except OSError:
+            # the cache is only an optimization, a read only install just builds the table every time
+            pass
+        return table
+
+    @staticmethod
+    def cache_key(grammar: str = None, optional: dict = None, grammar_file: Union[str, Path] = None) -> str:
+        digest = hashlib.sha256()
+        # the code building the table is part of the key, changing it invalidates the cache
+        digest.update(Path(__file__).read_bytes())
+        # the grammar is the text itself, the other sources are files
+        digest.update(b'grammar')
+        digest.update(repr(grammar).encode())
+        files = [('grammar_file', grammar_file)] + sorted((optional if optional is not None else {}).items())
+        for name, source in files:
+            digest.update(name.encode())
+            if source is not None and Path(source).is_file():
+                digest.update(Path(source).read_bytes())
+            else:
+                digest.update(repr(source).encode())
+        return digest.hexdigest()[:16]
+
     def __load(self, file: Union[str, Path]):
         with open(file, 'r') as g_f:
             grammar = g_f.read()
@@ -111,6 +186,7 @@ class Table:
             self.load_calgary_first_follow(optional['calgaryFirstAndFollow'])
 
     def load_calgary_table(self, file_name: Union[str, Path]):
+        import pandas as pd
         if 'calgary' not in self.rule_translations.keys():
             self.translate_calgary(file_name)
         # use pandas to load table as df
@@ -145,6 +221,7 @@ class Table:
             return self.mappings.get(first_trans, first_trans)
 
     def translate_calgary(self, file_name: Union[str, Path]):
+        import pandas as pd
         mapping = {}
         temp_map = {}
         terms = set()
@@ -173,6 +250,7 @@ class Table:
         self.rule_translations['ucalgary'] = mapping
 
     def load_calgary_first_follow(self, file_name: Union[str, Path]):
+        import pandas as pd
         # use pandas to load table as df
         df = pd.read_html(file_name)[2]
         for _, row in df.iterrows():
@@ -256,12 +334,172 @@ class Table:
             for terminal in self.terminals:
                 self.parse_table[non_terminal][terminal] = None
 
+    def generate(self):
+        """
+        Computes the first and follow sets of every non-terminal with a fixed-point iteration over the rules,
+        then fills the LL(1) parse table. When two productions claim the same entry,
+        the first one is kept and the conflict is added to self.conflicts
+        """
+        nullable = set()
+        first_sets = {non_term: [] for non_term in self.non_terminals}
+        changed = True
+        while changed:
+            changed = False
+            for non_term in self.non_terminals:
+                for production in self.rules[non_term].values():
+                    symbols = self.__grammar_symbols(production)
+                    first, is_nullable = self.__first_of_sequence(symbols, first_sets, nullable)
+                    changed = Table.__extend(first_sets[non_term], first) or changed
+                    if is_nullable and non_term not in nullable:
+                        nullable.add(non_term)
+                        changed = True
+
+        follow_sets = {non_term: [] for non_term in self.non_terminals}
+        changed = True
+        while changed:
+            changed = False
+            for non_term in self.non_terminals:
+                for production in self.rules[non_term].values():
+                    symbols = self.__grammar_symbols(production)
+                    for i, symbol in enumerate(symbols):
+                        if symbol not in self.rules:
+                            continue
+                        # whatever can start the rest of the production follows the symbol
+                        first, is_nullable = self.__first_of_sequence(symbols[i + 1:], first_sets, nullable)
+                        changed = Table.__extend(follow_sets[symbol], first) or changed
+                        if is_nullable:
+                            changed = Table.__extend(follow_sets[symbol], follow_sets[non_term]) or changed
+
+        for non_term in self.non_terminals:
+            self.first_sets[non_term] = first_sets[non_term] + (['EPSILON'] if non_term in nullable else [])
+            self.follow_sets[non_term] = follow_sets[non_term]
+
+        self.conflicts = []
+        for non_term in self.non_terminals:
+            for production in self.rules[non_term].values():
+                symbols = self.__grammar_symbols(production)
+                first, is_nullable = self.__first_of_sequence(symbols, first_sets, nullable)
+                predicted = first + (follow_sets[non_term] if is_nullable else [])
+                for terminal in predicted:
+                    existing = self.parse_table[non_term].get(terminal)
+                    if existing is None:
+                        self.parse_table[non_term][terminal] = symbols
+                    elif existing != symbols:
+                        self.conflicts.append(
+                            f'{non_term} on {Table.__symbol_repr(terminal)}: '
+                            f'[{Table.__symbols_repr(existing)}] and [{Table.__symbols_repr(symbols)}]'
+                        )
+
+    def __grammar_symbols(self, production: List[str]) -> List[Union[str, Type[Token]]]:
+        # the production without its semantic actions, an empty production is the empty list
+        return [symbol for symbol in production if symbol != 'EPSILON' and symbol not in self.semantic_actions]
+
+    def __first_of_sequence(self, symbols: List, first_sets: Dict[str, List], nullable: set) -> Tuple[List, bool]:
+        first = []
+        for symbol in symbols:
+            if symbol not in self.rules:
+                Table.__extend(first, [symbol])
+                return first, False
+            Table.__extend(first, first_sets[symbol])
+            if symbol not in nullable:
+                return first, False
+        return first, True
+
+    @staticmethod
+    def __extend(items: List, new_items: List) -> bool:
+        # keeps the order in which the items are found, which is the order used in the error messages
+        added = False
+        for item in new_items:
+            if item not in items:
+                items.append(item)
+                added = True
+        return added
+
+    @staticmethod
+    def __symbol_repr(symbol: Union[str, Type[Token]]) -> str:
+        return symbol if isinstance(symbol, str) else symbol.__name__
+
+    @staticmethod
+    def __symbols_repr(symbols: List) -> str:
+        return ' '.join([Table.__symbol_repr(symbol) for symbol in symbols])
+
+    def report_conflicts(self):
+        if len(self.conflicts) > 0:
+            print('The grammar is not LL(1), the following parse table entries are in conflict')
+            for conflict in self.conflicts:
+                print(f'  {conflict}')
+
     def fill_errors(self):
         for non_terminal in self.non_terminals:
             for terminal in self.terminals:
                 if self.parse_table[non_terminal][terminal] is None:
                     self.parse_table[non_terminal][terminal] = 'Error'
 
+    def compile(self):
+        """
+        Numbers the non-terminals and terminals and turns the parse table into a list of rows indexed by those ids,
+        each entry is the id of the production to expand (semantic actions included) or -1 for an error.
+        The semantic actions of the productions are resolved to the factory methods building their nodes
+        """
+        self.non_terminal_ids = {non_term: i for i, non_term in enumerate(self.parse_table.keys())}
+        self.terminal_ids = {}
+        for row in self.parse_table.values():
+            for term in row.keys():
+                if term not in self.terminal_ids:
+                    self.terminal_ids[term] = len(self.terminal_ids)
+        # tokens of these classes are looked up by their class instead of their lexeme
+        self.class_ids = {
+            token_class: self.terminal_ids[token_class]
+            for token_class in self.type_lookup.values()
+            if token_class in self.terminal_ids
+        }
+        self.productions = []
+        self.predictions = []
+        production_ids = {}
+        actions = {action: SemanticAction(action) for action in self.semantic_actions}
+        for non_term, row in self.parse_table.items():
+            predictions = [-1] * len(self.terminal_ids)
+            for term, rhs in row.items():
+                if rhs is None or rhs == 'Error':
+                    continue
+                production = [actions.get(symbol, symbol) for symbol in self.get_with_semantic_actions(non_term, rhs)]
+                if tuple(production) not in production_ids:
+                    production_ids[tuple(production)] = len(self.productions)
+                    self.productions.append(production)
+                predictions[self.terminal_ids[term]] = production_ids[tuple(production)]
+            self.predictions.append(predictions)
+        self.semantic_action_set = frozenset(self.semantic_actions)
+        self.__compile_sets()
+
+    def __compile_sets(self):
+        # every terminal (and EPSILON) found in a first or follow set gets a bit
+        self.set_ids = {}
+        for sets in (self.first_sets, self.follow_sets):
+            for items in sets.values():
+                for item in items:
+                    if item not in self.set_ids:
+                        self.set_ids[item] = len(self.set_ids)
+        # the sets of terminals are not looked up, see get_first_for_symbol
+        self.first_bits = {
+            non_term: self.__to_bits(items) for non_term, items in self.first_sets.items() if non_term in self.rules
+        }
+        self.follow_bits = {
+            non_term: self.__to_bits(items) for non_term, items in self.follow_sets.items() if non_term in self.rules
+        }
+        self.epsilon_bit = self.__to_bits(['EPSILON']) if 'EPSILON' in self.set_ids else 0
+
+    def __to_bits(self, items: List) -> int:
+        bits = 0
+        for item in items:
+            bits |= 1 << self.set_ids[item]
+        return bits
+
+    def __set_bit(self, token: Token) -> int:
+        # tokens with a value are in the sets by their class, the others by their lexeme
+        key = token.__class__ if isinstance(token, (Float, Integer, String, Id)) else token.lexeme
+        set_id = self.set_ids.get(key)
+        return 1 << set_id if set_id is not None else 0
+
     def __create(self, rule: str):
         self.__check(rule, self.rules, dict)
         self.__check(rule, self.first_sets, list)
@@ -272,13 +510,17 @@ class Table:
         if k not in d.keys():
             d[k] = val_type()
 
-    def get(self, non_term: str, terminal: Token):
-        if isinstance(terminal, (Float, Integer, String, Id)):
-            using = terminal.__class__.__name__
-            using = self.type_lookup[using]
-        else:
-            using = terminal.lexeme
-        return self.get_with_semantic_actions(non_term, self.parse_table[non_term][using])
+    def get(self, non_term: str, terminal: Token) -> List[str]:
+        return self.productions[self.predict(non_term, terminal)]
+
+    def predict(self, non_term: str, terminal: Token) -> int:
+        """
+        Id of the production to expand non_term with when the terminal is next, -1 if there is none
+        """
+        term = self.class_ids.get(terminal.__class__)
+        if term is None:
+            term = self.terminal_ids[terminal.lexeme]
+        return self.predictions[self.non_terminal_ids[non_term]][term]
 
     def get_with_semantic_actions(self, rule, rhs):
         possible = self.rules[rule].values()
@@ -306,7 +548,7 @@ class Table:
         return match
 
     def is_terminal(self, symbol: str) -> bool:
-        return symbol not in self.rules.keys() and symbol not in self.semantic_actions
+        return symbol not in self.rules and symbol not in self.semantic_action_set
 
     def lookup(self, non_term: str, term: str) -> Union[List[Union[str, Token]], str]:
         return self.parse_table[non_term][term]
@@ -319,6 +561,9 @@ class Table:
             return token.lexeme == symbol
 
     def in_first(self, symbol: str, token: Token) -> bool:
+        bits = self.first_bits.get(symbol)
+        if bits is not None:
+            return bits & self.__set_bit(token) != 0
         if isinstance(token, (Float, Integer, String, Id)):
             using = token.__class__.__name__
             using = self.type_lookup[using]
@@ -327,6 +572,9 @@ class Table:
         return using in self.get_first_for_symbol(symbol)
 
     def in_follow(self, symbol: str, token: Token) -> bool:
+        bits = self.follow_bits.get(symbol)
+        if bits is not None:
+            return bits & self.__set_bit(token) != 0
         if isinstance(token, (Float, Integer, String, Id)):
             using = token.__class__.__name__
             using = self.type_lookup[using]
@@ -335,22 +583,26 @@ class Table:
         return using in self.get_follow_for_symbol(symbol)
 
     def epsilon_in_first(self, symbol: str) -> bool:
+        bits = self.first_bits.get(symbol)
+        if bits is not None:
+            return bits & self.epsilon_bit != 0
         return 'EPSILON' in self.get_first_for_symbol(symbol)
 
     def get_first_for_symbol(self, symbol: Union[str, Token]) -> List:
-        if isinstance(symbol, str) and symbol not in self.rules.keys():
+        # terminals are either names or token classes, only non-terminals have rules
+        if symbol not in self.rules:
             return [symbol]
         else:
             return self.first_sets[symbol]
 
     def get_follow_for_symbol(self, symbol: Union[str, Token]) -> List:
-        if isinstance(symbol, str) and symbol not in self.rules.keys():
+        if symbol not in self.rules:
             return [symbol]
         else:
             return self.follow_sets[symbol]
 
     def is_semantic_action(self, symbol) -> bool:
-        return symbol in self.semantic_actions
+        return symbol in self.semantic_action_set
 
     def validate_semantic_actions(self):
         missing = [action for action in self.semantic_actions if action not in AbstractSyntaxNodeFactory.ACTION_MAP.keys()]
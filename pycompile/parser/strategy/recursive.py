@@ -6,8 +6,8 @@ from pycompile.parser.strategy.strategy import ParsingStrategy
 
 class RecursiveDescentParser(ParsingStrategy):
 
-    def __init__(self, code: str = None):
-        super().__init__(code)
+    def __init__(self, code: str = None, scanner: str = 'Precedence'):
+        super().__init__(code, scanner)
 
     def _parse(self):
         self.set_lookahead()
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Union
+from collections import deque
+from itertools import chain
+from typing import Iterable, Iterator, List, TextIO, Tuple, Union
 
-from pycompile.lex.token import Token
+from pycompile.lex.token import Token, Final
 from pycompile.lex.analyzer import LexicalAnalyzer
 from pycompile.parser.syntax.ast import AbstractSyntaxNode
 from pycompile.parser.syntax.error import SyntaxParsingError
@@ -9,13 +11,18 @@ from pycompile.parser.syntax.error import SyntaxParsingError
 
 class ParsingStrategy(ABC):
 
-    def __init__(self, code: str = None):
+    def __init__(self, code: str = None, scanner: str = 'Precedence'):
         self.code = code
-        self.analyzer: LexicalAnalyzer = LexicalAnalyzer()
+        self.analyzer: LexicalAnalyzer = LexicalAnalyzer(scanner)
         self.current_token_idx: int = -1
+        self.tokens: Union[Iterator[Token], None] = None
+        self.peeked: Union[Token, None] = None
+        self.previous_token: Union[Token, None] = None
         self.current_token: Union[Token, None] = None
         self.lookahead: Union[Token, None] = None
         self.success: bool = False
+        # the stack contents and derivation are only recorded when tracing
+        self.trace: bool = False
         self.rules: List[str] = []
         self.derivation: List[str] = []
         self.errors: List[SyntaxParsingError] = []
@@ -24,16 +31,35 @@ class ParsingStrategy(ABC):
     def reset(self, code: str):
         self.code = code
 
-    def parse(self, code: str = None) -> Tuple[bool, AbstractSyntaxNode, List[str], List[str]]:
+    def parse(self,
+              code: Union[str, TextIO, Iterable[str]] = None,
+              streaming: bool = False,
+              tokenized: Union[TextIO, List[str]] = None,
+              trace: bool = False) -> Tuple[bool, AbstractSyntaxNode, Iterable[str], Iterable[str]]:
+        """
+        When streaming, the code can also be a file object or chunks of code,
+        tokens are then scanned only when the parser asks for them and never stored in the analyzer.
+        The tokenized code is written to tokenized when it is given,
+        the stack contents and the derivation are only recorded when tracing
+        """
         if code is not None:
             self.reset(code)
+        self.trace = trace
         if self.code is None:
             raise ValueError("No codegenr to parse")
-        # tokenize and parse
-        self.analyzer.tokenize(self.code)
-        self.analyzer.add_final_token()
-        self.analyzer.remove_comments()
-        self._parse()
+        if streaming:
+            self.tokens = chain(self.analyzer.iter_tokens(self.code, tokenized=tokenized), [Final()])
+        else:
+            # tokenize and parse
+            self.analyzer.tokenize(self.code, tokenized)
+            self.analyzer.add_final_token()
+            self.analyzer.remove_comments()
+            self.tokens = iter(self.analyzer.tokens)
+        try:
+            self._parse()
+        finally:
+            # the parser can stop before the end of the code, the rest is still scanned for lexical errors
+            deque(self.tokens, maxlen=0)
         return self.success, self.ast, self.rules, self.derivation
 
     @abstractmethod
@@ -42,12 +68,24 @@ class ParsingStrategy(ABC):
 
     def move(self):
         self.current_token_idx += 1
-        self.current_token = self.analyzer.tokens[self.current_token_idx]
-        if self.current_token_idx + 1 != len(self.analyzer):
-            self.lookahead = self.analyzer.tokens[self.current_token_idx + 1]
+        self.previous_token = self.current_token
+        self.current_token = ParsingStrategy.next_token(self)
+        self.peeked = None
+        following = self.peek()
+        if following is not None:
+            self.lookahead = following
 
     def next_token(self) -> Token:
-        return self.analyzer.tokens[self.current_token_idx + 1]
+        token = self.peek()
+        if token is None:
+            raise IndexError('No token left to parse')
+        return token
+
+    def peek(self) -> Union[Token, None]:
+        # only one token past the current one is ever pulled from the analyzer
+        if self.peeked is None:
+            self.peeked = next(self.tokens, None)
+        return self.peeked
 
     def set_lookahead(self):
         self.lookahead = self.next_token()
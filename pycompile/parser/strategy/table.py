@@ -1,26 +1,32 @@
-from typing import Union
+from typing import Tuple, Union
 
 from pycompile.lex.token import *
 from pycompile.utils.stack import Stack
 from pycompile.parser.strategy.helper import Table
 from pycompile.parser.strategy.strategy import ParsingStrategy
+from pycompile.parser.strategy.trace import DerivationTrace, StackTrace
+from pycompile.parser.syntax.ast import NodeStack
 from pycompile.parser.syntax.error import SyntaxParsingError
-from pycompile.parser.syntax.factory import AbstractSyntaxNodeFactory
+from pycompile.parser.syntax.factory import SemanticAction
 
 
 class TableParser(ParsingStrategy):
 
-    def __init__(self, code: str = None, table: Table = None):
-        super().__init__(code)
+    def __init__(self, code: str = None, table: Table = None, scanner: str = 'Precedence'):
+        super().__init__(code, scanner)
         self.table: Table = table
         self.symbol_stack: Stack = Stack()
-        self.semantic_stack: Stack = Stack()
+        self.semantic_stack: NodeStack = NodeStack()
         self.encountered_error: bool = False
 
     def _parse(self):
+        # every tree is built on a stack of its own, which numbers its nodes
+        self.semantic_stack = NodeStack()
+        if self.trace:
+            self.rules = StackTrace(self.symbol_stack.get_repr)
+            self.derivation = DerivationTrace('START')
         self.push(Final())
         self.push('START')
-        self.derivation = [' % START']
         cur_tok = self.next_token()
         while not isinstance(self.symbol_stack.peek(), Final):
             cur_sym = self.symbol_stack.peek()
@@ -29,7 +35,8 @@ class TableParser(ParsingStrategy):
                 if self.terminal_match(cur_sym, cur_tok):
                     # we have a match
                     old_tok = self.pop()
-                    self.write_to_deriv(f'{self.semantic_stack.get_repr(cur_tok)}', cur_sym, terminal=True)
+                    if self.trace:
+                        self.write_to_deriv(f'{self.semantic_stack.get_repr(cur_tok)}', cur_sym, terminal=True)
                     cur_tok = self.next_token()
                 else:
                     cur_tok = self.__found_error(cur_tok)
@@ -45,7 +52,6 @@ class TableParser(ParsingStrategy):
                     cur_tok = self.__found_error(cur_tok)
         if len(self.semantic_stack) > 0:
             self.ast = self.semantic_stack.pop()
-        self.derivation[-1] = self.derivation[-1].replace(' % ', '')
         # all symbols
         if not isinstance(cur_tok, Final) or self.encountered_error:
             self.success = False
@@ -53,20 +59,17 @@ class TableParser(ParsingStrategy):
             self.success = True
 
     def write_to_deriv(self, item: str, cur_sym: str, terminal=False):
-        sym = self.semantic_stack.get_repr(cur_sym)
-        self.derivation.append(self.derivation[-1])
-        beg, end = self.derivation[-1].split(' % ')
-        first, second = (' % ', '') if not terminal else ('', ' % ')
-        self.derivation[-1] = beg + first + end.replace(sym, item + second, 1)
-        self.derivation[-2] = self.derivation[-2].replace(' % ', '')
-
-    def push(self, item: Union[Token, str]):
+        self.derivation.derive(item, self.semantic_stack.get_repr(cur_sym), terminal)
+
+    def push(self, item: Union[Token, str], snapshot: bool = True):
         self.symbol_stack.push(item)
-        self.rules.append(self.symbol_stack.contents())
+        if self.trace:
+            self.rules.push(item, snapshot)
 
     def pop(self):
         item = self.symbol_stack.pop()
-        self.rules.append(self.symbol_stack.contents())
+        if self.trace:
+            self.rules.pop()
         return item
 
     def __found_error(self, token: Token) -> Token:
@@ -84,24 +87,19 @@ class TableParser(ParsingStrategy):
 
     def inverse_push(self, token: Token, symbol: str):
         tokens = self.table.get(symbol, token)
-        self.write_inverted_tokens(symbol, tokens)
+        if self.trace:
+            self.write_inverted_tokens(symbol, tokens)
         for i, token in enumerate(tokens[-1::-1]):
-            if i + 1 == len(tokens):
-                self.push(token)
-            else:
-                self.symbol_stack.push(token)
+            # the stack is only traced once the whole production is on it
+            self.push(token, snapshot=i + 1 == len(tokens))
 
     def terminal_match(self,  cur_sym: str, cur_tok: Token) -> bool:
         return self.table.terminal_match(cur_sym, cur_tok)
 
     def non_terminal_match(self, cur_sym: str, cur_tok: Token) -> bool:
-        if isinstance(cur_tok, (Float, Integer, String, Id)):
-            using = type(cur_tok)
-        elif isinstance(cur_tok, Final):
+        if isinstance(cur_tok, Final):
             return False
-        else:
-            using = cur_tok.lexeme
-        return self.table.lookup(cur_sym, using) != 'Error'
+        return self.table.predict(cur_sym, cur_tok) != -1
 
     def is_terminal(self, symbol) -> bool:
         return self.table.is_terminal(symbol)
@@ -112,43 +110,39 @@ class TableParser(ParsingStrategy):
         return next_tok
 
     def skip_errors(self, token: Token) -> Token:
+        token, skipped = self.recover(self.symbol_stack.peek(), token)
+        if skipped:
+            self.pop()
+        return token
+
+    def recover(self, symbol: Union[str, Token], token: Token) -> Tuple[Token, bool]:
+        """
+        Panic-mode recovery from a symbol that could not be matched, records the error and
+        gives the token to go on from along with whether the symbol has to be skipped
+        """
         self.errors.append(SyntaxParsingError(
             token,
-            self.table.get_first_for_symbol(self.symbol_stack.peek()),
-            self.table.get_follow_for_symbol(self.symbol_stack.peek())
+            self.table.get_first_for_symbol(symbol),
+            self.table.get_follow_for_symbol(symbol)
         ))
-        if isinstance(token, Final) or self.table.in_first(self.symbol_stack.peek(), token):
-            self.pop()
+        if isinstance(token, Final) or self.table.in_first(symbol, token):
             if not isinstance(token, Final):
                 token = self.next_token()
-        else:
-            breaker = True
-            while breaker:
-                if (
-                    isinstance(token, Final) or
-                    self.table.in_first(self.symbol_stack.peek(), token) or
-                    (
-                        self.table.epsilon_in_first(self.symbol_stack.peek()) and
-                        self.table.in_follow(self.symbol_stack.peek(), token)
-                    )
-                ):
-                    breaker = False
-                    break
-                # scan
-                token = self.next_token()
-        return token
+            return token, True
+        # the symbol stays on top of the stack while scanning, so whether it can follow is only checked once
+        can_skip = self.table.epsilon_in_first(symbol)
+        while not (
+            isinstance(token, Final) or
+            self.table.in_first(symbol, token) or
+            (can_skip and self.table.in_follow(symbol, token))
+        ):
+            # scan
+            token = self.next_token()
+        return token, False
 
     def is_semantic_action(self, cur_sym: Union[str, Token]) -> bool:
         return self.table.is_semantic_action(cur_sym)
 
-    def process_semantic_action(self, cur_sym: str, token: Token):
+    def process_semantic_action(self, cur_sym: SemanticAction, token: Token):
         self.pop()
-        # self.semantic_stack.push(cur_sym)
-        # return
-        node = AbstractSyntaxNodeFactory.create(
-            cur_sym,
-            token,
-            self.analyzer.tokens[self.current_token_idx - 1],
-            self.semantic_stack
-        )
-        self.semantic_stack.push(node)
+        self.semantic_stack.push(cur_sym.build(token, self.previous_token, self.semantic_stack))
@@ -0,0 +1,71 @@
+"""
+Traces of a table driven parse, recorded as the changes made at every step and only rendered when iterated over
+"""
+from typing import Any, Callable, Iterator, List, Tuple
+
+
+class StackTrace:
+    """
+    The contents of the symbol stack after every push and pop of the parser, one line per snapshot
+    """
+
+    # markers in between the pushed items
+    POP = object()
+    SNAPSHOT = object()
+
+    def __init__(self, get_repr: Callable[[Any], str]):
+        self.get_repr: Callable[[Any], str] = get_repr
+        self.changes: list = []
+
+    def push(self, item: Any, snapshot: bool = True):
+        self.changes.append(item)
+        if snapshot:
+            self.changes.append(StackTrace.SNAPSHOT)
+
+    def pop(self):
+        self.changes.append(StackTrace.POP)
+        self.changes.append(StackTrace.SNAPSHOT)
+
+    def __iter__(self) -> Iterator[str]:
+        # replay the changes on the representations of the stack items
+        items = []
+        for change in self.changes:
+            if change is StackTrace.SNAPSHOT:
+                yield ', '.join(items)
+            elif change is StackTrace.POP:
+                items.pop()
+            else:
+                items.append(self.get_repr(change))
+
+    def __len__(self):
+        return sum([1 for change in self.changes if change is StackTrace.SNAPSHOT])
+
+
+class DerivationTrace:
+    """
+    The sentential forms of a leftmost derivation, ' % ' marks how far the current form was derived
+    """
+
+    marker: str = ' % '
+
+    def __init__(self, start: str):
+        self.start: str = start
+        # (replacement, replaced symbol, whether a terminal was matched)
+        self.steps: List[Tuple[str, str, bool]] = []
+
+    def derive(self, item: str, symbol: str, terminal: bool = False):
+        self.steps.append((item, symbol, terminal))
+
+    def __iter__(self) -> Iterator[str]:
+        marker = DerivationTrace.marker
+        form = marker + self.start
+        for item, symbol, terminal in self.steps:
+            # the marker is only used while deriving, it is never written out
+            yield form.replace(marker, '')
+            beg, end = form.split(marker)
+            first, second = (marker, '') if not terminal else ('', marker)
+            form = beg + first + end.replace(symbol, item + second, 1)
+        yield form.replace(marker, '')
+
+    def __len__(self):
+        return len(self.steps) + 1
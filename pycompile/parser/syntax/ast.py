@@ -3,7 +3,8 @@ Define the base classes
 """
 from __future__ import annotations
 
-from typing import List, Union, Tuple
+from itertools import count
+from typing import Iterator, List, Union, Tuple
 
 from pycompile.lex.token import *
 from pycompile.utils.stack import Stack
@@ -12,7 +13,12 @@ from pycompile.utils.stack import Stack
 class AbstractSyntaxNode:
     NUM_NODES: Union[int, Tuple[int, int]] = -1
     CHILDREN: List[str] = []
-    NODE_COUNT = 0
+
+    # every node class names the attributes it sets, nodes have no __dict__
+    __slots__ = (
+        'unique_id', 'parent', 'siblings', 'right_sibling', 'leftmost_sibling',
+        'sem_rec', 'type_rec', 'type_position', 'sym_table', 'temp_var', 'children',
+    )
 
     def __init__(self,
                  parent: AbstractSyntaxNode = None,
@@ -21,29 +27,28 @@ class AbstractSyntaxNode:
                  right_sibling: AbstractSyntaxNode = None,
                  **kwargs,
                  ):
-        self.unique_id = AbstractSyntaxNode.__generate_unique_id()
+        # given by the NodeStack the node is pushed on, unique within the tree
+        self.unique_id: Union[int, None] = None
         self.parent: AbstractSyntaxNode = parent
         self.siblings: List[AbstractSyntaxNode] = siblings
         self.right_sibling: AbstractSyntaxNode = right_sibling
         self.leftmost_sibling: AbstractSyntaxNode = leftmost_sibling
         self.sem_rec = None
         self.type_rec = None
+        # the line the type of the node comes from, the type records are shared between nodes
+        self.type_position = None
         self.sym_table = None
         self.temp_var = None
+        # filled in by get_children, once the node class has set its children
+        self.children: Union[Tuple[AbstractSyntaxNode, ...], None] = None
 
-        for key, item in kwargs.items():
+        for item in kwargs.values():
             if isinstance(item, AbstractSyntaxNode):
                 item.parent = self
             elif isinstance(item, list) and len(item) > 0 and isinstance(item[0], AbstractSyntaxNode):
                 for list_item in item:
                     list_item.parent = self
 
-    @staticmethod
-    def __generate_unique_id():
-        node_id = AbstractSyntaxNode.NODE_COUNT
-        AbstractSyntaxNode.NODE_COUNT += 1
-        return node_id
-
     def make_sibling(self, node):
         ...
 
@@ -60,9 +65,9 @@ class AbstractSyntaxNode:
         children = '  |  '.join(self.CHILDREN)
         name = self.__class__.__name__
         lines = [name]
-        if 'operator' in self.__dict__.keys():
+        if hasattr(self, 'operator'):
             lines.append(f'Operation: {self.operator}')
-        if 'token' in self.__dict__.keys() and self.token.lexeme is not None:
+        if hasattr(self, 'token') and self.token.lexeme is not None:
             lines.append(f'Token: {self.token.lexeme}')
         if len(children) > 0:
             lines.append(children)
@@ -83,9 +88,9 @@ class AbstractSyntaxNode:
         children = '  |  '.join(self.CHILDREN)
         name = self.__class__.__name__
         lines = [name]
-        if 'operator' in self.__dict__.keys():
+        if hasattr(self, 'operator'):
             lines.append(f'Operation: {self.operator}')
-        if 'token' in self.__dict__.keys() and self.token.lexeme is not None:
+        if hasattr(self, 'token') and self.token.lexeme is not None:
             lines.append(f'Token: {self.token.lexeme}')
         lines.append(children)
         ln = max([len(l) for l in lines])
@@ -95,25 +100,34 @@ class AbstractSyntaxNode:
         return '\n'.join(self.as_array())
 
     def collect(self, collector, level, parent_name=None):
-        # do graph viz stuff
-        viz_name = self.__class__.__name__
-        if viz_name not in collector.node_names.keys():
-            collector.node_names[viz_name] = 0
-        node_name = f'{viz_name}{collector.node_names[viz_name] + 1}'
-        collector.node_names[viz_name] += 1
-        if 'token' in self.__dict__.keys() and self.token is not None:
-            collector.grph.node(node_name, self.token.lexeme)
-        else:
-            collector.grph.node(node_name)
-        if parent_name is not None:
-            collector.grph.edge(parent_name, node_name)
-        # do manual viz stuff
-        collector.add(self, level)
-        for child in self.get_children():
-            child.collect(collector, level + 1, node_name)
+        """
+        Adds the node and the ones under it to the collector, parents before their children, with a stack of its own
+        like walk so the depth of the tree is not bound by the recursion limit
+        """
+        stack = [(self, level, parent_name)]
+        while stack:
+            node, node_level, node_parent = stack.pop()
+            # do graph viz stuff
+            viz_name = node.__class__.__name__
+            if viz_name not in collector.node_names.keys():
+                collector.node_names[viz_name] = 0
+            node_name = f'{viz_name}{collector.node_names[viz_name] + 1}'
+            collector.node_names[viz_name] += 1
+            if hasattr(node, 'token') and node.token is not None:
+                collector.node(node_name, node.token.lexeme)
+            else:
+                collector.node(node_name)
+            if node_parent is not None:
+                collector.edge(node_parent, node_name)
+            # do manual viz stuff
+            collector.add(node, node_level)
+            # the first child is collected first
+            for child in reversed(node.get_children()):
+                stack.append((child, node_level + 1, node_name))
 
     def __eq__(self, node: AbstractSyntaxNode):
-        return isinstance(node, AbstractSyntaxNode) and self.unique_id == node.unique_id
+        # ids are only unique within a tree, a node is only ever equal to itself
+        return self is node
 
     def is_child(self, node: AbstractSyntaxNode):
         for child in self.get_children():
@@ -121,16 +135,20 @@ class AbstractSyntaxNode:
                 return True
         return False
 
-    def get_children(self) -> List[AbstractSyntaxNode]:
+    def get_children(self) -> Tuple[AbstractSyntaxNode, ...]:
+        if self.children is not None:
+            return self.children
         the_children = []
         for child in self.CHILDREN:
-            child_prop = self.__dict__[child]
+            child_prop = getattr(self, child)
             if isinstance(child_prop, AbstractSyntaxNode):
                 the_children.append(child_prop)
             elif isinstance(child_prop, list) and len(child_prop) > 0:
                 for small_child in child_prop:
                     the_children.append(small_child)
-        return the_children
+        # the children of a node never change once it is built
+        self.children = tuple(the_children)
+        return self.children
 
     def accept(self, visitor):
         visitor.pre_visit(self)
@@ -140,7 +158,40 @@ class AbstractSyntaxNode:
             child.accept(visitor)
         visitor.visit(self)
 
-
-class AbstractSyntaxTree:
-    def __init__(self, node: AbstractSyntaxNode = None):
-        self.head: AbstractSyntaxNode = node
+    def walk(self, visitor):
+        """
+        Same visits in the same order as accept, with a stack of its own instead of
+        the call stack so the depth of the tree is not bound by the recursion limit
+        """
+        pre_visit, mid_visit, visit = visitor.pre_visit, visitor.mid_visit, visitor.visit
+        pre_visit(self)
+        # the nodes being visited, with their children and the index of the next one to visit
+        stack = [(self, self.get_children(), 0)]
+        push, pop = stack.append, stack.pop
+        while stack:
+            node, children, i = pop()
+            if i < len(children):
+                if i > 0:
+                    mid_visit(i, node)
+                push((node, children, i + 1))
+                child = children[i]
+                pre_visit(child)
+                push((child, child.get_children(), 0))
+            else:
+                visit(node)
+
+
+class NodeStack(Stack):
+    """
+    The semantic stack a tree is built on. The nodes pushed on it are numbered in the order they are built,
+    each action building at most one, so the ids of every tree start from 0 whatever other tree is built meanwhile
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.ids: Iterator[int] = count()
+
+    def push(self, item):
+        if isinstance(item, AbstractSyntaxNode) and item.unique_id is None:
+            item.unique_id = next(self.ids)
+        self.items.append(item)
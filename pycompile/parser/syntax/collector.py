@@ -1,9 +1,14 @@
-import graphviz
+from __future__ import annotations
+
 from copy import deepcopy
 from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from pycompile.parser.syntax.node import *
 
+if TYPE_CHECKING:
+    import graphviz
+
 
 class Collector:
 
@@ -20,9 +25,30 @@ class Collector:
             'largest': 0,
         }
 
-        self.grph: graphviz.Digraph = graphviz.Digraph()
+        # the graphviz graph is only built (and graphviz imported) when it is asked for
+        # nodes are (name, label), edges are (parent_name, name), kept in the order they were added
+        self.graph_items: List[Tuple[bool, str, Optional[str]]] = []
+        self.__grph: Optional[graphviz.Digraph] = None
         self.node_names = {}
 
+    @property
+    def grph(self) -> graphviz.Digraph:
+        if self.__grph is None:
+            import graphviz
+            self.__grph = graphviz.Digraph()
+            for is_edge, first, second in self.graph_items:
+                if is_edge:
+                    self.__grph.edge(first, second)
+                else:
+                    self.__grph.node(first, second)
+        return self.__grph
+
+    def node(self, name: str, label: str = None):
+        self.graph_items.append((False, name, label))
+
+    def edge(self, parent_name: str, name: str):
+        self.graph_items.append((True, parent_name, name))
+
     def collect(self, head_node: AbstractSyntaxNode):
         head_node.collect(self, 0)
 
@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, List, Union
 
 from pycompile.lex.token import *
 
@@ -13,8 +13,26 @@ class SyntaxParsingError(Exception):
     }
 
     def __init__(self, token: Token, first_set: List, follow_set: List):
-        super().__init__(self.create_message(token, first_set, follow_set))
-        self.message = self.create_message(token, first_set, follow_set)
+        super().__init__(token, first_set, follow_set)
+        self.token: Token = token
+        self.first_set: List = first_set
+        self.follow_set: List = follow_set
+        self.__message: Union[str, None] = None
+
+    @property
+    def message(self) -> str:
+        # the expected sets can be long, they are only joined when the error gets printed
+        if self.__message is None:
+            self.__message = self.create_message(self.token, self.first_set, self.follow_set)
+        return self.__message
+
+    @property
+    def args(self) -> tuple:
+        # the message, as when it was the one argument of the exception
+        return self.message,
+
+    def __str__(self):
+        return self.message
 
     @staticmethod
     def create_message(token: Token, first_set: List, follow_set: List):
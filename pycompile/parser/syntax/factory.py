@@ -1,4 +1,5 @@
-from typing import Union, Tuple, Type
+from functools import partial
+from typing import Any, Callable, Dict, Union, Tuple, Type
 
 from pycompile.lex.token import *
 from pycompile.utils.stack import Stack
@@ -7,132 +8,74 @@ from pycompile.parser.syntax.node import *
 
 class AbstractSyntaxNodeFactory:
 
-    # create map between semantic actions and factory methods
-    ACTION_MAP = {
-        'make-leaf': lambda **kwargs: AbstractSyntaxNodeFactory.create_leaf(**kwargs),
-        'make-emptyLeaf': lambda **kwargs: AbstractSyntaxNodeFactory.create_empty_leaf(**kwargs),
-        'make-operator': lambda **kwargs: AbstractSyntaxNodeFactory.create_operator(**kwargs),
-        'push-op': lambda **kwargs: AbstractSyntaxNodeFactory.push_op(**kwargs),
-        'make-term': lambda **kwargs: AbstractSyntaxNodeFactory.create_term(**kwargs),
-        'make-factor': lambda **kwargs: AbstractSyntaxNodeFactory.create_factor(**kwargs),
-        'make-arithExp': lambda **kwargs: AbstractSyntaxNodeFactory.create_arith_expr(**kwargs),
-        'make-expr': lambda **kwargs: AbstractSyntaxNodeFactory.create_expr(**kwargs),
-        'push-unary': lambda **kwargs: AbstractSyntaxNodeFactory.push_op(**kwargs),
-        'make-negation': lambda **kwargs: AbstractSyntaxNodeFactory.create_negation(**kwargs),
-        'make-signed': lambda **kwargs: AbstractSyntaxNodeFactory.create_signed(**kwargs),
-        'make-BREAK': lambda **kwargs: AbstractSyntaxNodeFactory.create_break(**kwargs),
-        'make-CONTINUE': lambda **kwargs: AbstractSyntaxNodeFactory.create_continue(**kwargs),
-        'make-IF': lambda **kwargs: AbstractSyntaxNodeFactory.create_if(**kwargs),
-        'make-WHILE': lambda **kwargs: AbstractSyntaxNodeFactory.create_while(**kwargs),
-        'make-READ': lambda **kwargs: AbstractSyntaxNodeFactory.create_read(**kwargs),
-        'make-WRITE': lambda **kwargs: AbstractSyntaxNodeFactory.create_write(**kwargs),
-        'make-RETURN': lambda **kwargs: AbstractSyntaxNodeFactory.create_return(**kwargs),
-        'make-Prog': lambda **kwargs: AbstractSyntaxNodeFactory.create_prog(**kwargs),
-        'make-classList': lambda **kwargs: AbstractSyntaxNodeFactory.create_class_list(**kwargs),
-        'make-membList': lambda **kwargs: AbstractSyntaxNodeFactory.create_member_list(**kwargs),
-        'make-funcDL': lambda **kwargs: AbstractSyntaxNodeFactory.create_func_list(**kwargs),
-        'make-indList': lambda **kwargs: AbstractSyntaxNodeFactory.create_idx_list(**kwargs),
-        'make-classDecl': lambda **kwargs: AbstractSyntaxNodeFactory.create_class(**kwargs),
-        'make-inherList': lambda **kwargs: AbstractSyntaxNodeFactory.create_inherit_list(**kwargs),
-        'make-varDecl': lambda **kwargs: AbstractSyntaxNodeFactory.create_member_var(**kwargs),
-        'make-funcDecl': lambda **kwargs: AbstractSyntaxNodeFactory.create_member_func(**kwargs),
-        'make-arSep': lambda **kwargs: AbstractSyntaxNodeFactory.add_sep(**kwargs),
-        'make-fPList': lambda **kwargs: AbstractSyntaxNodeFactory.create_f_param_list(**kwargs),
-        'make-fParam': lambda **kwargs: AbstractSyntaxNodeFactory.create_f_param(**kwargs),
-        'make-aRList': lambda **kwargs: AbstractSyntaxNodeFactory.create_dim_list(**kwargs),
-        'make-aPList': lambda **kwargs: AbstractSyntaxNodeFactory.create_a_param_list(**kwargs),
-        'make-varDList': lambda **kwargs: AbstractSyntaxNodeFactory.create_var_list(**kwargs),
-        'make-stat': lambda **kwargs: AbstractSyntaxNodeFactory.create_statement(**kwargs),
-        'make-statList': lambda **kwargs: AbstractSyntaxNodeFactory.create_statement_list(**kwargs),
-        'make-funcBody': lambda **kwargs: AbstractSyntaxNodeFactory.create_func_body(**kwargs),
-        'make-var': lambda **kwargs: AbstractSyntaxNodeFactory.create_var(**kwargs),
-        'make-funcDef': lambda **kwargs: AbstractSyntaxNodeFactory.create_func(**kwargs),
-        'make-vis': lambda **kwargs: AbstractSyntaxNodeFactory.add_vis(**kwargs),
-        'make-sr': lambda **kwargs: AbstractSyntaxNodeFactory.add_sr(**kwargs),
-        'make-tern': lambda **kwargs: AbstractSyntaxNodeFactory.make_tern(**kwargs),
-    }
+    # semantic actions and the factory methods building their node, filled in below the class
+    ACTION_MAP: Dict[str, Callable[[Token, Token, Stack], Any]] = {}
 
     @staticmethod
     def create(semantic_symbol: str, token: Token, last_token: Token, semantic_stack: Stack) -> AbstractSyntaxNode:
-        as_kwargs = {
-            'semantic_symbol': semantic_symbol,
-            'token': token,
-            'last_token': last_token,
-            'semantic_stack': semantic_stack
-        }
-        if semantic_symbol in AbstractSyntaxNodeFactory.ACTION_MAP.keys():
-            return AbstractSyntaxNodeFactory.ACTION_MAP[semantic_symbol](**as_kwargs)
-        else:
+        action = AbstractSyntaxNodeFactory.ACTION_MAP.get(semantic_symbol)
+        if action is None:
             return semantic_symbol
+        return action(token, last_token, semantic_stack)
 
     @staticmethod
-    def create_leaf(**kwargs) -> AbstractSyntaxNode:
-        return Leaf(token=kwargs.get('last_token'))
+    def create_leaf(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
+        return Leaf(token=last_token)
 
     @staticmethod
-    def create_empty_leaf(**kwargs) -> AbstractSyntaxNode:
+    def create_empty_leaf(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
         return Leaf(token=Placeholder('PLACEHOLDER'))
 
     @staticmethod
-    def create_operator(**kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['right_operand']: AbstractSyntaxNode = stack.pop()
-        kwargs['operator']: str = stack.pop()
-        kwargs['left_operand']: AbstractSyntaxNode = stack.pop()
-        return Operator(**kwargs)
+    def create_operator(token: Token, last_token: Token, stack: Stack):
+        right_operand: AbstractSyntaxNode = stack.pop()
+        operator: str = stack.pop()
+        left_operand: AbstractSyntaxNode = stack.pop()
+        return Operator(left_operand=left_operand, operator=operator, right_operand=right_operand)
 
     @staticmethod
-    def push_op(**kwargs):
-        token: Token = kwargs.get('last_token')
-        return token.lexeme
+    def push_op(token: Token, last_token: Token, stack: Stack):
+        return last_token.lexeme
 
     @staticmethod
-    def create_term(**kwargs):
-        kwargs['factor'] = kwargs.get('semantic_stack').pop()
-        return Term(**kwargs)
+    def create_term(token: Token, last_token: Token, stack: Stack):
+        return Term(factor=stack.pop())
 
     @staticmethod
-    def create_factor(**kwargs):
-        kwargs['child'] = kwargs.get('semantic_stack').pop()
-        return Factor(**kwargs)
+    def create_factor(token: Token, last_token: Token, stack: Stack):
+        return Factor(child=stack.pop())
 
     @staticmethod
-    def create_expr(**kwargs):
-        kwargs['arith_expr'] = kwargs.get('semantic_stack').pop()
+    def create_expr(token: Token, last_token: Token, stack: Stack):
         # TODO, determine if need to look back and see if there is also a rel op... <exprTail>
-        return Expr(**kwargs)
+        return Expr(arith_expr=stack.pop())
 
     @staticmethod
-    def create_arith_expr(**kwargs):
-        kwargs['term'] = kwargs.get('semantic_stack').pop()
-        return ArithExpr(**kwargs)
+    def create_arith_expr(token: Token, last_token: Token, stack: Stack):
+        return ArithExpr(term=stack.pop())
 
     @staticmethod
-    def create_negation(**kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['factor'] = stack.pop()
+    def create_negation(token: Token, last_token: Token, stack: Stack):
+        factor = stack.pop()
         stack.pop()
-        kwargs['op'] = stack.pop()
-        return Negation(**kwargs)
+        return Negation(factor=factor, op=stack.pop())
 
     @staticmethod
-    def create_signed(**kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['factor'] = stack.pop()
-        kwargs['op'] = stack.pop()
-        return Signed(**kwargs)
+    def create_signed(token: Token, last_token: Token, stack: Stack):
+        factor = stack.pop()
+        return Signed(factor=factor, op=stack.pop())
 
     @staticmethod
-    def create_break(**kwargs) -> AbstractSyntaxNode:
-        return Break(token=kwargs.get('last_token'))
+    def create_break(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
+        return Break(token=last_token)
 
     @staticmethod
-    def create_continue(**kwargs) -> AbstractSyntaxNode:
-        return Continue(token=kwargs.get('last_token'))
+    def create_continue(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
+        return Continue(token=last_token)
 
     @staticmethod
-    def create_if(**kwargs) -> AbstractSyntaxNode:
-        stack: Stack = kwargs.get('semantic_stack')
+    def create_if(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
+        kwargs = {}
         if isinstance(stack.peek(), (StatList, Statement)):
             block_one = stack.pop()
             if isinstance(stack.peek(), (StatList, Statement)):
@@ -144,90 +87,78 @@ class AbstractSyntaxNodeFactory:
         return If(**kwargs)
 
     @staticmethod
-    def create_while(**kwargs) -> AbstractSyntaxNode:
-        stack: Stack = kwargs.get('semantic_stack')
+    def create_while(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
+        kwargs = {}
         if isinstance(stack.peek(), (StatList, Statement)):
             kwargs['stat'] = stack.pop()
         kwargs['rel_expr'] = stack.pop()
         return While(**kwargs)
 
     @staticmethod
-    def create_read(**kwargs) -> AbstractSyntaxNode:
-        kwargs['var'] = kwargs.get('semantic_stack').pop()
-        return Read(**kwargs)
+    def create_read(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
+        return Read(var=stack.pop())
 
     @staticmethod
-    def create_list(list_name: str, elem_type: Union[Type, Tuple[Type, ...]], container_type: Type, **kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs[list_name] = []
+    def create_list(list_name: str,
+                    elem_type: Union[Type, Tuple[Type, ...]],
+                    container_type: Type,
+                    stack: Stack,
+                    extra_func: Callable[[Stack], None] = None):
+        elems = []
         while len(stack) > 0 and isinstance(stack.peek(), elem_type):
-            kwargs[list_name].append(stack.pop())
+            elems.append(stack.pop())
         # inheritance list is greedy, will consume one extra ID
-        if 'extra_func' in kwargs.keys():
+        if extra_func is not None:
             # return the id
-            kwargs['extra_func'](**kwargs)
-        kwargs[list_name] = kwargs[list_name][-1::-1]
-        return container_type(**kwargs)
+            extra_func(stack)
+        return container_type(**{list_name: elems[-1::-1]})
 
     @staticmethod
-    def create_write(**kwargs) -> AbstractSyntaxNode:
-        kwargs['expr'] = kwargs.get('semantic_stack').pop()
-        return Write(**kwargs)
+    def create_write(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
+        return Write(expr=stack.pop())
 
     @staticmethod
-    def create_return(**kwargs) -> AbstractSyntaxNode:
-        kwargs['expr'] = kwargs.get('semantic_stack').pop()
-        return Return(**kwargs)
+    def create_return(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
+        return Return(expr=stack.pop())
 
     @staticmethod
-    def create_prog(**kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['main']: AbstractSyntaxNode = stack.pop()
-        if not stack.is_empty():
-            kwargs['funcs']: AbstractSyntaxNode = stack.pop()
-        else:
-            kwargs['funcs'] = None
-        if not stack.is_empty():
-            kwargs['classes']: AbstractSyntaxNode = stack.pop()
-        else:
-            kwargs['classes'] = None
-        return ProgramNode(**kwargs)
+    def create_prog(token: Token, last_token: Token, stack: Stack):
+        main: AbstractSyntaxNode = stack.pop()
+        funcs = stack.pop() if not stack.is_empty() else None
+        classes = stack.pop() if not stack.is_empty() else None
+        return ProgramNode(main=main, funcs=funcs, classes=classes)
 
     @staticmethod
-    def create_class_list(**kwargs):
-        return AbstractSyntaxNodeFactory.create_list('classes', ClassDecl, ClassList, **kwargs)
+    def create_class_list(token: Token, last_token: Token, stack: Stack):
+        return AbstractSyntaxNodeFactory.create_list('classes', ClassDecl, ClassList, stack)
 
     @staticmethod
-    def create_member_list(**kwargs):
-        return AbstractSyntaxNodeFactory.create_list('members', (FuncDecl, VarDecl), MemberList, **kwargs)
+    def create_member_list(token: Token, last_token: Token, stack: Stack):
+        return AbstractSyntaxNodeFactory.create_list('members', (FuncDecl, VarDecl), MemberList, stack)
 
     @staticmethod
-    def create_func_list(**kwargs):
-        return AbstractSyntaxNodeFactory.create_list('funcs', FuncDef, FuncDefList, **kwargs)
+    def create_func_list(token: Token, last_token: Token, stack: Stack):
+        return AbstractSyntaxNodeFactory.create_list('funcs', FuncDef, FuncDefList, stack)
 
     @staticmethod
-    def create_idx_list(**kwargs):
-        return AbstractSyntaxNodeFactory.create_list('indices', (Expr, ), IndList, extra_func=AbstractSyntaxNodeFactory.sep_remover, **kwargs)
+    def create_idx_list(token: Token, last_token: Token, stack: Stack):
+        return AbstractSyntaxNodeFactory.create_list('indices', (Expr, ), IndList, stack, AbstractSyntaxNodeFactory.sep_remover)
 
     @staticmethod
-    def create_inherit_list(**kwargs):
-        return AbstractSyntaxNodeFactory.create_list('inherit', Leaf, InheritList, extra_func=AbstractSyntaxNodeFactory.sep_remover, **kwargs)
+    def create_inherit_list(token: Token, last_token: Token, stack: Stack):
+        return AbstractSyntaxNodeFactory.create_list('inherit', Leaf, InheritList, stack, AbstractSyntaxNodeFactory.sep_remover)
 
     @staticmethod
-    def create_class(**kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['members']: AbstractSyntaxNode = stack.pop()
+    def create_class(token: Token, last_token: Token, stack: Stack):
+        kwargs = {'members': stack.pop()}
         if len(stack) > 0 and isinstance(stack.peek(), InheritList):
             kwargs['inherit'] = stack.pop()
-        kwargs['id']: AbstractSyntaxNode = stack.pop()
+        kwargs['id'] = stack.pop()
         return ClassDecl(**kwargs)
 
     @staticmethod
-    def create_member_func(**kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['type']: AbstractSyntaxNode = stack.pop()
-        kwargs['params']: AbstractSyntaxNode = stack.pop()
-        kwargs['id']: AbstractSyntaxNode = stack.pop()
+    def create_member_func(token: Token, last_token: Token, stack: Stack):
+        kwargs = {'type': stack.pop(), 'params': stack.pop(), 'id': stack.pop()}
         if stack.peek() == 'VIS':
             stack.pop()
             kwargs['vis'] = stack.pop()
@@ -237,97 +168,148 @@ class AbstractSyntaxNodeFactory:
         return FuncDecl(**kwargs)
 
     @staticmethod
-    def create_member_var(**kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['dims']: AbstractSyntaxNode = stack.pop()
-        kwargs['id']: AbstractSyntaxNode = stack.pop()
-        kwargs['type']: AbstractSyntaxNode = stack.pop()
+    def create_member_var(token: Token, last_token: Token, stack: Stack):
+        kwargs = {'dims': stack.pop(), 'id': stack.pop(), 'type': stack.pop()}
         if stack.peek() == 'VIS':
             stack.pop()
             kwargs['vis'] = stack.pop()
         return VarDecl(**kwargs)
 
     @staticmethod
-    def add_sep(**kwargs):
+    def add_sep(token: Token, last_token: Token, stack: Stack):
         return 'SEPARATOR'
 
     @staticmethod
-    def add_vis(**kwargs):
+    def add_vis(token: Token, last_token: Token, stack: Stack):
         return 'VIS'
 
     @staticmethod
-    def add_sr(**kwargs):
+    def add_sr(token: Token, last_token: Token, stack: Stack):
         return 'SR'
 
 
     @staticmethod
-    def create_f_param(**kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['dims']: AbstractSyntaxNode = stack.pop()
-        kwargs['id']: AbstractSyntaxNode = stack.pop()
-        kwargs['type']: AbstractSyntaxNode = stack.pop()
-        return FParam(**kwargs)
+    def create_f_param(token: Token, last_token: Token, stack: Stack):
+        dims: AbstractSyntaxNode = stack.pop()
+        param_id: AbstractSyntaxNode = stack.pop()
+        return FParam(dims=dims, id=param_id, type=stack.pop())
 
     @staticmethod
-    def create_f_param_list(**kwargs):
-        return AbstractSyntaxNodeFactory.create_list('params', FParam, FParamList, **kwargs)
+    def create_f_param_list(token: Token, last_token: Token, stack: Stack):
+        return AbstractSyntaxNodeFactory.create_list('params', FParam, FParamList, stack)
 
     @staticmethod
-    def sep_remover(**kwargs):
+    def sep_remover(stack: Stack):
         # remove the separator
-        if kwargs['semantic_stack'].peek() == 'SEPARATOR':
-            kwargs['semantic_stack'].pop()
+        if stack.peek() == 'SEPARATOR':
+            stack.pop()
 
     @staticmethod
-    def create_dim_list(**kwargs):
-        return AbstractSyntaxNodeFactory.create_list('dims', Leaf, DimList, extra_func=AbstractSyntaxNodeFactory.sep_remover, **kwargs)
+    def create_dim_list(token: Token, last_token: Token, stack: Stack):
+        return AbstractSyntaxNodeFactory.create_list('dims', Leaf, DimList, stack, AbstractSyntaxNodeFactory.sep_remover)
 
     @staticmethod
-    def create_a_param_list(**kwargs):
-        return AbstractSyntaxNodeFactory.create_list('params', Expr, AParamList, extra_func=AbstractSyntaxNodeFactory.sep_remover, **kwargs)
+    def create_a_param_list(token: Token, last_token: Token, stack: Stack):
+        return AbstractSyntaxNodeFactory.create_list('params', Expr, AParamList, stack, AbstractSyntaxNodeFactory.sep_remover)
 
     @staticmethod
-    def create_var_list(**kwargs):
-        return AbstractSyntaxNodeFactory.create_list('vars', VarDecl, VarDeclList, **kwargs)
+    def create_var_list(token: Token, last_token: Token, stack: Stack):
+        return AbstractSyntaxNodeFactory.create_list('vars', VarDecl, VarDeclList, stack)
 
     @staticmethod
-    def create_statement_list(**kwargs):
-        return AbstractSyntaxNodeFactory.create_list('stats', Statement, StatList, **kwargs)
+    def create_statement_list(token: Token, last_token: Token, stack: Stack):
+        return AbstractSyntaxNodeFactory.create_list('stats', Statement, StatList, stack)
 
     @staticmethod
-    def create_statement(**kwargs) -> AbstractSyntaxNode:
-        kwargs['stat'] = kwargs.get('semantic_stack').pop()
-        return Statement(**kwargs)
+    def create_statement(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
+        return Statement(stat=stack.pop())
 
     @staticmethod
-    def create_func_body(**kwargs) -> AbstractSyntaxNode:
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['stats'] = stack.pop()
+    def create_func_body(token: Token, last_token: Token, stack: Stack) -> AbstractSyntaxNode:
+        kwargs = {'stats': stack.pop()}
         if isinstance(stack.peek(), VarDeclList):
             kwargs['vars'] = stack.pop()
         return FuncBody(**kwargs)
 
     @staticmethod
-    def create_var(**kwargs):
+    def create_var(token: Token, last_token: Token, stack: Stack):
         """
 
         GLOB IS ANYTHING TO THE LEFT OF AN ASSIGNMENT OPERATOR
         EX - WHATS IN PARENTHESES:
         (test.thats[6][16+8]) = 5
         """
-        return AbstractSyntaxNodeFactory.create_list('components', (Leaf, IndList, AParamList), Var, **kwargs)
-
-    @staticmethod
-    def create_func(**kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['body'] = stack.pop()
-        kwargs['head'] = stack.pop()
-        return FuncDef(**kwargs)
-
-    @staticmethod
-    def make_tern(**kwargs):
-        stack: Stack = kwargs.get('semantic_stack')
-        kwargs['false'] = stack.pop()
-        kwargs['true'] = stack.pop()
-        kwargs['condition'] = stack.pop()
-        return Ternary(**kwargs)
+        return AbstractSyntaxNodeFactory.create_list('components', (Leaf, IndList, AParamList), Var, stack)
+
+    @staticmethod
+    def create_func(token: Token, last_token: Token, stack: Stack):
+        body = stack.pop()
+        return FuncDef(body=body, head=stack.pop())
+
+    @staticmethod
+    def make_tern(token: Token, last_token: Token, stack: Stack):
+        false = stack.pop()
+        true = stack.pop()
+        return Ternary(false=false, true=true, condition=stack.pop())
+
+
+AbstractSyntaxNodeFactory.ACTION_MAP.update({
+    'make-leaf': AbstractSyntaxNodeFactory.create_leaf,
+    'make-emptyLeaf': AbstractSyntaxNodeFactory.create_empty_leaf,
+    'make-operator': AbstractSyntaxNodeFactory.create_operator,
+    'push-op': AbstractSyntaxNodeFactory.push_op,
+    'make-term': AbstractSyntaxNodeFactory.create_term,
+    'make-factor': AbstractSyntaxNodeFactory.create_factor,
+    'make-arithExp': AbstractSyntaxNodeFactory.create_arith_expr,
+    'make-expr': AbstractSyntaxNodeFactory.create_expr,
+    'push-unary': AbstractSyntaxNodeFactory.push_op,
+    'make-negation': AbstractSyntaxNodeFactory.create_negation,
+    'make-signed': AbstractSyntaxNodeFactory.create_signed,
+    'make-BREAK': AbstractSyntaxNodeFactory.create_break,
+    'make-CONTINUE': AbstractSyntaxNodeFactory.create_continue,
+    'make-IF': AbstractSyntaxNodeFactory.create_if,
+    'make-WHILE': AbstractSyntaxNodeFactory.create_while,
+    'make-READ': AbstractSyntaxNodeFactory.create_read,
+    'make-WRITE': AbstractSyntaxNodeFactory.create_write,
+    'make-RETURN': AbstractSyntaxNodeFactory.create_return,
+    'make-Prog': AbstractSyntaxNodeFactory.create_prog,
+    'make-classList': AbstractSyntaxNodeFactory.create_class_list,
+    'make-membList': AbstractSyntaxNodeFactory.create_member_list,
+    'make-funcDL': AbstractSyntaxNodeFactory.create_func_list,
+    'make-indList': AbstractSyntaxNodeFactory.create_idx_list,
+    'make-classDecl': AbstractSyntaxNodeFactory.create_class,
+    'make-inherList': AbstractSyntaxNodeFactory.create_inherit_list,
+    'make-varDecl': AbstractSyntaxNodeFactory.create_member_var,
+    'make-funcDecl': AbstractSyntaxNodeFactory.create_member_func,
+    'make-arSep': AbstractSyntaxNodeFactory.add_sep,
+    'make-fPList': AbstractSyntaxNodeFactory.create_f_param_list,
+    'make-fParam': AbstractSyntaxNodeFactory.create_f_param,
+    'make-aRList': AbstractSyntaxNodeFactory.create_dim_list,
+    'make-aPList': AbstractSyntaxNodeFactory.create_a_param_list,
+    'make-varDList': AbstractSyntaxNodeFactory.create_var_list,
+    'make-stat': AbstractSyntaxNodeFactory.create_statement,
+    'make-statList': AbstractSyntaxNodeFactory.create_statement_list,
+    'make-funcBody': AbstractSyntaxNodeFactory.create_func_body,
+    'make-var': AbstractSyntaxNodeFactory.create_var,
+    'make-funcDef': AbstractSyntaxNodeFactory.create_func,
+    'make-vis': AbstractSyntaxNodeFactory.add_vis,
+    'make-sr': AbstractSyntaxNodeFactory.add_sr,
+    'make-tern': AbstractSyntaxNodeFactory.make_tern,
+})
+
+
+class SemanticAction(str):
+    """
+    Semantic action in the productions of a table, the name resolved to the factory method building its node.
+    Still the name everywhere a string is expected, the stack contents and the derivation included
+    """
+
+    def __new__(cls, name: str):
+        action = super().__new__(cls, name)
+        # the name is pushed on the semantic stack as is when no factory method builds a node for it
+        action.build = AbstractSyntaxNodeFactory.ACTION_MAP.get(name, partial(AbstractSyntaxNodeFactory.create, name))
+        return action
+
+    def __reduce__(self):
+        # pickled tables only keep the name, the factory method is looked up again when they are loaded
+        return SemanticAction, (str(self), )
@@ -7,6 +7,8 @@ class ProgramNode(AbstractSyntaxNode):
 
     CHILDREN = ['class_list', 'func_list', 'main']
 
+    __slots__ = ('class_list', 'func_list', 'main')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # if not isinstance(kwargs['classes'], ClassList) or not isinstance(kwargs['funcs'], FuncDefList) or not isinstance(kwargs['main'], FuncBody):
@@ -21,6 +23,8 @@ class ClassList(AbstractSyntaxNode):
 
     CHILDREN = ['classes']
 
+    __slots__ = ('classes',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if len(kwargs['classes']) > 0 and not isinstance(kwargs['classes'][0], ClassDecl):
@@ -33,6 +37,8 @@ class FuncDefList(AbstractSyntaxNode):
 
     CHILDREN = ['funcs']
 
+    __slots__ = ('funcs',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         if len(kwargs['funcs']) > 0 and (not isinstance(kwargs['funcs'][0], FuncDef) and not isinstance(kwargs['funcs'][0], FuncDecl)):
@@ -45,6 +51,8 @@ class ClassDecl(AbstractSyntaxNode):
 
     CHILDREN = ['id', 'inherit_list', 'member_list']
 
+    __slots__ = ('id', 'inherit_list', 'member_list')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.id = kwargs.get('id')
@@ -57,6 +65,8 @@ class FuncDef(AbstractSyntaxNode):
 
     CHILDREN = ['head', 'body']
 
+    __slots__ = ('head', 'body')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.head = kwargs.get('head')
@@ -68,6 +78,8 @@ class InheritList(AbstractSyntaxNode):
 
     CHILDREN = ['parents']
 
+    __slots__ = ('parents',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.parents = kwargs.get('inherit', [])
@@ -78,6 +90,8 @@ class MemberList(AbstractSyntaxNode):
 
     CHILDREN = ['members']
 
+    __slots__ = ('members',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.members = kwargs.get('members', [])
@@ -86,11 +100,15 @@ class MemberList(AbstractSyntaxNode):
 class MemberDecl(AbstractSyntaxNode):
     NUM_NODES = 1
 
+    __slots__ = ()
+
 
 class FParam(AbstractSyntaxNode):
 
     CHILDREN = ['type', 'id', 'dim_list']
 
+    __slots__ = ('id', 'type', 'dim_list')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.id = kwargs.get('id')
@@ -103,6 +121,8 @@ class DimList(AbstractSyntaxNode):
 
     CHILDREN = ['dims']
 
+    __slots__ = ('dims',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.dims = kwargs.get('dims', [])
@@ -113,6 +133,8 @@ class FParamList(AbstractSyntaxNode):
 
     CHILDREN = ['params']
 
+    __slots__ = ('params',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.params = kwargs.get('params', [])
@@ -123,6 +145,8 @@ class AParamList(AbstractSyntaxNode):
 
     CHILDREN = ['params']
 
+    __slots__ = ('params',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.params = kwargs.get('params', [])
@@ -133,6 +157,8 @@ class VarDeclList(AbstractSyntaxNode):
 
     CHILDREN = ['vars']
 
+    __slots__ = ('vars',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.vars = kwargs.get('vars', [])
@@ -143,6 +169,8 @@ class StatList(AbstractSyntaxNode):
 
     CHILDREN = ['stats']
 
+    __slots__ = ('stats',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.stats = kwargs.get('stats', [])
@@ -153,6 +181,8 @@ class Statement(AbstractSyntaxNode):
 
     CHILDREN = ['statement']
 
+    __slots__ = ('statement',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.statement = kwargs.get('stat')
@@ -163,6 +193,8 @@ class Leaf(AbstractSyntaxNode):
 
     CHILDREN = []
 
+    __slots__ = ('token',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.token: Token = kwargs.get('token')
@@ -173,6 +205,8 @@ class Operator(AbstractSyntaxNode):
 
     CHILDREN = ['left_operand', 'right_operand']
 
+    __slots__ = ('left_operand', 'operator', 'right_operand')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.left_operand: AbstractSyntaxNode = kwargs.get('left_operand')
@@ -185,6 +219,8 @@ class Term(AbstractSyntaxNode):
 
     CHILDREN = ['factor']
 
+    __slots__ = ('factor',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.factor: AbstractSyntaxNode = kwargs.get('factor')
@@ -195,6 +231,8 @@ class Factor(AbstractSyntaxNode):
 
     CHILDREN = ['child']
 
+    __slots__ = ('child',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.child: AbstractSyntaxNode = kwargs.get('child')
@@ -205,6 +243,8 @@ class Expr(AbstractSyntaxNode):
 
     CHILDREN = ['arith_expr']
 
+    __slots__ = ('arith_expr',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.arith_expr: AbstractSyntaxNode = kwargs.get('arith_expr')
@@ -215,6 +255,8 @@ class ArithExpr(AbstractSyntaxNode):
 
     CHILDREN = ['arith_expr']
 
+    __slots__ = ('arith_expr',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.arith_expr: AbstractSyntaxNode = kwargs.get('term')
@@ -225,6 +267,8 @@ class Negation(AbstractSyntaxNode):
 
     CHILDREN = ['op', 'factor']
 
+    __slots__ = ('factor', 'op')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.factor: AbstractSyntaxNode = kwargs.get('factor')
@@ -236,6 +280,8 @@ class Signed(AbstractSyntaxNode):
 
     CHILDREN = ['op', 'factor']
 
+    __slots__ = ('factor', 'op')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.factor: AbstractSyntaxNode = kwargs.get('factor')
@@ -243,11 +289,11 @@ class Signed(AbstractSyntaxNode):
 
 
 class Continue(Leaf):
-    ...
+    __slots__ = ()
 
 
 class Break(Leaf):
-    ...
+    __slots__ = ()
 
 
 class If(AbstractSyntaxNode):
@@ -255,6 +301,8 @@ class If(AbstractSyntaxNode):
 
     CHILDREN = ['rel_expr', 'then_block', 'else_block']
 
+    __slots__ = ('rel_expr', 'then_block', 'else_block')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.rel_expr: AbstractSyntaxNode = kwargs.get('rel_expr')
@@ -267,6 +315,8 @@ class While(AbstractSyntaxNode):
 
     CHILDREN = ['rel_expr', 'stat_block']
 
+    __slots__ = ('rel_expr', 'stat_block')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.rel_expr: AbstractSyntaxNode = kwargs.get('rel_expr')
@@ -278,6 +328,8 @@ class Read(AbstractSyntaxNode):
 
     CHILDREN = ['var']
 
+    __slots__ = ('var',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.var: AbstractSyntaxNode = kwargs.get('var')
@@ -288,6 +340,8 @@ class Write(AbstractSyntaxNode):
 
     CHILDREN = ['expr']
 
+    __slots__ = ('expr',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.expr: AbstractSyntaxNode = kwargs.get('expr')
@@ -298,6 +352,8 @@ class Return(AbstractSyntaxNode):
 
     CHILDREN = ['expr']
 
+    __slots__ = ('expr',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.expr: AbstractSyntaxNode = kwargs.get('expr')
@@ -308,6 +364,8 @@ class IndList(AbstractSyntaxNode):
 
     CHILDREN = ['indices']
 
+    __slots__ = ('indices',)
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.indices = kwargs.get('indices', [])
@@ -318,6 +376,8 @@ class FuncDecl(AbstractSyntaxNode):
 
     CHILDREN = ['visibility', 'id', 'my_class', 'fparam_list', 'type']
 
+    __slots__ = ('id', 'type', 'fparam_list', 'visibility', 'my_class')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.id = kwargs.get('id')
@@ -332,6 +392,8 @@ class VarDecl(AbstractSyntaxNode):
 
     CHILDREN = ['visibility', 'type', 'id', 'dim_list']
 
+    __slots__ = ('id', 'type', 'dim_list', 'visibility')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.id = kwargs.get('id')
@@ -345,6 +407,8 @@ class FuncBody(AbstractSyntaxNode):
 
     CHILDREN = ['vars', 'stats']
 
+    __slots__ = ('vars', 'stats')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.vars = kwargs.get('vars')
@@ -356,6 +420,8 @@ class Var(AbstractSyntaxNode):
 
     CHILDREN = ['components']
 
+    __slots__ = ('components',)
+
     """
         
     GLOB IS ANYTHING TO THE LEFT OF AN ASSIGNMENT OPERATOR
@@ -372,6 +438,8 @@ class Ternary(AbstractSyntaxNode):
 
     CHILDREN = ['condition', 'true_expr', 'false_expr']
 
+    __slots__ = ('condition', 'true_expr', 'false_expr')
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.condition = kwargs.get('condition')
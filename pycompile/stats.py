@@ -0,0 +1,140 @@
+"""
+What a compile costs stage by stage: wall and cpu time, and the peak of the memory traced by tracemalloc,
+along with the size of what went through the stages (tokens, ast nodes, generated instructions)
+"""
+import json
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter, process_time
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+from pycompile.symbol.visitor import Visitor
+from pycompile.parser.syntax.ast import AbstractSyntaxNode
+
+
+class StageStats:
+
+    def __init__(self, name: str):
+        self.name: str = name
+        self.wall_time: float = 0.0
+        self.cpu_time: float = 0.0
+        # highest number of bytes traced during the stage, the peak is reset when each stage starts,
+        # None when memory is not traced
+        self.peak_memory: Optional[int] = None
+        # the stage ran to the end, it can still have found errors in the program
+        self.completed: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'stage': self.name,
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'peak_memory': self.peak_memory,
+            'completed': self.completed,
+        }
+
+
+class CompileResult:
+
+    def __init__(self, output_name: str):
+        self.output_name: str = output_name
+        self.success: bool = False
+        # only filled in when profiling
+        self.stages: List[StageStats] = []
+        self.pass_timings: Dict[str, float] = {}
+        self.num_tokens: Optional[int] = None
+        self.num_nodes: Optional[int] = None
+        self.num_instructions: Optional[int] = None
+
+    @property
+    def wall_time(self) -> float:
+        return sum([stage.wall_time for stage in self.stages])
+
+    @property
+    def cpu_time(self) -> float:
+        return sum([stage.cpu_time for stage in self.stages])
+
+    @property
+    def peak_memory(self) -> Optional[int]:
+        peaks = [stage.peak_memory for stage in self.stages if stage.peak_memory is not None]
+        return max(peaks) if len(peaks) > 0 else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'stage': 'total',
+            'wall_time': self.wall_time,
+            'cpu_time': self.cpu_time,
+            'peak_memory': self.peak_memory,
+            'completed': self.success,
+            'num_tokens': self.num_tokens,
+            'num_nodes': self.num_nodes,
+            'num_instructions': self.num_instructions,
+            'passes': self.pass_timings,
+        }
+
+    def write_json_lines(self, out: TextIO):
+        """
+        One object per stage then one for the whole compile, all of them naming the file
+        """
+        for row in [stage.to_dict() for stage in self.stages] + [self.to_dict()]:
+            out.write(json.dumps({'file': self.output_name, **row}) + '\n')
+
+
+class StageProfiler:
+    """
+    Fills in the stats of the stages of a compile. Memory is traced from start to stop only,
+    tracemalloc slows everything down so the times are only comparable between runs that both trace or both do not
+    """
+
+    def __init__(self, result: CompileResult, trace_memory: bool = False):
+        self.result: CompileResult = result
+        self.trace_memory: bool = trace_memory
+        self.started_tracing: bool = False
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+    def stop(self):
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageStats]:
+        stats = StageStats(name)
+        self.result.stages.append(stats)
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        start_wall, start_cpu = perf_counter(), process_time()
+        try:
+            yield stats
+            stats.completed = True
+        finally:
+            stats.wall_time = perf_counter() - start_wall
+            stats.cpu_time = process_time() - start_cpu
+            if tracing:
+                stats.peak_memory = tracemalloc.get_traced_memory()[1]
+
+
+class NodeCounter(Visitor):
+
+    def __init__(self):
+        super().__init__()
+        self.num_nodes: int = 0
+
+    def visit(self, node: AbstractSyntaxNode):
+        self.num_nodes += 1
+
+
+def count_nodes(ast: AbstractSyntaxNode) -> int:
+    counter = NodeCounter()
+    ast.walk(counter)
+    return counter.num_nodes
+
+
+def count_instructions(lines: List[str]) -> int:
+    # lines of generated code that are only a comment or blank do not count
+    return len([line for line in lines if line.strip() != '' and not line.lstrip().startswith('%')])
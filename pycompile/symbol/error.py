@@ -1,10 +1,85 @@
+from __future__ import annotations
+import heapq
+from enum import Enum
+from typing import Iterator, List, Optional
 
 
-class SemanticError(Exception):
+class DiagnosticCode(Enum):
+    """
+    The text of each kind of diagnostic, formatted with its arguments and with the line it is about as {line}
+    """
+    MultiplyDeclared = 'Multiply declared {}: {} (line: {line})'
+    MultiplyDeclaredIn = 'Multiply declared {}: {} in {} (line: {line})'
+    Overloaded = 'The function {} has been overloaded by {} (line: {line})'
+    NameClash = 'In {}, {} with name "{}" clashes with {} of same name'
+    MissingDefinition = 'No definition for declared member function: {} (line: {line})'
+    TooFewParameters = 'Too few function parameters: function declared as {} implemented as {} (line: {line})'
+    ParameterMismatch = 'Declaration of member function {} does not match implementation: parameters {} and {} differ (line: {line})'
+    UndefinedType = 'The variable {} is of undefined type {} (line: {line})'
+    UndefinedParent = 'Declared parent class {} of {} does not exist (line: {line})'
+    UndeclaredMemberFunction = 'Definition provided for undeclared member function: {} (line: {line})'
+    UndeclaredInheritance = 'Invalid inheritance scheme found for {} - inheriting from undeclared class {} (line: {line})'
+    CyclicInheritance = 'Invalid inheritance scheme found for {} (cyclic inheritance) (line: {line})'
+    Shadowed = 'Name {} in scope {} shadows a name from an outer scope (line: {line})'
+    Overriding = 'Overriding function {} with function {} (line: {line})'
+    UntypedOperator = 'Failed to type operator {} because of semantic errors'
+    TypeMismatch = 'Type mismatch: no operator {} exists between types {} and {} (line: {line})'
+    UntypedReturn = 'Type(s) of return statement(s) for function {} could not be validated because of semantic errors (line: {line})'
+    ReturnMismatch = 'Type(s) of return statement(s) for function {} do no match with declared return type {} (line: {line})'
+    UnresolvedScope = 'FATAL: Can not resolve scope: {}'
+    UnresolvedClass = 'Scope {} can not be resolved (line: {line})'
+    UndeclaredMember = 'Undeclared data member "{}" for class {} (line: {line})'
+    VoidMember = 'Accessing member variable of VOID (line: {line})'
+    UndefinedClassMember = 'Accessing member variable of undefined class {} (line: {line})'
+    NonClassMember = 'Accessing member variable of non-class type {} (line: {line})'
+    UndeclaredVariable = 'Undeclared variable {} (accessed at line: {line})'
+    PrivateAccess = 'Variable {} is declared private but being accessed outside class scope (line: {line})'
+    InvalidIndex = 'Array index is of invalid type {} -- integers are the only valid array index (line: {line})'
+    NotSubscriptable = 'Variable {} is not subscriptable (line: {line})'
+    DimensionMismatch = 'Variable {} is an array of {} dimensions (line: {line})'
+    UndefinedMemberCall = 'Function with signature {} does not exist (called at line: {line})'
+    NonClassCall = 'Cannot call function {} on non-class type {} (called at line: {line})'
+    UndefinedCall = 'Cannot call undefined function {} (called at line: {line})'
+
+
+class Diagnostic(Exception):
+    # where the diagnostics without a line are sorted
+    UNKNOWN_LINE = 1000000
+
+    def __init__(self, code: DiagnosticCode, *arguments, position: Optional[int] = None):
+        super().__init__(code, *arguments)
+        self.code: DiagnosticCode = code
+        self.arguments: tuple = arguments
+        self.position: Optional[int] = position
+
+    @property
+    def line(self) -> int:
+        return self.position if isinstance(self.position, int) else Diagnostic.UNKNOWN_LINE
+
+    @property
+    def message(self) -> str:
+        # the text is only put together when it is printed
+        return self.code.value.format(*self.arguments, line=self.position)
+
+    def __str__(self):
+        return self.message
+
+    @staticmethod
+    def by_line(diagnostics: List[Diagnostic]) -> Iterator[Diagnostic]:
+        """
+        The diagnostics by line, the ones of the same line in the order they were found
+        """
+        heap = [(diagnostic.line, idx, diagnostic) for idx, diagnostic in enumerate(diagnostics)]
+        heapq.heapify(heap)
+        while len(heap) > 0:
+            yield heapq.heappop(heap)[2]
+
+
+class SemanticError(Diagnostic):
     pass
 
 
-class SemanticWarning(Warning):
+class SemanticWarning(Diagnostic, Warning):
     pass
 
 
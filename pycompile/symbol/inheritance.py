@@ -0,0 +1,277 @@
+"""
+Resolves the inheritance of the classes once, every class walked up a single time and merged after all of its parents,
+whose merged scopes are kept for their children to start from instead of being rebuilt for every path from a root
+"""
+from __future__ import annotations
+
+import heapq
+from typing import Dict, List, Optional, Set, Tuple
+
+from pycompile.symbol.error import DiagnosticCode, InheritanceError, SemanticWarning
+from pycompile.symbol.record import SemanticRecord, Kind
+from pycompile.symbol.stable import SymbolTable
+
+
+class ClassInheritance:
+
+    def __init__(self, name: str, inherit_list: List[str], index: int, is_class: bool = True):
+        self.name: str = name
+        self.inherit_list: List[str] = inherit_list
+        # any declared name can be inherited, only classes have members to merge
+        self.is_class: bool = is_class
+        # order of declaration, breaks the ties between classes merged at the same depth
+        self.index: int = index
+        # the parents a root class is reached through, in the order they are inherited
+        self.parents: List[str] = []
+        # a cycle is reached going up from the class
+        self.cyclic: bool = False
+        # the first undeclared class found going up, the parents after it are not followed
+        self.missing: Optional[str] = None
+        # length of the shortest 'Root-...-Class' name of a path from a root class, None when there is none
+        self.depth: Optional[int] = None
+
+    @property
+    def is_root(self) -> bool:
+        return len(self.inherit_list) == 0
+
+    @property
+    def reached(self) -> bool:
+        return self.is_class and (self.is_root or len(self.parents) > 0)
+
+
+class InheritedScope:
+    """
+    The names seen from the members of a class, the global ones and then the ones of its ancestors and its own.
+    Only what differs from the global names is kept: the names of the class hierarchy, which global names they took
+    the place of, and which global names are no longer seen
+    """
+
+    def __init__(self, global_names: Dict[str, SemanticRecord], global_index: Dict[str, int]):
+        self.global_names: Dict[str, SemanticRecord] = global_names
+        self.global_index: Dict[str, int] = global_index
+        self.records: Dict[str, SemanticRecord] = {}
+        # keys that are where the global record of the same name was
+        self.at_global: Set[str] = set()
+        self.lost: Set[str] = set()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.records or (name in self.global_names and name not in self.lost)
+
+    def __getitem__(self, name: str) -> SemanticRecord:
+        record = self.records.get(name)
+        return record if record is not None else self.global_names[name]
+
+    def add(self, key: str, record: SemanticRecord):
+        if key not in self.records and key in self.global_names and key not in self.lost:
+            self.at_global.add(key)
+        self.records[key] = record
+
+    def items(self) -> List[Tuple[str, SemanticRecord]]:
+        # the global names come before all the others
+        at_global = sorted(self.at_global, key=lambda key: self.global_index[key])
+        return [(key, self.records[key]) for key in at_global] + [
+            (key, record) for key, record in self.records.items() if key not in self.at_global
+        ]
+
+    def copy(self) -> InheritedScope:
+        scope = InheritedScope(self.global_names, self.global_index)
+        scope.records = dict(self.records)
+        scope.at_global = set(self.at_global)
+        scope.lost = set(self.lost)
+        return scope
+
+    def inner(self) -> InheritedScope:
+        """
+        The scope seen one level down, where the member functions are keyed by their declaration
+        """
+        scope = InheritedScope(self.global_names, self.global_index)
+        scope.lost = set(self.lost)
+        for key, record in self.items():
+            inner_key = InheritedScope.key(record)
+            if inner_key != key and key in self.at_global:
+                scope.lost.add(key)
+            scope.add(inner_key, record)
+        return scope
+
+    @staticmethod
+    def key(record: SemanticRecord) -> str:
+        if record.kind == Kind.Function and record.member_of is not None:
+            return record.get_func_decl().split('::')[1]
+        return record.get_name()
+
+
+class InheritanceResolver:
+    """
+    Merges the members of the parents into the table of each class, parents first. The scope a class sees is the one
+    of its parent plus its own records, so each class costs the size of its merged table once
+    """
+
+    def __init__(self, global_table: SymbolTable):
+        self.global_table: SymbolTable = global_table
+        self.class_list: List[str] = [rec.name for rec in global_table.records.values() if rec.kind == Kind.Class]
+        self.class_index: Dict[str, int] = {name: idx for idx, name in enumerate(self.class_list)}
+        self.classes: Dict[str, ClassInheritance] = {}
+        # the scope of each merged class, and the one its children start from
+        self.scopes: Dict[str, InheritedScope] = {}
+        self.inner_scopes: Dict[str, InheritedScope] = {}
+
+    def investigate(self, class_name: str) -> ClassInheritance:
+        """
+        Walks up the parents of the class in the order they are inherited, stopping at the first undeclared one.
+        A class already on the way up closes a cycle, one that was already walked up is not walked again
+        """
+        found = self.classes.get(class_name)
+        if found is not None:
+            return found
+        stack: List[Tuple[ClassInheritance, int]] = [(self.__create(class_name), 0)]
+        on_path: Set[str] = {class_name}
+        while len(stack) > 0:
+            node, idx = stack[-1]
+            if node.missing is None and idx < len(node.inherit_list):
+                stack[-1] = node, idx + 1
+                parent_name = node.inherit_list[idx]
+                if parent_name not in self.global_table.records:
+                    node.missing = parent_name
+                elif parent_name in on_path:
+                    node.cyclic = True
+                elif parent_name in self.classes:
+                    self.__reach(node, self.classes[parent_name])
+                else:
+                    stack.append((self.__create(parent_name), 0))
+                    on_path.add(parent_name)
+                continue
+            stack.pop()
+            on_path.remove(node.name)
+            if node.is_root:
+                node.depth = len(node.name)
+            elif len(node.parents) > 0:
+                node.depth = min([self.classes[parent].depth for parent in node.parents]) + 1 + len(node.name)
+            self.classes[node.name] = node
+            if len(stack) > 0:
+                self.__reach(stack[-1][0], node)
+        return self.classes[class_name]
+
+    def resolve(self) -> List[ClassInheritance]:
+        """
+        Walks up from every class. With a cycle, what is found going up from a class depends on the way it was reached,
+        the classes are then walked up again along every way, only to know which error they have
+        """
+        nodes = [self.investigate(class_name) for class_name in self.class_list]
+        if any([node.cyclic for node in nodes]):
+            for node in nodes:
+                node.missing = None
+                try:
+                    node.cyclic = not self.__walk(node.name, [])
+                except InheritanceError as e:
+                    node.missing = e.inherit_name
+        return nodes
+
+    def __walk(self, class_name: str, subclass_list: List[str]) -> bool:
+        if class_name in subclass_list:
+            return False
+        inheritances = self.global_table.records[class_name].inheritances
+        res = []
+        for parent_name in (inheritances if inheritances is not None else []):
+            if parent_name not in self.global_table.records:
+                raise InheritanceError(parent_name)
+            res.append(self.__walk(parent_name, subclass_list + [class_name]))
+        return all(res)
+
+    def __create(self, class_name: str) -> ClassInheritance:
+        inheritances = self.global_table.records[class_name].inheritances
+        return ClassInheritance(
+            class_name,
+            inheritances if inheritances is not None else [],
+            self.class_index.get(class_name, len(self.class_index)),
+            class_name in self.class_index
+        )
+
+    @staticmethod
+    def __reach(node: ClassInheritance, parent: ClassInheritance):
+        if parent.reached:
+            node.parents.append(parent.name)
+        node.cyclic = node.cyclic or parent.cyclic
+        if parent.missing is not None:
+            node.missing = parent.missing
+
+    def merge(self, global_names: Dict[str, SemanticRecord], warnings: List):
+        """
+        Merges every class reached from a root, once per parent it is reached through. The merges are done by the
+        length of the shortest path to them, a class only once all of its parents are
+        """
+        global_index = {name: idx for idx, name in enumerate(global_names.keys())}
+        children: Dict[str, List[ClassInheritance]] = {}
+        remaining: Dict[str, int] = {}
+        ready: List[Tuple[int, int, int, str, Optional[str]]] = []
+        for class_name in self.class_list:
+            node = self.investigate(class_name)
+            if not node.reached:
+                continue
+            remaining[class_name] = max(len(node.parents), 1)
+            if node.is_root:
+                heapq.heappush(ready, (node.depth, node.index, 0, class_name, None))
+            for parent_name in node.parents:
+                children.setdefault(parent_name, []).append(node)
+        num_first: Dict[str, int] = {}
+        overrides: Set[Tuple[str, str, Optional[int]]] = set()
+        while len(ready) > 0:
+            _, _, _, class_name, parent_name = heapq.heappop(ready)
+            node = self.classes[class_name]
+            if parent_name is not None:
+                if parent_name not in self.inner_scopes:
+                    self.inner_scopes[parent_name] = self.scopes[parent_name].inner()
+                scope = self.inner_scopes[parent_name].copy()
+            else:
+                scope = InheritedScope(global_names, global_index)
+            first = class_name not in self.scopes
+            self.__merge_parent(node, scope, first, overrides, warnings)
+            class_table = self.global_table.records[class_name].table_link
+            if first:
+                self.scopes[class_name] = scope
+                num_first[class_name] = len(class_table.records)
+            remaining[class_name] -= 1
+            if remaining[class_name] > 0:
+                continue
+            # the children see the class with all it inherited, what came from the parents after the first one
+            # is keyed by its declaration, so that none of it is hidden by what has the same name
+            class_scope = self.scopes[class_name]
+            for idx, record in enumerate(class_table.records.values()):
+                key = self.__scope_key(node, record) if idx < num_first[class_name] else InheritedScope.key(record)
+                class_scope.add(key, record)
+            for child in children.get(class_name, []):
+                heapq.heappush(ready, (node.depth + 1 + len(child.name), child.index, child.parents.index(class_name), child.name, class_name))
+
+    def __merge_parent(self, node: ClassInheritance, scope: InheritedScope, first: bool, overrides: Set[Tuple[str, str, Optional[int]]], warnings: List):
+        class_table: SymbolTable = self.global_table.records[node.name].table_link
+        records = list(class_table.records.values())
+        for record in records:
+            if record.name in scope and record.name not in class_table.duplicated_generator.keys():
+                warnings.append(SemanticWarning(DiagnosticCode.Shadowed, record.name, class_table.name, position=record.position))
+            key = self.__scope_key(node, record)
+            if key != record.name and key in scope:
+                # check for function overrides!!
+                override = (scope[key].get_name(), record.get_name(), record.position)
+                if override not in overrides:
+                    overrides.add(override)
+                    warnings.append(SemanticWarning(DiagnosticCode.Overriding, override[0], override[1], position=override[2]))
+            scope.add(key, record)
+        for _, record in scope.items():
+            if record.kind in (Kind.Function, Kind.Variable) and record.member_of is not None and record.member_of != node.name:
+                if record.kind == Kind.Variable:
+                    class_table.add_inherited_variable(record)
+                else:
+                    class_table.add_inherited_function(record)
+        if not first:
+            return
+        # nothing is inherited before the first merge, the member functions are the class's own and the scope is
+        # keyed as it is seen from them
+        for record in records:
+            if record.table_link is not None:
+                record.table_link.find_shadowed_vars(scope, warnings)
+
+    @staticmethod
+    def __scope_key(node: ClassInheritance, record: SemanticRecord) -> str:
+        # the class's own functions are keyed by their declaration, what it inherited by name
+        if record.kind == Kind.Function and record.member_of == node.name:
+            return InheritedScope.key(record)
+        return record.name
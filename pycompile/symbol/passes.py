@@ -0,0 +1,30 @@
+from time import perf_counter
+from typing import Dict
+
+from pycompile.symbol.visitor import Visitor
+from pycompile.parser.syntax.ast import AbstractSyntaxNode
+
+
+class PassManager:
+    """
+    Walks the ast with each visitor then finishes it, timing both
+    """
+
+    def __init__(self, ast: AbstractSyntaxNode):
+        self.ast: AbstractSyntaxNode = ast
+        # seconds spent in each walk and each finish, in the order they were done
+        self.timings: Dict[str, float] = {}
+        # not counting the walks visitors make in finish, like the second pass of the memory allocator
+        self.num_walks: int = 0
+
+    def run(self, visitor: Visitor):
+        """
+        Walks the ast with the visitor then finishes it
+        """
+        start = perf_counter()
+        self.ast.walk(visitor)
+        self.timings[visitor.__class__.__name__] = perf_counter() - start
+        self.num_walks += 1
+        start = perf_counter()
+        visitor.finish()
+        self.timings[f'{visitor.__class__.__name__}.finish'] = perf_counter() - start
@@ -1,8 +1,7 @@
 from __future__ import annotations
 from enum import Enum
-from typing import List, Optional, Union, Dict
+from typing import List, Optional, Union, Dict, Tuple
 from pycompile.parser.syntax.node import VarDecl, ClassDecl, FuncDecl, FParam, AbstractSyntaxNode
-from pycompile.symbol.error import InheritanceError
 
 
 class Visibility(Enum):
@@ -49,23 +48,24 @@ class TypeEnum(Enum):
 
     @staticmethod
     def match(one: TypeEnum, two: TypeEnum) -> bool:
-        return (
-            (one in (TypeEnum.Float, TypeEnum.Integer) and two in (TypeEnum.Float, TypeEnum.Integer)) or
-            one == two
-        )
+        return one is two or (one in NUMERIC_TYPES and two in NUMERIC_TYPES)
 
     @staticmethod
     def is_class(name: str) -> bool:
         return name not in ('integer', 'float', 'string', 'void', 'main')
 
 
+# integers and floats are used for one another
+NUMERIC_TYPES = (TypeEnum.Integer, TypeEnum.Float)
+
+
 class Type:
     def __init__(self, enum: TypeEnum, type_name: str):
         self.enum = enum
         self.type_name = type_name
 
     @staticmethod
-    def get_type(node: Union[VarDecl, FuncDecl, FParam]) -> Type:
+    def get_type(node: Union[VarDecl, FuncDecl, FParam], types: TypeTable) -> Type:
         trans = {
             'float': TypeEnum.Float,
             'integer': TypeEnum.Integer,
@@ -74,10 +74,10 @@ class Type:
         }
         type_val = trans.get(node.type.token.lexeme, TypeEnum.Class)
         name = node.type.token.lexeme
-        return Type(type_val, name)
+        return types.type_of(type_val, name)
 
     @staticmethod
-    def get_type_from_token(node) -> Type:
+    def get_type_from_token(node, types: TypeTable) -> Type:
         trans = {
             'Float': TypeEnum.Float,
             'Integer': TypeEnum.Integer,
@@ -90,16 +90,22 @@ class Type:
             pass
         else:
             name = type_val.name.lower()
-        return Type(type_val, name)
+        return types.type_of(type_val, name)
 
     def __str__(self):
         return self.type_name
 
     def __eq__(self, other):
+        # the types of a compile are interned in its TypeTable, equal types are most often the same object
+        if self is other:
+            return True
         if not isinstance(other, Type):
             return False
         return self.enum == other.enum and (self.enum != TypeEnum.Class or self.type_name == other.type_name)
 
+    def __hash__(self):
+        return hash((self.enum, self.type_name if self.enum == TypeEnum.Class else None))
+
 
 class SemanticRecord:
     RECORD_LIST: List[SemanticRecord] = []
@@ -201,23 +207,6 @@ class SemanticRecord:
             params = f'({params})'
         return f'{self.get_name()}{params}'
 
-    def investigate_inheritance(self, global_table, subclass_list, tree_set) -> bool:
-        if self.name in subclass_list:
-            return False
-        inherit_list = self.inheritances if self.inheritances is not None else []
-        if len(inherit_list) == 0:
-            full_tree = subclass_list + [self.name]
-            tree_set.add('-'.join(full_tree[-1::-1]))
-            return True
-        else:
-            res = []
-            for class_name in inherit_list:
-                class_def = global_table.records.get(class_name)
-                if class_def is None:
-                    raise InheritanceError(class_name)
-                res.append(class_def.investigate_inheritance(global_table, subclass_list + [self.name], tree_set))
-            return all(res)
-
     @staticmethod
     def verify_all_classes_exist(global_table):
         pass
@@ -260,19 +249,45 @@ class SemanticRecord:
 
 
 class TypeRecord:
-
-    def __init__(self, type: Type, is_array: bool = False, dimensions: int = 0, dimensions_dict: dict = None, value: str = None):
+    # shared by all the nodes of the type with the same dimensions (see TypeTable), where the line they are
+    # typed at is kept instead
+    def __init__(self, type: Type, is_array: bool = False, dimensions: int = 0, dimensions_dict: dict = None):
         self.type = type
-        # TODO translate the value
         self.is_array: bool = is_array
         self.dimensions: int = dimensions
         self.dimensions_dict: Optional[dict] = dimensions_dict
-        self.value = value
-        self.position: Optional[int] = None
 
     def __str__(self):
         as_str = str(self.type)
         if self.dimensions is not None:
             for i in range(self.dimensions):
                 as_str += '[]'
-        return as_str
\ No newline at end of file
+        return as_str
+
+
+class TypeTable:
+    """
+    The types of one compile: one Type of each primitive and of each class, and one TypeRecord of each type
+    with each dimensions. The SemanticTableBuilder starts one for every program, the passes after it find it
+    on the global table
+    """
+
+    def __init__(self):
+        self.types: Dict[Tuple[TypeEnum, str], Type] = {}
+        self.records: Dict[Tuple, TypeRecord] = {}
+
+    def type_of(self, enum: TypeEnum, type_name: str) -> Type:
+        found = self.types.get((enum, type_name))
+        if found is None:
+            found = self.types[(enum, type_name)] = Type(enum, type_name)
+        return found
+
+    def record_of(self, type: Type, is_array: bool = False, dimensions: int = 0, dimensions_dict: dict = None) -> TypeRecord:
+        sizes = None if dimensions_dict is None else tuple(sorted(dimensions_dict.items()))
+        key = (type, is_array, dimensions, sizes)
+        found = self.records.get(key)
+        if found is None:
+            # a dict of its own, the one of the caller may still change after the record is shared
+            own_dict = None if sizes is None else dict(sizes)
+            found = self.records[key] = TypeRecord(type, is_array, dimensions, own_dict)
+        return found
@@ -0,0 +1,59 @@
+"""
+The lexical scopes the type checker resolves names in: a function scope is linked to the class it is a member of,
+a class scope and a free function scope to the global one
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Optional
+
+from pycompile.symbol.record import SemanticRecord, TypeRecord
+from pycompile.symbol.stable import SymbolTable
+
+
+class Scope:
+
+    def __init__(self, name: str, table: Optional[SymbolTable], record: Optional[SemanticRecord] = None, parent: Optional[Scope] = None):
+        self.name: str = name
+        # None when the scope has no table, nothing is declared in it
+        self.table: Optional[SymbolTable] = table
+        self.record: Optional[SemanticRecord] = record
+        self.parent: Optional[Scope] = parent
+        # the scope each name looked up from this one is declared in, None when it is in none of them.
+        # the tables are complete once they are type checked, so what is found is never out of date
+        self.declaring_scopes: Dict[str, Optional[Scope]] = {}
+
+    def chain(self) -> Iterator[Scope]:
+        scope = self
+        while scope is not None:
+            yield scope
+            scope = scope.parent
+
+    def declaring(self, name: str) -> Optional[Scope]:
+        """
+        The innermost scope from this one up with a record of the name
+        """
+        if name in self.declaring_scopes:
+            return self.declaring_scopes[name]
+        if self.table is not None and name in self.table.records:
+            found = self
+        else:
+            found = self.parent.declaring(name) if self.parent is not None else None
+        self.declaring_scopes[name] = found
+        return found
+
+    def find(self, name: str) -> Optional[SemanticRecord]:
+        """
+        The record of the name in this very scope
+        """
+        return self.table.records[name] if self.declaring(name) is self else None
+
+    def match_func_call(self, name: str, params: List[TypeRecord]) -> Optional[SemanticRecord]:
+        """
+        The function a call resolves to, from the innermost scope with a function of the name whose parameters match
+        """
+        for scope in self.chain():
+            if scope.table is not None and scope.table.is_func_in_records(name):
+                func_rec = scope.table.match_func_call(name, params)
+                if func_rec is not None:
+                    return func_rec
+        return None
@@ -1,9 +1,9 @@
 from __future__ import annotations
 from collections import OrderedDict
-from typing import Dict, List, Union, Optional
+from typing import Container, Dict, List, Tuple, Union, Optional
 
-from pycompile.symbol.error import SemanticWarning
-from pycompile.symbol.record import SemanticRecord, Kind, TypeRecord, TypeEnum
+from pycompile.symbol.error import DiagnosticCode, SemanticWarning
+from pycompile.symbol.record import SemanticRecord, Kind, TypeRecord, TypeEnum, TypeTable
 
 
 class SymbolTable:
@@ -15,6 +15,13 @@ class SymbolTable:
         self.req_mem: int = 0
         self.instance_ref_addr: Optional[int] = None
         self.temp_var_id: int = 0
+        # records are only ever set and popped through __set_record and __pop_record, which keep up the keys of
+        # the function records by function name in the order of records (None when they have to be found again),
+        # and the keys of the functions of a name by the signature of their parameters, grouped on the first call matched
+        self.functions: Optional[Dict[str, List[str]]] = {}
+        self.overloads: Dict[str, Dict[Tuple, List[str]]] = {}
+        # the types of the compile, only set on the global table
+        self.types: Optional[TypeTable] = None
 
     def next_temp_var_id(self):
         idx = self.temp_var_id
@@ -39,28 +46,62 @@ class SymbolTable:
         self.duplicated_generator[record.get_name()] += 1
         return f'{record.name}{self.duplicated_generator[record.get_name()]}'
 
+    def __set_record(self, key: str, record: SemanticRecord):
+        replaced = self.records.get(key)
+        self.records[key] = record
+        if self.functions is None:
+            return
+        if replaced is not None:
+            # the key keeps its place in records, which the lists of keys can not tell
+            if replaced.kind == Kind.Function or record.kind == Kind.Function:
+                self.functions = None
+                self.overloads = {}
+        elif record.kind == Kind.Function:
+            self.functions.setdefault(record.name, []).append(key)
+            self.overloads.pop(record.name, None)
+
+    def __pop_record(self, key: str) -> SemanticRecord:
+        record = self.records.pop(key)
+        if self.functions is not None and record.kind == Kind.Function:
+            keys = self.functions[record.name]
+            keys.remove(key)
+            if len(keys) == 0:
+                del self.functions[record.name]
+            self.overloads.pop(record.name, None)
+        return record
+
+    def __function_keys(self, name: str) -> List[str]:
+        if self.functions is None:
+            self.functions = {}
+            for key, record in self.records.items():
+                if record.kind == Kind.Function:
+                    self.functions.setdefault(record.name, []).append(key)
+        return self.functions.get(name, [])
+
+    def __function_records(self, name: str) -> List[SemanticRecord]:
+        return [self.records[key] for key in self.__function_keys(name)]
+
     def add_record(self, record: SemanticRecord, duplicated_name_key: str = None):
         name = record.get_name() if duplicated_name_key is None else duplicated_name_key
-        self.records[name] = record
+        self.__set_record(name, record)
 
     def add_inherited_variable(self, record: SemanticRecord):
-        self.records[record.get_name()] = record
+        self.__set_record(record.get_name(), record)
 
     def add_inherited_function(self, record: SemanticRecord):
-        class_funcs = [
-            class_rec.get_func_decl().split('::')[1]
-            for class_rec in self.records.values()
-            if class_rec.kind == Kind.Function and class_rec.member_of == self.name
-        ]
         func_dl = record.get_func_decl().split('::')[1]
-        if func_dl not in class_funcs:
-            self.records[func_dl] = record
+        for class_rec in self.__function_records(record.name):
+            if class_rec.member_of == self.name and class_rec.get_func_decl().split('::')[1] == func_dl:
+                return
+        self.__set_record(func_dl, record)
 
     def already_defined(self, record: SemanticRecord) -> bool:
         return record.get_name() in self.records.keys() and (record.kind != Kind.Function or record.func_equality(self.records[record.get_name()]))
 
     def overloaded(self, record: SemanticRecord) -> bool:
-        return record.get_name() in self.get_pre_ol_func_names() and record.kind == Kind.Function
+        if record.kind != Kind.Function:
+            return False
+        return any([rec.get_name() == record.get_name() for rec in self.__function_records(record.name)])
 
     def was_overloaded(self, record: SemanticRecord) -> bool:
         return record.get_name() not in self.records.keys() and record.kind == Kind.Function
@@ -70,14 +111,14 @@ class SymbolTable:
         return names
 
     def get_overloaded(self, record: SemanticRecord) -> str:
-        names = [rec.get_func_decl() for rec in self.records.values() if rec.get_name() == record.get_name()]
+        names = [rec.get_func_decl() for rec in self.__function_records(record.name) if rec.get_name() == record.get_name()]
         return names[0]
 
     def add_overloaded_record(self, record: SemanticRecord):
         if record.get_name() in self.records.keys():
-            single_rec = self.records.pop(record.get_name())
-            self.records[single_rec.get_func_decl()] = single_rec
-        self.records[record.get_func_decl()] = record
+            single_rec = self.__pop_record(record.get_name())
+            self.__set_record(single_rec.get_func_decl(), single_rec)
+        self.__set_record(record.get_func_decl(), record)
 
     def get_overloaded_name(self, record: SemanticRecord) -> str:
         if record.get_name() in self.records.keys():
@@ -85,96 +126,58 @@ class SymbolTable:
         else:
             return record.get_func_decl()
 
-    def find_shadowed_vars(self, outer_table, warnings, for_classes: bool = False, global_table: SymbolTable = None, inherit_checks: dict = None):
-        for record in self.records.values():
-            pos_msg = f'(line: {record.position})'
-            decl = None
-            if record.name in outer_table.records.keys() and record.name not in self.duplicated_generator.keys():
-                if inherit_checks is None or not inherit_checks.get(self.name, {'done': False})['done']:
-                    warnings.append(SemanticWarning(
-                        f'Name {record.name} in scope {self.name} shadows a name from an outer scope {pos_msg}'
-                    ))
-            if record.kind == Kind.Function and self.name == record.member_of:
-                # check for function overrides!!
-                decl = record.get_func_decl()
-                if '::' in decl:
-                    decl = decl.split('::')[1]
-                if decl in outer_table.records.keys():
-                    func_name = record.get_name()
-                    override_name = outer_table.records[decl].get_name()
-                    override_msg = f'Overriding function {override_name} with function {func_name} {pos_msg}'
-                    if not any([w.args[0] == override_msg for w in warnings]):
-                        if inherit_checks is None or not inherit_checks[self.name]['done']:
-                            warnings.append(SemanticWarning(override_msg))
-
-            rec_name = record.name if decl is None else decl
-            # add an entry
-            outer_table.records[rec_name] = record
-        # add outer records here
-        for record in outer_table.records.values():
-            if (for_classes and record.kind in (Kind.Function, Kind.Variable)) and record.member_of is not None and record.member_of != self.name:
-                class_name = self.name
-                class_table: SymbolTable = global_table.records[class_name].table_link
-                if record.kind == Kind.Variable:
-                    class_table.add_inherited_variable(record)
-                elif record.kind == Kind.Function:
-                    class_table.add_inherited_function(record)
-        # now all entries processed, outer table contains outer names plus all these names
-        # go back through the records and process the other entries
+    def find_shadowed_vars(self, outer_names: Container[str], warnings):
+        """
+        Warns about the names of the table taken in an outer scope or earlier in the table
+        """
+        names = set()
         for record in self.records.values():
-            if record.table_link is not None:
-                new_outer = SymbolTable('outer')
-                for inner_rec in outer_table.records.values():
-                    # if inner_rec.kind != Kind.Function or inner_rec.member_of is not None:
-                    if inner_rec.kind != Kind.Function or inner_rec.member_of is None:
-                        new_outer.add_record(inner_rec)
-                    else:
-                        new_outer.add_inherited_function(inner_rec)
-                for_classes = True if record.kind == Kind.InheritanceRelation else False
-                record.table_link.find_shadowed_vars(new_outer, warnings, for_classes=for_classes, global_table=global_table, inherit_checks=inherit_checks)
-                if for_classes and inherit_checks is not None and record.kind == Kind.InheritanceRelation:
-                    rec_name = record.table_link.name
-                    if not inherit_checks[rec_name]['done']:
-                        inherit_list = global_table.records.get(rec_name).inheritances if global_table.records.get(rec_name).inheritances is not None else []
-                        if len(inherit_list) == 0:
-                            print('\n   ******* WARNING: no inheritances list when checking inheritance.... *********\n')
-                        inherit_checks[rec_name]['list'].append(self.name)
-                        inherit_checks[rec_name]['done'] = all([inherit_name in inherit_checks[rec_name]['list'] for inherit_name in inherit_list])
-
+            if (record.name in names or record.name in outer_names) and record.name not in self.duplicated_generator.keys():
+                warnings.append(SemanticWarning(DiagnosticCode.Shadowed, record.name, self.name, position=record.position))
+            names.add(record.name)
 
     def match_func_call(self, name: str, params: List[TypeRecord]) -> Union[SemanticRecord, None]:
-        match = None
-        # get functions only
-        potential_funcs = [rec for rec in self.records.values() if rec.kind == Kind.Function and rec.name == name]
-        for rec in potential_funcs:
-            declared_params = [frec for frec in rec.table_link.records.values() if frec.kind == Kind.Parameter]
-            if len(params) == len(declared_params):
-                match_able = True
-                for param, declared_param in zip(params, declared_params):
-                    declared_param: SemanticRecord
-                    if (
-                        param is None or param.type is None or
-                        not TypeEnum.match(param.type.enum, declared_param.type.enum) or
-                        param.is_array != declared_param.is_array or
-                        (
-                            (param.dimensions is None and declared_param.dimensions != 0) or
-                            (param.dimensions != declared_param.dimensions)
-                        )
-                    ):
-                        match_able = False
-                        break
-                if match_able:
-                    match = rec
-                    break
-        return match
+        """
+        The first function of the name in the table whose parameters the types of the call match
+        """
+        signature = SymbolTable.call_signature(params)
+        if signature is None:
+            return None
+        overloads = self.overloads.get(name)
+        if overloads is None:
+            overloads = self.__group_overloads(name)
+        keys = overloads.get(signature)
+        if keys is None:
+            return None
+        return self.records[keys[0]]
+
+    def __group_overloads(self, name: str) -> Dict[Tuple, List[str]]:
+        # parameters are only final once the tables are built, so the signatures are not computed before a call
+        overloads = {}
+        for key in self.__function_keys(name):
+            params = [rec for rec in self.records[key].table_link.records.values() if rec.kind == Kind.Parameter]
+            signature = tuple([SymbolTable.param_signature(rec.type.enum, rec.is_array, rec.dimensions) for rec in params])
+            overloads.setdefault(signature, []).append(key)
+        self.overloads[name] = overloads
+        return overloads
+
+    @staticmethod
+    def param_signature(enum: TypeEnum, is_array: bool, dimensions: int) -> Tuple:
+        # integers and floats are passed for one another, see TypeEnum.match
+        return TypeEnum.Integer if enum == TypeEnum.Float else enum, is_array, dimensions
+
+    @staticmethod
+    def call_signature(params: List[TypeRecord]) -> Optional[Tuple]:
+        signature = []
+        for param in params:
+            # nothing matches a parameter without a type or dimensions
+            if param is None or param.type is None or param.dimensions is None:
+                return None
+            signature.append(SymbolTable.param_signature(param.type.enum, param.is_array, param.dimensions))
+        return tuple(signature)
 
     def is_func_in_records(self, func_name) -> bool:
-        for name, func in self.records.items():
-            if func.kind != Kind.Function:
-                continue
-            if func_name in name:
-                return True
-        return False
+        return len(self.__function_keys(func_name)) > 0
 
 
     @staticmethod
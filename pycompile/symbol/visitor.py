@@ -1,17 +1,46 @@
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Set, Union
 
 from pycompile.parser.syntax.node import *
 from pycompile.symbol.stable import SymbolTable
-from pycompile.symbol.error import SemanticError, SemanticWarning, InheritanceError
-from pycompile.symbol.record import SemanticRecord, Kind, Type, TypeEnum, TypeRecord, Visibility
+from pycompile.symbol.error import DiagnosticCode, SemanticError, SemanticWarning
+from pycompile.symbol.inheritance import InheritanceResolver
+from pycompile.symbol.scope import Scope
+from pycompile.symbol.record import SemanticRecord, Kind, Type, TypeEnum, TypeTable, Visibility
 
 
 class Visitor:
+    # the visit_ method of each class of node, looked up once per visitor class
+    visit_methods: Dict[type, Callable] = {}
+
     def __init__(self, symbol_table: SymbolTable = None):
         self.global_table: Optional[SymbolTable] = symbol_table
         self.errors: List[Union[SemanticError, SemanticWarning]] = []
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.visit_methods = {}
+
     def visit(self, node: AbstractSyntaxNode):
+        """
+        Calls visit_<class name> for the class of the node, or for the closest of its base classes
+        with such a method, generic_visit when there is none
+        """
+        method = self.visit_methods.get(node.__class__)
+        if method is None:
+            method = self.find_visit_method(node.__class__)
+        method(self, node)
+
+    @classmethod
+    def find_visit_method(cls, node_class: type) -> Callable:
+        method = cls.generic_visit
+        for base in node_class.__mro__:
+            if hasattr(cls, f'visit_{base.__name__}'):
+                method = getattr(cls, f'visit_{base.__name__}')
+                break
+        cls.visit_methods[node_class] = method
+        return method
+
+    def generic_visit(self, node: AbstractSyntaxNode):
         pass
 
     def finish(self):
@@ -28,152 +57,148 @@ class SemanticTableBuilder(Visitor):
 
     def __init__(self):
         super().__init__()
-        self.inheritance_trees = set()
+        self.types: Optional[TypeTable] = None
 
-    def visit(self, node: AbstractSyntaxNode):
+    def pre_visit(self, node: AbstractSyntaxNode):
         if isinstance(node, ProgramNode):
-            pass
-
-        if isinstance(node, (VarDecl, ClassDecl, FuncDecl, FParam)):
-            # create semantic records
-            kind = Kind.get_kind(node)
-            n_type = None
-            name = node.id.token.lexeme
-            member_of, vis = None, None
-            inheritances = None
-            if isinstance(node, (VarDecl, FuncDecl, FParam)):
-                n_type = Type.get_type(node)
-                if n_type.enum == TypeEnum.Class:
-                    # search, make sure class exists
-                    # DOING THIS ELSEWHERE
-                    pass
-            if isinstance(node, VarDecl):
-                # check for dimensions
-                if isinstance(node.parent, MemberList):
-                    # add member of for declarations inside class decls
-                    member_of = node.parent.parent.id.token.lexeme
-                    vis = Visibility.get_visibility(node.visibility)
-            if isinstance(node, FuncDecl):
-                if isinstance(node.parent, MemberList):
-                    # add member of for declarations inside class decls
-                    member_of = node.parent.parent.id.token.lexeme
-                    vis = Visibility.get_visibility(node.visibility)
-                elif isinstance(node.parent, FuncDef) and node.my_class is not None:
-                    # add member of for implementations
-                    member_of = node.my_class.token.lexeme
-            if isinstance(node, ClassDecl) and node.inherit_list is not None:
-                # add inherited classes so that symbol tables can be merged
-                inheritances = []
-                for child in node.inherit_list.get_children():
-                    inheritances.append(child.token.lexeme)
-            rec = SemanticRecord(name, kind, n_type, member_of=member_of, inheritances=inheritances, visibility=vis)
+            # every program has types of its own, even when the builder is used again
+            self.types = TypeTable()
+
+    def visit_VarDecl(self, node: VarDecl):
+        member_of, vis = None, None
+        if isinstance(node.parent, MemberList):
+            # add member of for declarations inside class decls
+            member_of = node.parent.parent.id.token.lexeme
+            vis = Visibility.get_visibility(node.visibility)
+        rec = self.__create_record(node, Type.get_type(node, self.types), member_of=member_of, visibility=vis)
+        self.__set_dimensions(node, rec)
+
+    def visit_FParam(self, node: FParam):
+        rec = self.__create_record(node, Type.get_type(node, self.types))
+        self.__set_dimensions(node, rec)
+
+    def visit_FuncDecl(self, node: FuncDecl):
+        member_of, vis = None, None
+        if isinstance(node.parent, MemberList):
+            # add member of for declarations inside class decls
+            member_of = node.parent.parent.id.token.lexeme
+            vis = Visibility.get_visibility(node.visibility)
+        elif isinstance(node.parent, FuncDef) and node.my_class is not None:
+            # add member of for implementations
+            member_of = node.my_class.token.lexeme
+        rec = self.__create_record(node, Type.get_type(node, self.types), member_of=member_of, visibility=vis)
+        self.__populate_table(node, rec, self.__create_table(node, rec), node.fparam_list.get_children())
+
+    def visit_ClassDecl(self, node: ClassDecl):
+        inheritances = None
+        if node.inherit_list is not None:
+            # add inherited classes so that symbol tables can be merged
+            inheritances = []
+            for child in node.inherit_list.get_children():
+                inheritances.append(child.token.lexeme)
+        rec = self.__create_record(node, None, inheritances=inheritances)
+        self.__populate_table(node, rec, self.__create_table(node, rec), node.member_list.get_children())
+
+    def visit_FuncBody(self, node: FuncBody):
+        if isinstance(node.parent, ProgramNode):
+            rec = SemanticRecord('main', Kind.Function)
             node.sem_rec = rec
-
-            # add position information for these guys so errors can be more helpful
-            node.sem_rec.position = node.id.token.position
-
-            if isinstance(node, (VarDecl, FParam)):
-                # CHECK DIMENSIONS
-                if len(node.dim_list.get_children()) > 0:
-                    # its an array, set dimensions
-                    rec.is_array = True
-                    rec.dimensions = len(node.dim_list.get_children())
-                    for idx, dim in enumerate(node.dim_list.get_children()):
-                        # if size of dimensions specified, set them
-                        if not isinstance(dim.token, Placeholder):
-                            if rec.dimension_dict is None:
-                                rec.dimension_dict = {}
-                            rec.dimension_dict[idx] = int(dim.token.lexeme)
-
-        if isinstance(node, (FuncBody, ClassDecl, FuncDecl, ProgramNode)):
-            # create symbol tables
-            if (isinstance(node, FuncBody) and isinstance(node.parent, ProgramNode)) or isinstance(node, (FuncDecl, ClassDecl)):
-                if isinstance(node, FuncBody):
-                    name = 'main'
-                    rec = SemanticRecord(name, Kind.Function)
-                    node.sem_rec = rec
+            sym_table = self.__create_table(node, rec)
+        else:
+            rec = node.parent.head.sem_rec
+            sym_table = rec.table_link
+        children = node.vars.get_children() if isinstance(node.vars, VarDeclList) else []
+        self.__populate_table(node, rec, sym_table, children)
+
+    def visit_ProgramNode(self, node: ProgramNode):
+        self.global_table = SymbolTable('global')
+        self.global_table.types = self.types
+        node.sym_table = self.global_table
+        # add all classes, funcs, and main func to global_table
+        children = []
+        children += node.class_list.get_children() if node.class_list is not None else []
+        children += [child.head for child in node.func_list.get_children()]
+        children += [node.main]
+        self.__populate_table(node, None, self.global_table, children)
+
+    @staticmethod
+    def __create_record(node: AbstractSyntaxNode, n_type: Optional[Type], **kwargs) -> SemanticRecord:
+        # create semantic records
+        rec = SemanticRecord(node.id.token.lexeme, Kind.get_kind(node), n_type, **kwargs)
+        node.sem_rec = rec
+        # add position information for these guys so errors can be more helpful
+        node.sem_rec.position = node.id.token.position
+        return rec
+
+    @staticmethod
+    def __set_dimensions(node: Union[VarDecl, FParam], rec: SemanticRecord):
+        # CHECK DIMENSIONS
+        if len(node.dim_list.get_children()) > 0:
+            # its an array, set dimensions
+            rec.is_array = True
+            rec.dimensions = len(node.dim_list.get_children())
+            for idx, dim in enumerate(node.dim_list.get_children()):
+                # if size of dimensions specified, set them
+                if not isinstance(dim.token, Placeholder):
+                    if rec.dimension_dict is None:
+                        rec.dimension_dict = {}
+                    rec.dimension_dict[idx] = int(dim.token.lexeme)
+
+    @staticmethod
+    def __create_table(node: AbstractSyntaxNode, rec: SemanticRecord) -> SymbolTable:
+        sym_table = SymbolTable(rec.get_name())
+        node.sym_table = sym_table
+        rec.set_link(sym_table)
+        return sym_table
+
+    def __populate_table(self,
+                         node: AbstractSyntaxNode,
+                         rec: Optional[SemanticRecord],
+                         sym_table: SymbolTable,
+                         children: List[AbstractSyntaxNode]):
+        for child in children:
+            crec = child.sem_rec
+            if sym_table.already_defined(crec):
+                if crec.kind == Kind.Variable:
+                    if crec.member_of is None:
+                        error = SemanticError(DiagnosticCode.MultiplyDeclaredIn, 'local variable', crec.get_name(), sym_table.name, position=crec.position)
+                    else:
+                        error = SemanticError(DiagnosticCode.MultiplyDeclaredIn, 'data member', crec.get_name(), crec.member_of, position=crec.position)
+                elif crec.kind == Kind.Function:
+                    # function equality has already been checked in already_defined
+                    if crec.member_of is None:
+                        error = SemanticError(DiagnosticCode.MultiplyDeclared, 'free function', crec.get_func_decl(), position=crec.position)
+                    else:
+                        error = SemanticError(DiagnosticCode.MultiplyDeclaredIn, 'member function', crec.get_func_decl(), crec.member_of, position=crec.position)
+                elif crec.kind == Kind.Parameter:
+                    sym_table.add_record(crec, sym_table.generate_duplicated_param_name(crec))
+                    error = SemanticError(DiagnosticCode.MultiplyDeclaredIn, 'function parameter', crec.get_name(), rec.get_func_decl(), position=crec.position)
                 else:
-                    name = rec.get_name()
-                sym_table = SymbolTable(name)
-                node.sym_table = sym_table
-                rec.set_link(sym_table)
-            elif isinstance(node, ProgramNode):
-                # do program node
-                self.global_table = SymbolTable('global')
-                node.sym_table = self.global_table
-                sym_table = self.global_table
+                    error = SemanticError(DiagnosticCode.MultiplyDeclared, 'class', crec.get_name(), position=crec.position)
+                self.errors.append(error)
             else:
-                rec = node.parent.head.sem_rec
-                name = rec.get_name()
-                sym_table = rec.table_link
-
-            # need to populate symbol tables
-            children = []
-            if isinstance(node, FuncBody) and isinstance(node.vars, VarDeclList):
-                children = node.vars.get_children()
-            elif isinstance(node, ClassDecl):
-                children = node.member_list.get_children()
-            elif isinstance(node, FuncDecl):
-                children = node.fparam_list.get_children()
-            elif isinstance(node, ProgramNode):
-                # add all classes, funcs, and main func to global_table
-                children += node.class_list.get_children() if node.class_list is not None else []
-                children += [child.head for child in node.func_list.get_children()]
-                children += [node.main]
-
-            for child in children:
-                crec = child.sem_rec
-                if sym_table.already_defined(crec):
-                    msg = 'Multiply declared {}{}'
-                    in_msg = ': {} in {}'
-                    pos_msg = f'(line: {crec.position})'
-                    in_msg = f'{in_msg} {pos_msg}'
-                    if crec.kind == Kind.Variable:
-                        if crec.member_of is None:
-                            kind = 'local variable'
-                            parent = sym_table.name
-                        else:
-                            kind = 'data member'
-                            parent = crec.member_of
-                        msg = msg.format(kind, in_msg.format(crec.get_name(), parent))
-                    elif crec.kind == Kind.Function:
-                        # function equality has already been checked in already_defined
-                        if crec.member_of is None:
-                            kind = 'free function'
-                            in_msg = f': {crec.get_func_decl()} {pos_msg}'
-                        else:
-                            kind = 'member function'
-                            in_msg = in_msg.format(crec.get_func_decl(), crec.member_of)
-                        msg = msg.format(kind, in_msg)
-                    elif crec.kind == Kind.Parameter:
-                        sym_table.add_record(crec, sym_table.generate_duplicated_param_name(crec))
-                        msg = msg.format('function parameter', f': {crec.get_name()} in {rec.get_func_decl()} {pos_msg}')
-                    else:
-                        msg = msg.format('class', f': {crec.get_name()} {pos_msg}')
-                    self.errors.append(SemanticError(msg))
+                if sym_table.overloaded(crec):
+                    if not isinstance(node, ProgramNode) or (isinstance(node, ProgramNode) and crec.member_of is None):
+                        # prevent duplicate warnings for implmenetations of member functions
+                        self.errors.append(SemanticWarning(
+                            DiagnosticCode.Overloaded, sym_table.get_overloaded(crec), crec.get_func_decl(), position=crec.position
+                        ))
+                    sym_table.add_overloaded_record(crec)
                 else:
-                    if sym_table.overloaded(crec):
-                        if not isinstance(node, ProgramNode) or (isinstance(node, ProgramNode) and crec.member_of is None):
-                            # prevent duplicate warnings for implmenetations of member functions
-                            pos_msg = f'(line: {crec.position})'
-                            self.errors.append(SemanticWarning(
-                                f'The function {sym_table.get_overloaded(crec)} has been overloaded by {crec.get_func_decl()} {pos_msg}'
-                            ))
-                        sym_table.add_overloaded_record(crec)
-                    else:
-                        sym_table.add_record(crec)
+                    sym_table.add_record(crec)
 
     def finish(self):
         # merge class function implementations with declarations
         for rec in self.global_table.records.values():
-            rec_pos_msg = f'(line: {rec.position})'
             if rec.kind == Kind.Class:
+                # names of the members of each kind, a member clashes with the ones of another kind
+                kind_names: Dict[Kind, Set[str]] = {}
+                for class_rec in rec.table_link.records.values():
+                    kind_names.setdefault(class_rec.kind, set()).add(class_rec.name)
                 for class_rec in rec.table_link.records.values():
-                    pos_msg = f'(line: {class_rec.position})'
-                    other_names = [r.name for r in rec.table_link.records.values() if r.kind != class_rec.kind]
-                    if class_rec.name in other_names:
+                    if any([class_rec.name in names for kind, names in kind_names.items() if kind != class_rec.kind]):
                         other_kind = 'Variable' if class_rec.kind == Kind.Function else 'Function'
-                        self.errors.append(SemanticError(f'In {rec.table_link.name}, {class_rec.kind.name} with name "{class_rec.name}" clashes with {other_kind} of same name'))
+                        self.errors.append(SemanticError(DiagnosticCode.NameClash, rec.table_link.name, class_rec.kind.name, class_rec.name, other_kind))
                     if class_rec.kind == Kind.Function:
                         """
                         Guarantee Fparams and merge implementations and decls of member funcs
@@ -183,13 +208,13 @@ class SemanticTableBuilder(Visitor):
                         body_def = self.global_table.records.get(cf_name)
                         if body_def is None:
                             errors = True
-                            self.errors.append(SemanticError(f'No definition for declared member function: {cf_name} {pos_msg}'))
+                            self.errors.append(SemanticError(DiagnosticCode.MissingDefinition, cf_name, position=class_rec.position))
                             continue
 
                         if len(body_def.table_link.records.keys()) < len(class_rec.table_link.records.keys()):
                             errors = True
                             self.errors.append(SemanticError(
-                                f'Too few function parameters: function declared as {class_rec.get_func_decl()} implemented as {body_def.get_func_decl()} {pos_msg}'
+                                DiagnosticCode.TooFewParameters, class_rec.get_func_decl(), body_def.get_func_decl(), position=class_rec.position
                             ))
                         fpr = [r for r in class_rec.table_link.records.values() if r.kind == Kind.Parameter]
                         fpm = [r for r in body_def.table_link.records.values() if r.kind == Kind.Parameter]
@@ -197,7 +222,7 @@ class SemanticTableBuilder(Visitor):
                             if fp_rec != matching_rec:
                                 errors = True
                                 self.errors.append(SemanticError(
-                                    f'Declaration of member function {cf_name} does not match implementation: parameters {fp_rec.name} and {matching_rec.name} differ {pos_msg}'
+                                    DiagnosticCode.ParameterMismatch, cf_name, fp_rec.name, matching_rec.name, position=class_rec.position
                                 ))
                         if not errors:
                             # get rid of the partial link in the class decl, and replace it with full table in
@@ -207,7 +232,7 @@ class SemanticTableBuilder(Visitor):
                     continue
                 # the type of the variable / param is an undeclared class
                 self.errors.append(
-                    SemanticError(f'The variable {class_rec.get_name()} is of undefined type {class_rec.type.type_name} {pos_msg}')
+                    SemanticError(DiagnosticCode.UndefinedType, class_rec.get_name(), class_rec.type.type_name, position=class_rec.position)
                 )
                 """
                 Merge inherited classes
@@ -215,95 +240,50 @@ class SemanticTableBuilder(Visitor):
                 for class_name in (rec.inheritances if rec.inheritances is not None else []):
                     parent = self.global_table.records.get(class_name)
                     if parent is None:
-                        self.errors.append(SemanticError(f'Declared parent class {class_name} of {rec.get_name()} does not exist {rec_pos_msg}'))
+                        self.errors.append(SemanticError(DiagnosticCode.UndefinedParent, class_name, rec.get_name(), position=rec.position))
                         break
                     parent_table = parent.table_link
                     rec.parent_tables.append(parent_table)
             elif rec.kind == Kind.Function:
                 if rec.member_of is not None and not rec.table_link.matched:
-                    self.errors.append(SemanticError(f'Definition provided for undeclared member function: {rec.get_func_decl()} {rec_pos_msg}'))
+                    self.errors.append(SemanticError(DiagnosticCode.UndeclaredMemberFunction, rec.get_func_decl(), position=rec.position))
                 for frec in rec.table_link.records.values():
-                    frec_pos = f'(line: {frec.position})'
                     if not TypeEnum.is_class(frec.type.type_name) or frec.type.type_name in self.global_table.records.keys():
                         continue
                     # the type of the variable / param is an undeclared class
                     self.errors.append(
-                        SemanticError(f'The variable {frec.name} is of undefined type {frec.type.type_name} {frec_pos}')
+                        SemanticError(DiagnosticCode.UndefinedType, frec.name, frec.type.type_name, position=frec.position)
                     )
         """
         PASS 2
 
         FINDING CIRCULAR DEPENDENCIES
         """
-        class_list = [rec.name for rec in self.global_table.records.values() if rec.kind == Kind.Class]
-        for class_name in class_list:
-            rec = self.global_table.records.get(class_name)
-            pos_msg = f'(line: {rec.position})'
-            # check for cyclic dependencies in parent-child class relationships
-            try:
-                valid_scheme = rec.investigate_inheritance(self.global_table, [], self.inheritance_trees)
-                if not valid_scheme:
-                    self.errors.append(SemanticError(
-                        f'Invalid inheritance scheme found for {class_name} (cyclic inheritance) {pos_msg}'
-                    ))
-            except InheritanceError as e:
-                self.errors.append(SemanticError(f'Invalid inheritance scheme found for {class_name} - inheriting from undeclared class {e.inherit_name} {pos_msg}'))
+        inheritance = InheritanceResolver(self.global_table)
+        # check for cyclic dependencies in parent-child class relationships
+        for node in inheritance.resolve():
+            position = self.global_table.records[node.name].position
+            if node.missing is not None:
+                self.errors.append(SemanticError(DiagnosticCode.UndeclaredInheritance, node.name, node.missing, position=position))
+            elif node.cyclic:
+                self.errors.append(SemanticError(DiagnosticCode.CyclicInheritance, node.name, position=position))
         """
         PASS 3
         
         FINDING SHADOWED VARS
         """
+        # member function implementations are only in scope in their class
+        global_names: Dict[str, SemanticRecord] = {}
+        for rec in self.global_table.records.values():
+            if rec.kind != Kind.Function or rec.member_of is None:
+                global_names[rec.get_name()] = rec
         for rec in self.global_table.records.values():
-            # do it for
             # warn about shadowed variables
             if rec.table_link is not None and rec.kind == Kind.Function and rec.member_of is None:
                 # do it only for functions for now, which have one level
-                global_as_outer = SymbolTable('outer')
-                for inner_rec in self.global_table.records.values():
-                    if inner_rec.kind != Kind.Function or inner_rec.member_of is None:
-                        global_as_outer.add_record(inner_rec)
-                rec.table_link.find_shadowed_vars(global_as_outer, self.errors)
-        inherit_checks = {
-            k: {'list': [], 'done': False} for k in class_list
-        }
-        sorted_trees = sorted(self.inheritance_trees, key=lambda x: len(x))
-        for tree in sorted_trees:
-            classes = tree.split('-')
-            fake_class_tables = []
-            # create copies of each classes' symbol table
-            for class_ in classes:
-                real_table = self.global_table.records.get(class_)
-                if real_table is None:
-                    # stop processing the second a hierarchy becomes invalid
-                    break
-                fake_table = SymbolTable(class_)
-                for key, rec in real_table.table_link.records.items():
-                    fake_table.records[key] = rec
-                fake_class_tables.append(fake_table)
-            # create records to link classes, from base to most derived child
-            for idx, class_ in enumerate(classes):
-                if idx == 0:
-                    continue
-                parent_table = fake_class_tables[idx - 1]
-                child_table = fake_class_tables[idx]
-                fake_rec = SemanticRecord(f'RelRec{idx}', Kind.InheritanceRelation)
-                parent_table.add_record(fake_rec)
-                fake_rec.set_link(child_table)
-            # create a symbol table with global symbols
-            global_as_outer = SymbolTable('outer')
-            for inner_rec in self.global_table.records.values():
-                if inner_rec.kind != Kind.Function or inner_rec.member_of is None:
-                    global_as_outer.add_record(inner_rec)
-            # start at biggest ancestor, whose outer scope is the copy of global
-            fake_class_tables[0].find_shadowed_vars(
-                global_as_outer,
-                self.errors,
-                for_classes=True,
-                global_table=self.global_table,
-                inherit_checks=inherit_checks
-            )
-            if not inherit_checks[fake_class_tables[0].name]['done']:
-                inherit_checks[fake_class_tables[0].name]['done'] = True
+                rec.table_link.find_shadowed_vars(global_names, self.errors)
+        # merge the members of the parents into their children, from the root classes down
+        inheritance.merge(global_names, self.errors)
 
 
 class TypeChecker(Visitor):
@@ -311,8 +291,11 @@ class TypeChecker(Visitor):
         super().__init__()
         self.ignored_nodes: set = set()
         self.skip: bool = True
-        self.current_scope: List[str] = []
         self.global_table: SymbolTable = table
+        self.types: TypeTable = table.types
+        # the scopes being visited, innermost last, and every scope entered by its name
+        self.scopes: List[Scope] = []
+        self.named_scopes: Dict[str, Scope] = {'global': Scope('global', table)}
         if isinstance(errors, list):
             self.errors: List[Union[SemanticWarning, SemanticError]] = errors
         else:
@@ -327,13 +310,12 @@ class TypeChecker(Visitor):
             node.head.sem_rec = None
         if node.sym_table is not None:
             if node.sem_rec is None:
-                self.current_scope.append(node.sym_table.name)
+                scope_name = node.sym_table.name
+            elif self.global_table.was_overloaded(node.sem_rec):
+                scope_name = node.sem_rec.get_func_decl()
             else:
-                if self.global_table.was_overloaded(node.sem_rec):
-                    scope_name = node.sem_rec.get_func_decl()
-                else:
-                    scope_name = node.sem_rec.get_name()
-                self.current_scope.append(scope_name)
+                scope_name = node.sem_rec.get_name()
+            self.scopes.append(self.get_scope(scope_name))
         if isinstance(node, FuncBody):
             self.skip = False
             self.return_types = []
@@ -341,120 +323,129 @@ class TypeChecker(Visitor):
     def visit(self, node: AbstractSyntaxNode):
         if self.skip:
             if node.sym_table is not None:
-                self.current_scope = self.current_scope[:-1]
+                self.scopes.pop()
             return
 
-        if isinstance(node, Factor) and isinstance(node.child, (Var, Leaf)):
-            # can be leaf or Var or Signed or Not
-            if isinstance(node.child, Leaf):
-                # get the type from the token
-                node.type_rec = TypeRecord(Type.get_type_from_token(node), value=node.child.token.lexeme)
-                node.type_rec.position = node.child.token.position
-            else:
-                node.type_rec = node.child.type_rec
-
-        elif isinstance(node, (ArithExpr, Expr, Term, Signed, Negation, Factor)):
-            if isinstance(node, (ArithExpr, Expr)):
-                node.type_rec = node.arith_expr.type_rec
-            elif isinstance(node, (Term, Signed)):
-                node.type_rec = node.factor.type_rec
-            elif isinstance(node, Factor):
-                node.type_rec = node.child.type_rec
-            elif isinstance(node, Negation):
-                node.type_rec = TypeRecord(Type(TypeEnum.Integer, 'integer'))
-
-        elif isinstance(node, Statement) and isinstance(node.statement, Var):
-            node.type_rec = node.statement.type_rec
-        elif isinstance(node, Statement):
-            # and isinstance(node.statement, Operator):
-            node.type_rec = node.statement.type_rec
-            if isinstance(node.statement, Return):
-                self.return_types.append(node.type_rec)
-        # elif isinstance(node, Statement):
-        #     print(f'Need to handle other types of Statement children: {node.statement.__class__.__name__}')
-        elif isinstance(node, Operator):
-            left_type = node.left_operand.type_rec
-            right_type = node.right_operand.type_rec
-            # TODO ALLOW NUMERIC MISMATCH.....
-            if right_type is None or left_type is None:
-                self.errors.append(SemanticError(
-                    f'Failed to type operator {node.operator} because of semantic errors'
-                ))
-            elif not TypeEnum.match(left_type.type.enum, right_type.type.enum):
-                pos_msg = f'(line: {left_type.position})'
-                self.errors.append(SemanticError(
-                    'Type mismatch: no operator {} exists between types {} and {} {}'.format(
-                        node.operator,
-                        left_type.type.type_name,
-                        right_type.type.type_name,
-                        pos_msg
-                    )
-                ))
-            node.type_rec = left_type
-
-        elif isinstance(node, Return):
-            node.type_rec = node.expr.type_rec
-
-        elif isinstance(node, Var):
-            self.type_complex_statement(node)
-
-        elif not isinstance(node, (VarDeclList, VarDecl, Var, AParamList, FuncBody, StatList, IndList, DimList, Leaf)):
-            self.ignored_nodes.add(node.__class__.__name__)
+        super().visit(node)
 
         if node.sym_table is not None:
-            self.current_scope = self.current_scope[:-1]
+            self.scopes.pop()
 
-        if isinstance(node, FuncDef):
-            func_rt = node.sem_rec.type
-            node.type_rec = func_rt
-            semantic_message = False
-            if func_rt.enum == TypeEnum.Void and len(self.return_types) > 0:
-                validated = False
-            elif func_rt.enum == TypeEnum.Void and len(self.return_types) == 0:
-                validated = True
-            elif func_rt.enum != TypeEnum.Void and len(self.return_types) == 0:
-                validated = False
-            else:
-                try:
-                    validated = all([
-                        TypeEnum.match(func_rt.enum, found_rt.type.enum)
-                        for found_rt in self.return_types
-                    ])
-                except AttributeError as e:
-                    semantic_message = True
-            if semantic_message:
-                msg = 'Type(s) of return statement(s) for function {} could not be validated because of semantic errors {}'
-                self.errors.append(SemanticError(msg.format(node.sem_rec.get_func_decl(), f'(line: {node.sem_rec.position})')))
-            elif not validated:
-                self.errors.append(SemanticError(
-                    'Type(s) of return statement(s) for function {} do no match with declared return type {} {}'.format(
-                        node.sem_rec.get_func_decl(),
-                        node.sem_rec.type.type_name,
-                        f'(line: {node.sem_rec.position})'
-                    )
-                ))
-            # reset
-            self.return_types = []
-            self.skip = True
+    def generic_visit(self, node: AbstractSyntaxNode):
+        if not isinstance(node, (VarDeclList, VarDecl, AParamList, FuncBody, StatList, IndList, DimList, Leaf)):
+            self.ignored_nodes.add(node.__class__.__name__)
 
-    def get_scope(self, name: str = None):
-        name = name if name is not None else self.current_scope[-1]
-        scope_rec = self.global_table.records.get(name) if name != 'global' else None
-        if name == 'global':
-            scope_table = self.global_table
+    def visit_Factor(self, node: Factor):
+        # can be leaf or Var or Signed or Not
+        if isinstance(node.child, Leaf):
+            # get the type from the token
+            node.type_rec = self.types.record_of(Type.get_type_from_token(node, self.types))
+            node.type_position = node.child.token.position
+        else:
+            TypeChecker.__take_type(node, node.child)
+
+    def visit_ArithExpr(self, node: Union[ArithExpr, Expr]):
+        TypeChecker.__take_type(node, node.arith_expr)
+
+    visit_Expr = visit_ArithExpr
+
+    def visit_Term(self, node: Union[Term, Signed]):
+        TypeChecker.__take_type(node, node.factor)
+
+    visit_Signed = visit_Term
+
+    def visit_Negation(self, node: Negation):
+        node.type_rec = self.types.record_of(self.types.type_of(TypeEnum.Integer, 'integer'))
+
+    def visit_Statement(self, node: Statement):
+        TypeChecker.__take_type(node, node.statement)
+        if isinstance(node.statement, Return):
+            self.return_types.append(node.type_rec)
+
+    def visit_Operator(self, node: Operator):
+        left_type = node.left_operand.type_rec
+        right_type = node.right_operand.type_rec
+        # TODO ALLOW NUMERIC MISMATCH.....
+        if right_type is None or left_type is None:
+            self.errors.append(SemanticError(DiagnosticCode.UntypedOperator, node.operator))
+        elif not TypeEnum.match(left_type.type.enum, right_type.type.enum):
+            self.errors.append(SemanticError(
+                DiagnosticCode.TypeMismatch,
+                node.operator,
+                left_type.type.type_name,
+                right_type.type.type_name,
+                position=node.left_operand.type_position
+            ))
+        TypeChecker.__take_type(node, node.left_operand)
+
+    def visit_Return(self, node: Return):
+        TypeChecker.__take_type(node, node.expr)
+
+    @staticmethod
+    def __take_type(node: AbstractSyntaxNode, typed: AbstractSyntaxNode):
+        node.type_rec = typed.type_rec
+        node.type_position = typed.type_position
+
+    def visit_Var(self, node: Var):
+        self.type_complex_statement(node)
+
+    def visit_FuncDef(self, node: FuncDef):
+        self.generic_visit(node)
+        func_rt = node.sem_rec.type
+        node.type_rec = func_rt
+        semantic_message = False
+        if func_rt.enum == TypeEnum.Void and len(self.return_types) > 0:
+            validated = False
+        elif func_rt.enum == TypeEnum.Void and len(self.return_types) == 0:
+            validated = True
+        elif func_rt.enum != TypeEnum.Void and len(self.return_types) == 0:
+            validated = False
         else:
-            rec = self.global_table.records.get(name)
-            scope_table = rec.table_link if rec is not None else None
-        return name, scope_rec, scope_table
+            try:
+                validated = all([
+                    TypeEnum.match(func_rt.enum, found_rt.type.enum)
+                    for found_rt in self.return_types
+                ])
+            except AttributeError as e:
+                semantic_message = True
+        if semantic_message:
+            self.errors.append(SemanticError(DiagnosticCode.UntypedReturn, node.sem_rec.get_func_decl(), position=node.sem_rec.position))
+        elif not validated:
+            self.errors.append(SemanticError(
+                DiagnosticCode.ReturnMismatch,
+                node.sem_rec.get_func_decl(),
+                node.sem_rec.type.type_name,
+                position=node.sem_rec.position
+            ))
+        # reset
+        self.return_types = []
+        self.skip = True
+
+    def get_scope(self, name: str) -> Scope:
+        """
+        The scope of a name of the global table, linked to the scope of its class when it is a member function
+        """
+        scope = self.named_scopes.get(name)
+        if scope is None:
+            record = self.global_table.records.get(name)
+            parent = self.named_scopes['global']
+            if record is not None and record.member_of is not None and record.member_of in self.global_table.records:
+                parent = self.get_scope(record.member_of)
+            scope = Scope(name, record.table_link if record is not None else None, record, parent)
+            self.named_scopes[name] = scope
+        return scope
 
     def type_complex_statement(self, node: AbstractSyntaxNode):
-        sname, scope_rec, scope_table = self.get_scope()
-        if scope_table is None:
-            self.errors.append(SemanticError(f'FATAL: Can not resolve scope: {sname}'))
+        scope = self.scopes[-1]
+        scope_rec = scope.record
+        if scope.table is None:
+            self.errors.append(SemanticError(DiagnosticCode.UnresolvedScope, scope.name))
             return
         # isinstance(node.child, Var):
         comps = node.get_children()
         types = []
+        # the line each of the types was found at
+        positions = []
         final_rec = None
         for idx, base in enumerate(comps[::2]):
             list_idx = (idx * 2) + 1
@@ -473,54 +464,44 @@ class TypeChecker(Visitor):
                 # look up
                 error = None
                 record = None
-                if idx == 0 and name in scope_table.records.keys():
+                if idx == 0 and scope.find(name) is not None:
                     # it's a local var
-                    record = scope_table.records[name]
+                    record = scope.find(name)
                 else:
-                    if idx == 0 and self.current_scope[-1] != 'global' and scope_rec is not None and scope_rec.member_of is not None:
-                        class_table = self.global_table.records.get(scope_rec.member_of)
-                        if class_table is None:
-                            error = SemanticError(
-                                f'Scope {scope_rec.member_of} can not be resolved (line: {scope_rec.position})'
-                            )
+                    if idx == 0 and scope.name != 'global' and scope_rec is not None and scope_rec.member_of is not None:
+                        if scope_rec.member_of not in self.global_table.records:
+                            error = SemanticError(DiagnosticCode.UnresolvedClass, scope_rec.member_of, position=scope_rec.position)
                         else:
-                            if name in class_table.table_link.records.keys():
+                            if scope.parent.find(name) is not None:
                                 # in class scope, from function in class scope
-                                record = class_table.table_link.records[name]
+                                record = scope.parent.find(name)
                             else:
                                 # not in class scope
                                 error = SemanticError(
-                                    f'Undeclared data member "{name}" for class {scope_rec.member_of} (line: {base.token.position})'
+                                    DiagnosticCode.UndeclaredMember, name, scope_rec.member_of, position=base.token.position
                                 )
                     elif idx != 0 and len(types) > 0:
                         scope_name = types[-1].type.type_name
                         if scope_name == 'void':
-                            error = SemanticError(
-                                f'Accessing member variable of VOID (line: {base.token.position})'
-                            )
+                            error = SemanticError(DiagnosticCode.VoidMember, position=base.token.position)
                         elif scope_name not in self.global_table.records.keys():
                             if TypeEnum.is_class(scope_name):
                                 error = SemanticError(
-                                    f'Accessing member variable of undefined class {scope_name} (line: {base.token.position})'
+                                    DiagnosticCode.UndefinedClassMember, scope_name, position=base.token.position
                                 )
                             else:
                                 error = SemanticError(
-                                    f'Accessing member variable of non-class type {scope_name} (line: {base.token.position})'
+                                    DiagnosticCode.NonClassMember, scope_name, position=base.token.position
                                 )
                         else:
-                            class_table = self.global_table.records[scope_name]
-                            if name in class_table.table_link.records.keys():
-                                record = class_table.table_link.records[name]
-                            else:
+                            record = self.get_scope(scope_name).find(name)
+                            if record is None:
                                 error = SemanticError(
-                                    f'Undeclared data member "{name}" for class {scope_name} (line: {base.token.position})'
+                                    DiagnosticCode.UndeclaredMember, name, scope_name, position=base.token.position
                                 )
                     else:
                         # global scope or function scope and it was not found here
-                        error = SemanticError("Undeclared variable {} (accessed at line: {})".format(
-                            name,
-                            base.token.position
-                        ))
+                        error = SemanticError(DiagnosticCode.UndeclaredVariable, name, position=base.token.position)
                 if record is not None:
                     final_rec = record
                     base.sem_rec = record
@@ -541,18 +522,15 @@ class TypeChecker(Visitor):
                     if record.member_of is not None and scope_rec.member_of is None:
                         # class member is being accessed from outside class scope
                         if record.visibility == Visibility.Private:
-                            error = SemanticError(
-                                f'Variable {name} is declared private but being accessed outside class scope (line: {base.token.position})'
-                            )
+                            error = SemanticError(DiagnosticCode.PrivateAccess, name, position=base.token.position)
                     # have the record
-                    type_rec = TypeRecord(
+                    types.append(self.types.record_of(
                         record.type,
                         is_array=is_array,
                         dimensions=dims,
                         dimensions_dict=dim_dict
-                    )
-                    type_rec.position = base.token.position
-                    types.append(type_rec)
+                    ))
+                    positions.append(base.token.position)
                     # now validate do the type checking
                     if len(comps[list_idx].indices) == 0 or (len(comps[list_idx].indices) == record.dimensions):
                         # dimensions are the same or it's not an array
@@ -563,18 +541,16 @@ class TypeChecker(Visitor):
                                     if error is not None:
                                         self.errors.append(error)
                                     error = SemanticError(
-                                        'Array index is of invalid type {} -- integers are the only valid array index {}'.format(
-                                            idx_node.type_rec.type.type_name,
-                                            f'(line: {base.token.position})'
-                                        )
+                                        DiagnosticCode.InvalidIndex, idx_node.type_rec.type.type_name, position=base.token.position
                                     )
                     elif not record.is_array:
                         # problem!!!
-                        error = SemanticError(f'Variable {name} is not subscriptable (line: {base.token.position})')
+                        error = SemanticError(DiagnosticCode.NotSubscriptable, name, position=base.token.position)
                     else:
                         # problem
                         error = SemanticError(
-                            f'Variable {name} is an array of {record.dimensions} dimensions (line: {base.token.position})')
+                            DiagnosticCode.DimensionMismatch, name, record.dimensions, position=base.token.position
+                        )
                 if error is not None:
                     # there was an error
                     self.errors.append(error)
@@ -587,57 +563,41 @@ class TypeChecker(Visitor):
                 # function list is AParamList
                 # if it's a function, need to look up function, get its return type
                 # validate params list
+                # the scope the call is resolved from, a member function calls from its class
                 if idx != 0:
                     if len(types) != idx:
-                        func_scopes = self.current_scope
+                        call_scope = scope
                     else:
                         func_owner = types[idx - 1]
-                        func_scopes = ['global', func_owner.type.type_name]
+                        call_scope = self.get_scope(func_owner.type.type_name)
+                elif scope_rec is not None and scope_rec.member_of is not None and scope_rec.member_of in self.global_table.records:
+                    call_scope = scope.parent
                 else:
-                    func_scopes = self.current_scope
-                    if scope_rec is not None and scope_rec.member_of is not None and scope_rec.member_of in self.global_table.records.keys():
-                        func_scopes.append(scope_rec.member_of)
+                    call_scope = scope
                 param_types = [param.type_rec for param in comps[list_idx].params]
-                not_found = True
-                scope_counter = -1
-                while abs(scope_counter) < (len(func_scopes) + 1):
-                    tmp_scope_name = func_scopes[scope_counter]
-                    tmp_scope_rec = None if tmp_scope_name == 'global' else self.global_table.records.get(tmp_scope_name)
-                    if tmp_scope_rec is not None or tmp_scope_name == 'global':
-                        tmp_scope_table = self.global_table if tmp_scope_name == 'global' else tmp_scope_rec.table_link
-                        if tmp_scope_table.is_func_in_records(name):
-                            func_rec = tmp_scope_table.match_func_call(name, param_types)
-                            if func_rec is not None:
-                                not_found = False
-                                final_rec = func_rec
-                                base.sem_rec = func_rec
-                                types.append(TypeRecord(func_rec.type))
-                                break
-                    scope_counter -= 1
-                if not_found:
-                    if TypeEnum.is_class(func_scopes[-1]):
-                        error = SemanticError(
-                            'Function with signature {} does not exist (called at line: {})'.format(
-                                SymbolTable.get_func_signature(name, param_types=param_types, member_of_name=func_scopes[-1]),
-                                base.token.position
-                            )
-                        )
-                    elif func_scopes[-1] != 'main':
+                func_rec = call_scope.match_func_call(name, param_types)
+                if func_rec is not None:
+                    final_rec = func_rec
+                    base.sem_rec = func_rec
+                    types.append(self.types.record_of(func_rec.type))
+                    positions.append(None)
+                else:
+                    if TypeEnum.is_class(call_scope.name):
                         error = SemanticError(
-                            'Cannot call function {} on non-class type {} (called at line: {})'.format(
-                                name,
-                                func_scopes[-1],
-                                base.token.position
-                            )
+                            DiagnosticCode.UndefinedMemberCall,
+                            SymbolTable.get_func_signature(name, param_types=param_types, member_of_name=call_scope.name),
+                            position=base.token.position
                         )
+                    elif call_scope.name != 'main':
+                        error = SemanticError(DiagnosticCode.NonClassCall, name, call_scope.name, position=base.token.position)
                     else:
                         error = SemanticError(
-                            'Cannot call undefined function {} (called at line: {})'.format(
-                                SymbolTable.get_func_signature(name, param_types=param_types, member_of_name=None),
-                                base.token.position
-                            )
+                            DiagnosticCode.UndefinedCall,
+                            SymbolTable.get_func_signature(name, param_types=param_types, member_of_name=None),
+                            position=base.token.position
                         )
                     self.errors.append(error)
         # the type of the node is the type at the end of the chain
         node.type_rec = types[-1] if len(types) > 0 else None
+        node.type_position = positions[-1] if len(positions) > 0 else None
         node.sem_rec = final_rec
@@ -3,6 +3,7 @@ from pathlib import Path
 from os.path import dirname, join as path_join, realpath
 
 from pycompile.parser.parser import Parser
+from pycompile.symbol.error import Diagnostic
 from pycompile.symbol.visitor import SemanticTableBuilder, TypeChecker
 
 
@@ -24,16 +25,9 @@ def analyze_test_file(input_file: Path, output_dir: str):
     tc = TypeChecker(stb.global_table, None)
     parser.traverse(tc)
 
-    all_errors = []
-    for error in stb.errors + tc.errors:
-        if 'line: ' not in error.args[0]:
-            all_errors.append((1000000, error.args[0]))
-        else:
-            all_errors.append((int(error.args[0].split('line: ')[1].split(')')[0]), error.args[0]))
-    sorted_errors = sorted(all_errors, key=lambda x: x[0])
     with open(error_name, 'w') as f:
-        for error in sorted_errors:
-            f.write(error[1] + '\n')
+        for error in Diagnostic.by_line(stb.errors + tc.errors):
+            f.write(f'{error}\n')
 
     arr_rep = stb.global_table.get_repr()
     with open(table_name, 'w') as f:
@@ -0,0 +1,71 @@
+import argparse
+from typing import Dict, List
+from os.path import dirname, join as path_join, realpath
+
+from pycompile.parser.strategy.helper import Table
+from pycompile.parser.strategy.generated import ParserGenerator
+
+
+def compare_sets(name: str, generated: Dict[str, List], calgary: Dict[str, List]) -> bool:
+    same = True
+    reordered = 0
+    for non_term, items in calgary.items():
+        if set(items) != set(generated.get(non_term, [])):
+            same = False
+            print(f'   {name} of {non_term} differs: {generated.get(non_term)} instead of {items}')
+        elif items != generated[non_term]:
+            reordered += 1
+    print(f'   {name}: {len(calgary)} sets, equal: {same} ({reordered} listed in another order)')
+    return same
+
+
+def compare_tables(generated: Table, calgary: Table) -> bool:
+    same = True
+    for non_term, row in calgary.parse_table.items():
+        for terminal in set(row.keys()) | set(generated.parse_table[non_term].keys()):
+            if row.get(terminal) != generated.parse_table[non_term].get(terminal):
+                same = False
+                print(f'   entry {non_term}, {terminal} differs: '
+                      f'{generated.parse_table[non_term].get(terminal)} instead of {row.get(terminal)}')
+    print(f'   parse table: {len(calgary.parse_table)} rows, equal: {same}')
+    return same
+
+
+def main(grammar_file: str = None, compare: bool = True, parser_file: str = None):
+    grammar_dir = path_join(dirname(realpath(__file__)), 'parser', 'grammar_files')
+    grammar_file = grammar_file if grammar_file is not None else path_join(grammar_dir, 'LL1.paquet.grm')
+    print(f'Generating parse table from: {grammar_file}')
+    generated = Table.create(grammar_file=grammar_file)
+    generated.fill_errors()
+    generated.report_conflicts()
+    print(f'   {len(generated.non_terminals)} non-terminals, {len(generated.terminals)} terminals, '
+          f'{len(generated.conflicts)} conflicts')
+    if parser_file is not None:
+        generated.compile()
+        with open(parser_file, 'w') as f:
+            f.write(ParserGenerator(generated).generate())
+        print(f'   recursive descent parser written to: {parser_file}')
+    if not compare:
+        return
+    print('Comparing with the ucalgary tables...')
+    calgary = Table.create(grammar_file=grammar_file, optional={
+        'calgaryTableFile': path_join(grammar_dir, 'ucalgary_parse_table.html'),
+        'calgaryFirstAndFollow': path_join(grammar_dir, 'ucalgary_first_follow.html')
+    })
+    calgary.fill_errors()
+    equal = all([
+        compare_tables(generated, calgary),
+        compare_sets('first', generated.first_sets, calgary.first_sets),
+        compare_sets('follow', generated.follow_sets, calgary.follow_sets)
+    ])
+    if not equal:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--grammar_file', '-gf', help='Grammar to generate the parse table from', default=None)
+    ap.add_argument('--no_compare', '-nc', action='store_true', help='Do not compare with the ucalgary tables')
+    ap.add_argument('--parser_file', '-pf', help='Write the generated recursive descent parser to', default=None)
+    args = ap.parse_args()
+    main(args.grammar_file, not args.no_compare, args.parser_file)
@@ -1,18 +1,18 @@
-from typing import List, Any
+from collections import deque
+from typing import Deque, Any
 
 
 class Queue:
 
     def __init__(self):
-        self.items: List[Any] = []
+        # removing from the front of a deque does not shift the rest of the items
+        self.items: Deque[Any] = deque()
 
     def add(self, *args):
         self.items.extend(args)
 
     def remove(self) -> Any:
-        to_return = self.items[0]
-        self.items = self.items[1:]
-        return to_return
+        return self.items.popleft()
 
     def peek_last(self) -> Any:
         return self.items[-1]
@@ -9,26 +9,24 @@ class StackEmptyException(Exception):
 
 class Stack:
 
+    reverse_lookup: Dict = {
+        Id: 'Id',
+        Integer: 'Integer',
+        Float: 'Float',
+        String: 'String'
+    }
+
     def __init__(self):
+        # the top of the stack is the end of the list, so pushing and popping never copies it
         self.items: list = []
 
-        self.reverse_lookup: Dict = {
-            Id: 'Id',
-            Integer: 'Integer',
-            Float: 'Float',
-            String: 'String'
-        }
-
     def push(self, item: Any):
         self.items.append(item)
 
     def pop(self) -> Any:
         if len(self.items) == 0:
             raise StackEmptyException()
-
-        popped_item = self.items[-1]
-        self.items = self.items[:-1]
-        return popped_item
+        return self.items.pop()
 
     def __len__(self):
         return len(self.items)